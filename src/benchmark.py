@@ -0,0 +1,219 @@
+import argparse
+import asyncio
+import multiprocessing
+import os
+import time
+import tracemalloc
+
+import aiohttp
+
+from config.parser.parser import SETTINGS
+from config.parser.stand import BENCHMARK
+from config.parser.stand import STAND
+from config.paths import FILE_RAW_PATH
+from parser.managers.watermark import WatermarkManager
+from parser.parser import Parser
+from parser.stand import serve
+
+
+async def wait(url: str, timeout: float = 30) -> None:
+    """
+    Дожидается запуска локального сервера;
+
+    :param url: адрес сервера;
+    :param timeout: максимальное время ожидания (сек.);
+    :return: None.
+    """
+
+    deadline = time.perf_counter() + timeout
+
+    async with aiohttp.ClientSession() as session:
+        while True:
+            try:
+                async with session.get(url) as response:
+                    if response.status == 200:
+                        return
+            except aiohttp.ClientError:
+                if time.perf_counter() > deadline:
+                    raise
+
+            await asyncio.sleep(0.1)
+
+
+async def benchmark(url: str, settings: dict, memory: bool) -> dict:
+    """
+    Собирает данные с локального сервера и измеряет производительность
+    сбора данных;
+
+    :param url: адрес локального сервера;
+    :param settings: параметры сбора данных;
+    :param memory: флаг измерения пикового объема памяти (tracemalloc
+        замедляет сбор данных);
+    :return: результаты измерения.
+    """
+
+    await wait(url)
+
+    parser = Parser()
+    parser.network.url = url
+
+    await parser.connect()
+    await parser.setting(**settings)
+
+    if memory:
+        tracemalloc.start()
+
+    start = time.perf_counter()
+
+    parser.progress.starting()
+    await parser.run()
+
+    elapsed = time.perf_counter() - start
+
+    peak = tracemalloc.get_traced_memory()[1] if memory else None
+    tracemalloc.stop()
+
+    async with parser.network.session.get(f'{url}/stats') as response:
+        statuses = await response.json()
+
+    await parser.disconnect()
+
+    return {
+        'seconds': elapsed,
+        'pages': parser.progress.finished[0],
+        'rows': parser.file.records,
+        'requests': sum(statuses.values()),
+        'statuses': statuses,
+        'dead': len(parser.retry.dead),
+        'traffic': parser.network.traffic,
+        'peak': peak,
+    }
+
+
+def report(results: dict) -> str:
+    """
+    Формирует отчет об измерении производительности;
+
+    :param results: результаты измерения;
+    :return: отчет.
+    """
+
+    seconds = results['seconds']
+    network = results['traffic']['network'] / 2 ** 10
+    decoded = results['traffic']['decoded'] / 2 ** 10
+    statuses = ', '.join(f'{code}: {count}'
+                         for code, count in results['statuses'].items())
+    peak = (f'{results["peak"] / 2 ** 20:.2f} MB'
+            if results['peak'] is not None
+            else 'не измерялся')
+
+    return (
+        f'Время сбора данных: {seconds:.2f} сек.\n'
+        f'Страниц: {results["pages"]} '
+        f'({results["pages"] / seconds:.2f} стр./сек.)\n'
+        f'Записей: {results["rows"]} '
+        f'({results["rows"] / seconds:.2f} зап./сек.)\n'
+        f'Запросов: {results["requests"]} ({statuses})\n'
+        f'Недоставленные страницы: {results["dead"]}\n'
+        f'Входящий трафик: {network:.2f} KB '
+        f'(после распаковки {decoded:.2f} KB)\n'
+        f'Пиковый объем памяти: {peak}'
+    )
+
+
+def main() -> None:
+    """
+    Точка входа измерения производительности сбора данных. Запускает
+    локальный сервер, имитирующий страницы VGChartz, в отдельном процессе
+    и собирает с него данные с помощью Parser;
+
+    :return: None.
+    """
+
+    parser = argparse.ArgumentParser(
+        description='Измерение производительности сбора данных'
+    )
+    parser.add_argument('--catalogue', type=int, default=STAND['catalogue'],
+                        help='количество записей в каталоге')
+    parser.add_argument('--latency', nargs='+', default=STAND['latency'],
+                        help='распределение задержки ответа и его параметры, '
+                             'например: lognormal -2.5 0.5')
+    parser.add_argument('--errors', nargs='*', default=[],
+                        help='доли ответов с ошибками, например: 429=0.01')
+    parser.add_argument('--recorded', default=STAND['recorded'],
+                        help='каталог с сохраненными страницами')
+    parser.add_argument('--seed', type=int, default=STAND['seed'],
+                        help='начальное значение генератора случайных чисел')
+    parser.add_argument('--port', type=int, default=STAND['port'],
+                        help='порт локального сервера')
+    parser.add_argument('--workers', type=int, default=SETTINGS['workers'],
+                        help='количество одновременно обрабатываемых страниц')
+    parser.add_argument('--backend', default=SETTINGS['backend'],
+                        help='движок парсинга (bs4, lxml)')
+    parser.add_argument('--pool', action='store_true',
+                        help='парсинг в пуле процессов')
+    parser.add_argument('--results', type=int, default=SETTINGS['results'],
+                        help='количество записей на странице')
+    parser.add_argument('--file', default=BENCHMARK['file'],
+                        help='имя файла с данными (csv, parquet)')
+    parser.add_argument('--memory', action=argparse.BooleanOptionalAction,
+                        default=True,
+                        help='измерение пикового объема памяти')
+    parser.add_argument('--keep', action='store_true',
+                        help='сохранить файл с собранными данными')
+    args = parser.parse_args()
+
+    latency = [args.latency[0], *map(float, args.latency[1:])]
+    errors = STAND['errors'] | {
+        int(code): float(rate)
+        for code, rate in (error.split('=') for error in args.errors)
+    }
+
+    server = multiprocessing.Process(
+        target=serve,
+        kwargs={
+            'host': STAND['host'],
+            'port': args.port,
+            'catalogue': args.catalogue,
+            'latency': latency,
+            'errors': errors,
+            'recorded': args.recorded,
+            'seed': args.seed,
+        },
+        daemon=True
+    )
+    server.start()
+
+    settings = {}
+    settings |= SETTINGS
+    settings |= BENCHMARK
+    settings |= {'file': args.file}
+    settings |= {'workers': args.workers}
+    settings |= {'backend': args.backend}
+    settings |= {'pool': args.pool}
+    settings |= {'results': args.results}
+
+    try:
+        url = f'http://{STAND["host"]}:{args.port}'
+        results = asyncio.run(benchmark(url, settings, args.memory))
+    finally:
+        server.terminate()
+        server.join()
+
+    paths = [WatermarkManager.path(args.file)]
+
+    if not args.keep:
+        paths.append(fr'{FILE_RAW_PATH}\{args.file}')
+
+    for path in paths:
+        try:
+            os.remove(path)
+        except FileNotFoundError:
+            pass
+
+    print(flush=True)
+    print(report(results), flush=True)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,75 @@
+from parser.stand import StandServer
+from parser.stand import document
+
+
+CELLS = ['1', '<img src="/games/boxart/1.jpg">',
+         '<a href="https://www.vgchartz.com/game/1/game-1/">Game</a>',
+         '<img alt="PS2">', 'Publisher', 'Developer', 'N/A', '7.5', '8.0',
+         'N/A', '1.00m', '0.50m', '0.30m', '0.10m', '0.10m',
+         '18th Nov 11', '1st Jan 24']
+
+
+def row(**cells) -> str:
+    """
+    Формирует строку таблицы, заменяя значения указанных ячеек
+    корректной строки;
+
+    :param cells: номера ячеек (c0, c1, ...) и их значения;
+    :return: строка таблицы.
+    """
+
+    values = [cells.get(f'c{index}', value)
+              for index, value in enumerate(CELLS)]
+
+    return ''.join(['<tr>', *(f'<td>{value}</td>' for value in values),
+                    '</tr>'])
+
+
+# Некорректные строки таблицы. Каждая строка приводит к ошибке
+# преобразования хотя бы одного поля: отсутствие значения (None)
+# или ошибка преобразования значения, в том числе несуществующей
+# или неполной даты (ValueError). Строка без ячейки обложки сдвигает
+# остальные ячейки: в ячейке платформы нет изображения, на чем парсер
+# до появления движков парсинга завершался с ошибкой (TypeError).
+MALFORMED = [
+    # Ячейка названия без ссылки.
+    row(c2='Game'),
+    # Ячейка платформы без изображения.
+    row(c3='PS2'),
+    # Оценки и количество копий, не являющиеся числами.
+    row(c7='abc', c8='-', c10='n/am', c11='m'),
+    # Несуществующая дата и дата без года.
+    row(c15='31st Feb 99', c16='Nov 04'),
+    # Строка без ячейки обложки.
+    ''.join(['<tr>', *(f'<td>{value}</td>' for index, value
+                       in enumerate(CELLS) if index != 1), '</tr>']),
+    # Строка с частью ячеек.
+    ''.join(['<tr>', *(f'<td>{value}</td>' for value in CELLS[:5]), '</tr>']),
+    # Пустая строка.
+    '<tr></tr>',
+]
+
+
+def table(rows: int, share: float = 0.1) -> str:
+    """
+    Формирует страницу games.php с заданным количеством строк, часть
+    которых некорректна. Некорректные строки равномерно распределены
+    по таблице;
+
+    :param rows: количество строк таблицы;
+    :param share: доля некорректных строк;
+    :return: текст страницы.
+    """
+
+    server = StandServer(catalogue=rows, latency=('fixed', 0), errors={})
+    step = round(1 / share) if share else 0
+
+    data, malformed = [], 0
+    for index in range(rows):
+        if step and index % step == step - 1:
+            data.append(MALFORMED[malformed % len(MALFORMED)])
+            malformed += 1
+        else:
+            data.append(server.row(index + 1, index))
+
+    return document(rows, data)
@@ -0,0 +1,8 @@
+# Заголовок записи архива страниц (struct): номер страницы (uint32),
+# время получения страницы (unix time, float64) и размер сжатого тела
+# страницы (uint32). За заголовком следует тело страницы, сжатое zlib.
+FRAME_HEADER = '<IdI'
+
+# Количество сжатых страниц, передаваемых процессу-обработчику за один раз
+# при повторном парсинге архива.
+REPARSE_CHUNK = 16
@@ -12,5 +12,47 @@ FIELD_NAMES = [
     'other',
     'vgc',
     'critic',
-    'user'
+    'user',
+    'update',
+    'url'
 ]
+
+# Типы полей в колоночных форматах, в том числе атрибутов видеоигр
+# (DETAIL_FIELDS), добавляемых к записям при выгрузке хранилища записей:
+# - string - строка;
+# - category - строка, кодируемая словарем (повторяющиеся значения);
+# - float - число с плавающей точкой;
+# - date - дата.
+FIELD_TYPES = {
+    'name': 'string',
+    'date': 'date',
+    'platform': 'category',
+    'publisher': 'category',
+    'developer': 'category',
+    'shipped': 'float',
+    'total': 'float',
+    'america': 'float',
+    'europe': 'float',
+    'japan': 'float',
+    'other': 'float',
+    'vgc': 'float',
+    'critic': 'float',
+    'user': 'float',
+    'update': 'date',
+    'url': 'string',
+    'genre': 'category'
+}
+
+# Поля, однозначно определяющие видеоигру в хранилище записей (sqlite):
+# повторно собранная видеоигра обновляет ранее сохраненную запись.
+RECORD_KEY = ('name', 'platform', 'date')
+
+# Минимальное количество записей в части parquet-файла: до истечения
+# времени между контрольными точками контрольная точка сохраняется, только
+# когда накоплено столько записей, поэтому каждая часть содержит данные
+# нескольких страниц.
+PART_ROWS = 5000
+
+# Количество записей, читаемых из хранилища записей за один запрос
+# при выгрузке в csv или parquet.
+EXPORT_BATCH = 10000
@@ -0,0 +1,32 @@
+# Префикс имен метрик.
+PREFIX = 'vgchartz'
+
+# Метрики сбора данных: тип (counter - счетчик, gauge - текущее значение,
+# histogram - гистограмма) и описание.
+METRICS = {
+    'requests': ('counter', 'Отправленные запросы по коду статуса'),
+    'request_seconds': ('histogram', 'Время выполнения запроса (сек.)'),
+    'delay_seconds': ('histogram', 'Время ожидания перед запросом (сек.)'),
+    'cache': ('counter', 'Обращения к кэшу ответов'),
+    'received_bytes': ('counter', 'Входящий трафик (байт)'),
+    'parse_seconds': ('histogram', 'Время парсинга страницы (сек.)'),
+    'parsed_rows': ('counter', 'Спарсенные строки таблицы'),
+    'write_seconds': ('histogram', 'Время записи пакета данных (сек.)'),
+    'written_rows': ('counter', 'Записанные строки'),
+    'written_bytes': ('counter', 'Записанные данные (байт)'),
+    'archived_bytes': ('counter', 'Сжатые страницы в архиве (байт)'),
+    'pages_queue': ('gauge', 'Страницы, ожидающие обработки'),
+    'write_queue': ('gauge', 'Пакеты данных, ожидающие записи'),
+    'request_rate': ('gauge', 'Текущая частота запросов (запр./сек.)'),
+    'pages_finished': ('gauge', 'Завершенные страницы'),
+    'pages_total': ('gauge', 'Страницы, данные которых собираются'),
+    'pages_dead': ('gauge', 'Страницы, которые не удалось получить'),
+    'pages_absent': ('gauge', 'Страницы, отсутствующие на сервере'),
+    'details_queue': ('gauge', 'Страницы видеоигр, ожидающие обработки'),
+    'details_fetched': ('counter', 'Полученные страницы видеоигр по коду '
+                                   'статуса'),
+}
+
+# Верхние границы интервалов гистограмм (сек.).
+BUCKETS = (0.001, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1, 2.5, 5, 10,
+           30, 60)
@@ -7,3 +7,22 @@ HEADERS = {
 URL = r'https://www.vgchartz.com'
 
 
+
+# Параметры пула соединений: общее количество соединений, количество
+# соединений с одним хостом, время удержания неактивного соединения (сек.)
+# и время хранения результатов DNS-запросов (сек.).
+CONNECTOR = {
+    'limit': 100,
+    'limit_per_host': 10,
+    'keepalive_timeout': 60,
+    'ttl_dns_cache': 600,
+}
+
+# Ограничения кэша ответов, применяемые при его открытии: ответы,
+# сохраненные более age секунд назад, удаляются, а если суммарный размер
+# сохраненных тел ответов превышает size байт, удаляются самые давние
+# ответы.
+CACHE = {
+    'age': 30 * 24 * 60 * 60,
+    'size': 256 * 2 ** 20,
+}
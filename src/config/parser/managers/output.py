@@ -0,0 +1,4 @@
+# Максимальное время между обновлениями текущего состояния (сек.), если
+# за это время не произошло ни одного события (например, запросы
+# приостановлены заголовком Retry-After).
+HEARTBEAT = 10
@@ -12,5 +12,47 @@ PARSING_FIELDS = [
     'other',
     'vgc',
     'critic',
-    'user'
+    'user',
+    'update',
+    'url'
 ]
+
+# Расположение полей в строке таблицы:
+# - index: номер ячейки в строке;
+# - source: источник значения в ячейке (text - текст ячейки,
+#   link - текст ссылки, href - адрес ссылки, image - альтернативный
+#   текст изображения);
+# - type: тип преобразования значения.
+COLUMNS = {
+    'name': {'index': 2, 'source': 'link', 'type': 'string'},
+    'date': {'index': 15, 'source': 'text', 'type': 'date'},
+    'platform': {'index': 3, 'source': 'image', 'type': 'raw'},
+    'publisher': {'index': 4, 'source': 'text', 'type': 'string'},
+    'developer': {'index': 5, 'source': 'text', 'type': 'string'},
+    'shipped': {'index': 9, 'source': 'text', 'type': 'sales'},
+    'total': {'index': 10, 'source': 'text', 'type': 'sales'},
+    'america': {'index': 11, 'source': 'text', 'type': 'sales'},
+    'europe': {'index': 12, 'source': 'text', 'type': 'sales'},
+    'japan': {'index': 13, 'source': 'text', 'type': 'sales'},
+    'other': {'index': 14, 'source': 'text', 'type': 'sales'},
+    'vgc': {'index': 6, 'source': 'text', 'type': 'score'},
+    'critic': {'index': 7, 'source': 'text', 'type': 'score'},
+    'user': {'index': 8, 'source': 'text', 'type': 'score'},
+    'update': {'index': 16, 'source': 'text', 'type': 'date'},
+    'url': {'index': 2, 'source': 'href', 'type': 'raw'},
+}
+
+# Количество различных значений дат, преобразования которых хранятся
+# в кэше. Каталог содержит несколько тысяч различных дат.
+DATE_CACHE = 8192
+
+# На сколько лет вперед от текущего года могут быть указаны даты выхода
+# анонсированных игр. Двузначный год, не превышающий текущий год с этим
+# запасом, относится к XXI веку, остальные - к XX веку.
+DATE_HORIZON = 5
+
+# Атрибуты видеоигры, извлекаемые с ее страницы, и заголовки, за которыми
+# следуют их значения.
+DETAIL_FIELDS = {
+    'genre': 'Genre',
+}
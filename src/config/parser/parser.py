@@ -1,11 +1,87 @@
 VALID_ATTEMPTS = 5
 
+# Периодичность сохранения контрольной точки: после завершения заданного
+# количества страниц (pages) или по истечении заданного времени (seconds)
+# с предыдущего сохранения. Страницы, завершенные после контрольной точки,
+# при возобновлении сбора данных обрабатываются повторно.
+CHECKPOINT = {
+        'pages': 10,
+        'seconds': 30,
+}
+
+# Коды статусов, запросы с которыми не повторяются: страница отсутствует.
+PERMANENT_CODES = (404, 410)
+
+# Параметры сбора данных по умолчанию. Частота запросов (rates) задается
+# минимальной и максимальной частотой (запр./сек.): сбор данных начинается
+# с максимальной частоты, которая снижается после кодов 429 и 5xx
+# и восстанавливается после успешных запросов. Максимальная частота
+# 0.2 запр./сек. не ниже средней частоты исходной версии программы
+# (10 задач с задержкой от 10 до 100 сек., около 0.18 запр./сек.).
 SETTINGS = {
-        'span': (10, 100),
+        'rates': (0.02, 0.2),
         'factor': 5,
         'threshold': 35,
+        'burst': 2,
+        'cache': True,
+        'ttl': 0,
         'mode': 'w',
         'timeout': 1,
+        'workers': 10,
+        'backend': 'lxml',
+        'pool': False,
+        'crawl': 'full',
+        'attempts': 5,
+        'backoff': 1,
+        'ceiling': 60,
+        'results': 50,
+        'probe': False,
+        'metrics': {'interval': 10, 'port': None},
+        'headless': False,
+        'details': {'enabled': False, 'workers': 2, 'queue': 100,
+                    'rates': (0.005, 0.05)},
+        'archive': {'enabled': True, 'level': 6},
+}
+
+# Параметры сбора данных по расписанию: задержка между началом
+# последовательных циклов обновления данных (сек.) и количество циклов
+# (0 - без ограничения).
+DAEMON = {
+        'interval': 6 * 60 * 60,
+        'cycles': 0,
+}
+
+# Коды завершения неинтерактивного сбора данных: данные собраны, нет
+# соединения с сервером, неверные параметры командной строки или файла
+# конфигурации (код argparse), некоторые страницы не удалось получить
+# (контрольная точка сохранена), сбор данных прерван.
+EXIT_CODES = {
+        'success': 0,
+        'connection': 1,
+        'usage': 2,
+        'partial': 3,
+        'interrupted': 130,
+}
+
+# Количество записей на странице, проверяемое по возрастанию при подборе
+# наибольшего размера страницы, который принимает сервер.
+PROBE_RESULTS = (100, 200, 500, 1000)
+
+# Параметры распределенного сбора данных: количество страниц в шарде
+# и время аренды шарда сборщиком (сек.).
+SHARDING = {
+        'size': 100,
+        'lease': 300,
+}
+
+# Параметры сбора данных по игровым платформам (разделам): количество
+# одновременно собираемых разделов и платформы, новые данные о которых
+# не появляются (такие разделы можно пропускать при обновлении данных).
+PARTITIONING = {
+        'concurrency': 4,
+        'retired': ('PS', 'PS2', 'PS3', 'PSP', 'PSV', 'GB', 'GBA', 'GBC',
+                    'GC', 'DS', '3DS', 'Wii', 'WiiU', 'XB', 'X360', 'N64',
+                    'NES', 'SNES', 'GEN', 'SAT', 'DC'),
 }
 
 PARAMS = {
@@ -37,3 +113,9 @@ PARAMS = {
         'showothersales': 1,
         'showshipped': 1
 }
+
+# Параметры запроса в режиме инкрементального сбора данных: данные
+# упорядочиваются по дате последнего обновления, начиная с последних.
+INCREMENTAL_PARAMS = {
+        'order': 'LastUpdate',
+}
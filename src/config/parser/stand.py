@@ -0,0 +1,38 @@
+# Параметры локального сервера, имитирующего страницы VGChartz:
+# - catalogue: количество записей в каталоге;
+# - latency: распределение задержки ответа (сек.) и его параметры
+#   (fixed, uniform, lognormal, exponential);
+# - errors: доли ответов с кодами статусов ошибок;
+# - recorded: каталог с сохраненными страницами (<номер страницы>.html),
+#   которые выдаются вместо синтетических;
+# - seed: начальное значение генератора случайных чисел.
+STAND = {
+        'host': '127.0.0.1',
+        'port': 8765,
+        'catalogue': 60000,
+        'latency': ('lognormal', -2.5, 0.5),
+        'errors': {429: 0.0, 503: 0.0},
+        'recorded': None,
+        'seed': 0,
+}
+
+# Параметры сбора данных при измерении производительности: частота запросов
+# не ограничена, кэш ответов не используется.
+BENCHMARK = {
+        'rates': (1, None),
+        'cache': False,
+        'file': 'benchmark.csv',
+        'checkpoint': 'benchmark.json',
+        'metrics': {'interval': 0, 'port': None},
+        'headless': True,
+        'archive': {'enabled': False, 'level': 6},
+}
+
+# Параметры измерения производительности парсинга: размеры таблиц
+# (количество строк), доля некорректных строк и количество повторов
+# каждого измерения.
+MICROBENCHMARK = {
+        'fixtures': {'page': 50, 'large': 1000, 'huge': 5000},
+        'share': 0.12,
+        'repeat': 20,
+}
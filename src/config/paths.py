@@ -3,10 +3,19 @@ PROJECT_PATH = r'C:\Projects\VGChartz'
 DATA_PATH = PROJECT_PATH + r'\data'
 FILE_RAW_PATH = DATA_PATH + r'\raw'
 CHECKPOINT_PATH = DATA_PATH + r'\raw\checkpoints'
+CACHE_PATH = DATA_PATH + r'\raw\cache'
+WATERMARK_PATH = DATA_PATH + r'\raw\watermarks'
+SHARD_PATH = DATA_PATH + r'\raw\shards'
+PARTITION_PATH = DATA_PATH + r'\raw\partitions'
+RUN_PATH = DATA_PATH + r'\raw\runs'
+METRICS_PATH = DATA_PATH + r'\raw\metrics'
+DETAIL_PATH = DATA_PATH + r'\raw\details'
+ARCHIVE_PATH = DATA_PATH + r'\raw\archive'
 FILE_PREPROCESSED_PATH = DATA_PATH + r'\processed'
 
 REPORTS_PATH = PROJECT_PATH + r'\reports'
 TRAIN_MODELS_REPORT_PATH = REPORTS_PATH + r'\training'
+PARSING_REPORT_PATH = REPORTS_PATH + r'\parsing'
 
 TRAINED_MODELS_PATH = PROJECT_PATH + r'\models'
 
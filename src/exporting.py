@@ -0,0 +1,57 @@
+import argparse
+
+from parser.managers.detail import DetailManager
+from parser.managers.file import FileManager
+
+
+def main() -> None:
+    """
+    Точка входа выгрузки хранилища записей (sqlite) в csv или parquet
+    файл. Расширения имен файлов проверяются до выгрузки. Записи читаются
+    пакетами в порядке уникального индекса, поэтому размер файла и время
+    предварительной обработки пропорциональны размеру каталога, а не
+    количеству запусков сбора данных. С флагом --details записи
+    дополняются атрибутами видеоигр, полученными с их страниц;
+
+    :return: None.
+    """
+
+    parser = argparse.ArgumentParser(
+        description='Выгрузка хранилища записей'
+    )
+    parser.add_argument('store', help='имя хранилища записей (sqlite)')
+    parser.add_argument('file', help='имя файла с данными (csv, parquet)')
+    parser.add_argument('--details', action='store_true',
+                        help='добавить атрибуты видеоигр')
+    args = parser.parse_args()
+
+    if args.store.rsplit('.', 1)[-1] != 'sqlite':
+        parser.error('хранилище записей должно быть файлом sqlite: '
+                     + args.store)
+
+    if args.file.rsplit('.', 1)[-1] not in ('csv', 'parquet'):
+        parser.error('файл с данными должен быть файлом csv или parquet: '
+                     + args.file)
+
+    if not FileManager.exists(args.store):
+        parser.error(f'хранилище записей не найдено: {args.store}')
+
+    details = None
+
+    if args.details:
+        detail = DetailManager()
+        detail.open()
+        details = detail.attributes()
+        detail.close()
+
+    file = FileManager()
+    file.setting(args.store, 'a', None)
+
+    records = file.export(args.file, details)
+    file.sink.close()
+
+    print(f'Файл {args.file}: {records} записей.', flush=True)
+
+
+if __name__ == '__main__':
+    main()
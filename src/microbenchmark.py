@@ -0,0 +1,256 @@
+import argparse
+import datetime
+import functools
+import json
+import platform
+import time
+
+from benchmarks.fixtures import table
+from config.parser.managers.parsing import PARSING_FIELDS
+from config.parser.stand import MICROBENCHMARK
+from config.paths import PARSING_REPORT_PATH
+from parser.backends.backend import Backend
+from parser.converters import date
+from parser.managers.parsing import BACKENDS
+from parser.managers.parsing import SOURCES
+from parser.managers.parsing import TYPES
+from parser.managers.parsing import backend
+from parser.managers.parsing import extract
+
+
+ERRORS = (AttributeError, ValueError, IndexError, TypeError)
+
+
+def best(function, repeat: int) -> float:
+    """
+    Измеряет время выполнения функции: лучшее из нескольких повторов.
+    Перед каждым повтором очищается кэш преобразования дат, иначе
+    после первого повтора измерялись бы только попадания в кэш;
+
+    :param function: измеряемая функция;
+    :param repeat: количество повторов;
+    :return: время выполнения (сек.).
+    """
+
+    times = []
+
+    for _ in range(repeat):
+        date.cache_clear()
+
+        start = time.perf_counter()
+        function()
+        times.append(time.perf_counter() - start)
+
+    return min(times)
+
+
+def divide(instance: Backend, rows: list) -> list[list]:
+    """
+    Разбивает строки таблицы на ячейки;
+
+    :param instance: движок парсинга;
+    :param rows: строки таблицы;
+    :return: ячейки строк таблицы.
+    """
+
+    return [instance.cells(row) for row in rows]
+
+
+def field(cells: list[list],
+          instance: Backend,
+          index: int,
+          source: str,
+          converter) -> dict:
+    """
+    Извлекает и преобразует значения одного поля во всех строках таблицы
+    так же, как функция extract, и подсчитывает неуспешные значения
+    по типу ошибки;
+
+    :param cells: ячейки строк таблицы;
+    :param instance: движок парсинга;
+    :param index: номер ячейки поля;
+    :param source: источник значения;
+    :param converter: функция преобразования значения;
+    :return: количество неуспешных значений по типу ошибки.
+    """
+
+    errors = {}
+
+    for row in cells:
+        try:
+            value = (instance.value(row[index], source)
+                     if index < len(row)
+                     else None)
+
+            if value is None:
+                errors['None'] = errors.get('None', 0) + 1
+                continue
+
+            converter(value)
+        except ERRORS as error:
+            name = type(error).__name__
+            errors[name] = errors.get(name, 0) + 1
+
+    return errors
+
+
+def measure(text: str, engine: str, repeat: int) -> dict:
+    """
+    Измеряет производительность парсинга таблицы движком: полное время
+    функции extract, время построения дерева и разбиения строк на ячейки
+    и стоимость извлечения каждого поля;
+
+    :param text: текст страницы;
+    :param engine: название движка парсинга;
+    :param repeat: количество повторов каждого измерения;
+    :return: результаты измерения.
+    """
+
+    instance = backend(engine)
+
+    rows = instance.rows(text)
+    cells = divide(instance, rows)
+    count = len(rows)
+
+    total = best(functools.partial(extract, text, engine), repeat)
+    tree = best(functools.partial(instance.rows, text), repeat)
+    split = best(functools.partial(divide, instance, rows), repeat)
+
+    fields, errors = {}, {}
+    for name, (index, source), converter in zip(PARSING_FIELDS,
+                                                SOURCES,
+                                                TYPES,
+                                                strict=True):
+        function = functools.partial(field, cells, instance,
+                                     index, source, converter)
+        fields[name] = best(function, repeat) / count * 10 ** 9
+        errors[name] = function()
+
+    return {
+        'rows': count,
+        'rows_per_sec': count / total,
+        'us_per_row': total / count * 10 ** 6,
+        'phases': {
+            'rows': tree / count * 10 ** 6,
+            'cells': split / count * 10 ** 6,
+        },
+        'fields': fields,
+        'errors': errors,
+    }
+
+
+def compare(current: dict, previous: dict) -> str:
+    """
+    Сравнивает результаты измерения с результатами предыдущего запуска;
+
+    :param current: результаты текущего запуска;
+    :param previous: результаты предыдущего запуска;
+    :return: отчет о сравнении.
+    """
+
+    lines = []
+
+    for engine, fixtures in current['results'].items():
+        for fixture, results in fixtures.items():
+            before = previous['results'].get(engine, {}).get(fixture)
+
+            if before is None:
+                continue
+
+            change = results['rows_per_sec'] / before['rows_per_sec'] - 1
+            lines.append(f'{engine:6} {fixture:6} '
+                         f'{results["rows_per_sec"]:12.0f} зап./сек. '
+                         f'({change:+.1%})')
+
+            for name, cost in results['fields'].items():
+                if (old := before['fields'].get(name)) and cost > old * 1.1:
+                    lines.append(f'{"":14}{name:10} {cost:10.0f} нс/зап. '
+                                 f'({cost / old - 1:+.1%})')
+
+    return '\n'.join(lines)
+
+
+def report(current: dict) -> str:
+    """
+    Формирует отчет об измерении производительности парсинга;
+
+    :param current: результаты измерения;
+    :return: отчет.
+    """
+
+    lines = []
+
+    for engine, fixtures in current['results'].items():
+        for fixture, results in fixtures.items():
+            lines.append(f'{engine} - {fixture} ({results["rows"]} строк): '
+                         f'{results["rows_per_sec"]:.0f} зап./сек., '
+                         f'{results["us_per_row"]:.2f} мкс/зап. '
+                         f'(дерево {results["phases"]["rows"]:.2f}, '
+                         f'ячейки {results["phases"]["cells"]:.2f})')
+
+            for name, cost in results['fields'].items():
+                errors = ', '.join(f'{error}: {count}' for error, count
+                                   in results['errors'][name].items())
+                lines.append(f'{"":4}{name:10} {cost:8.0f} нс/зап. '
+                             f'{errors}')
+
+    return '\n'.join(lines)
+
+
+def main() -> None:
+    """
+    Точка входа измерения производительности парсинга. Формирует таблицы
+    разного размера с некорректными строками, измеряет производительность
+    каждого движка парсинга и сохраняет результаты в формате json;
+
+    :return: None.
+    """
+
+    parser = argparse.ArgumentParser(
+        description='Измерение производительности парсинга'
+    )
+    parser.add_argument('--backends', nargs='+', default=[*BACKENDS],
+                        help='движки парсинга')
+    parser.add_argument('--repeat', type=int,
+                        default=MICROBENCHMARK['repeat'],
+                        help='количество повторов каждого измерения')
+    parser.add_argument('--share', type=float,
+                        default=MICROBENCHMARK['share'],
+                        help='доля некорректных строк')
+    parser.add_argument('--compare',
+                        help='имя файла с результатами предыдущего запуска')
+    args = parser.parse_args()
+
+    fixtures = {name: table(rows, args.share)
+                for name, rows in MICROBENCHMARK['fixtures'].items()}
+
+    current = {
+        'time': datetime.datetime.now().isoformat(timespec='seconds'),
+        'python': platform.python_version(),
+        'share': args.share,
+        'repeat': args.repeat,
+        'results': {
+            engine: {name: measure(text, engine, args.repeat)
+                     for name, text in fixtures.items()}
+            for engine in args.backends
+        },
+    }
+
+    print(report(current), flush=True)
+
+    name = f'{datetime.datetime.now():%Y-%m-%d-%H-%M-%S}.json'
+    with open(fr'{PARSING_REPORT_PATH}\{name}', 'w') as file:
+        file.write(json.dumps(current, indent=4))
+
+    print(f'\nРезультаты сохранены: {name}.', flush=True)
+
+    if args.compare:
+        with open(fr'{PARSING_REPORT_PATH}\{args.compare}') as file:
+            previous = json.loads(file.read())
+
+        print(f'\nСравнение с {args.compare}:', flush=True)
+        print(compare(current, previous), flush=True)
+
+
+if __name__ == '__main__':
+    main()
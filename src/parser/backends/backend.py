@@ -0,0 +1,99 @@
+class Backend(object):
+    """
+    Базовый класс движка парсинга, задачами которого являются:
+
+    - построение дерева html-документа;
+    - разбиение строк таблицы на ячейки;
+    - извлечение значений из ячеек;
+    - поиск игровых платформ, по которым фильтруется каталог;
+    - извлечение атрибутов видеоигры с ее страницы;
+
+    Наследники реализуют методы rows, cells, value, total, platforms
+    и details.
+    """
+
+    def extract(self, text: str, columns: list[tuple]) -> list[list]:
+        """
+        Извлекает значения полей из строк таблицы. Каждая строка разбивается
+        на ячейки один раз, после чего значения всех полей извлекаются
+        из полученного списка ячеек;
+
+        :param text: данные для парсинга;
+        :param columns: расположение полей в строке таблицы
+            (номер ячейки, источник значения);
+        :return: значения полей в каждой строке таблицы.
+        """
+
+        data = []
+
+        for row in self.rows(text):
+            cells = self.cells(row)
+            count = len(cells)
+
+            data.append([
+                self.value(cells[index], source) if index < count else None
+                for index, source in columns
+            ])
+
+        return data
+
+    def rows(self, text: str) -> list:
+        """
+        Находит строки таблицы с данными;
+
+        :param text: данные для парсинга;
+        :return: строки таблицы.
+        """
+
+        raise NotImplementedError
+
+    def cells(self, row) -> list:
+        """
+        Разбивает строку таблицы на ячейки;
+
+        :param row: строка таблицы;
+        :return: ячейки строки.
+        """
+
+        raise NotImplementedError
+
+    def value(self, cell, source: str) -> str | None:
+        """
+        Извлекает значение из ячейки;
+
+        :param cell: ячейка строки;
+        :param source: источник значения (text, link, href, image);
+        :return: значение или None, если значение отсутствует.
+        """
+
+        raise NotImplementedError
+
+    def total(self, text: str) -> str:
+        """
+        Находит заголовок с общим количеством записей;
+
+        :param text: данные для парсинга;
+        :return: текст заголовка.
+        """
+
+        raise NotImplementedError
+
+    def platforms(self, text: str) -> list[str]:
+        """
+        Находит игровые платформы в фильтре каталога (console);
+
+        :param text: данные для парсинга;
+        :return: значения фильтра игровых платформ.
+        """
+
+        raise NotImplementedError
+
+    def details(self, text: str) -> dict:
+        """
+        Находит атрибуты видеоигры на ее странице;
+
+        :param text: данные для парсинга;
+        :return: атрибуты видеоигры.
+        """
+
+        raise NotImplementedError
@@ -0,0 +1,116 @@
+from bs4 import BeautifulSoup
+
+from config.parser.managers.parsing import DETAIL_FIELDS
+from parser.backends.backend import Backend
+
+
+class SoupBackend(Backend):
+    """
+    Движок парсинга на основе BeautifulSoup (html.parser). Является
+    эталонным движком, с результатами которого сверяются остальные.
+    """
+
+    def rows(self, text: str) -> list:
+        """
+        Находит строки таблицы с данными;
+
+        :param text: данные для парсинга;
+        :return: строки таблицы.
+        """
+
+        soup = BeautifulSoup(text, 'html.parser')
+
+        return (soup
+                .find('div', id='generalBody')
+                .find('table')
+                .find_all('tr')[3:])
+
+    def cells(self, row) -> list:
+        """
+        Разбивает строку таблицы на ячейки;
+
+        :param row: строка таблицы;
+        :return: ячейки строки.
+        """
+
+        return row.find_all('td')
+
+    def value(self, cell, source: str) -> str | None:
+        """
+        Извлекает значение из ячейки;
+
+        :param cell: ячейка строки;
+        :param source: источник значения (text, link, href, image);
+        :return: значение или None, если значение отсутствует.
+        """
+
+        if source == 'text':
+            return cell.text
+
+        if source == 'link':
+            link = cell.find('a')
+            return link.text if link else None
+
+        if source == 'href':
+            link = cell.find('a')
+            return link.get('href') if link else None
+
+        if source == 'image':
+            image = cell.find('img')
+            return image.get('alt') if image else None
+
+    def total(self, text: str) -> str:
+        """
+        Находит заголовок с общим количеством записей;
+
+        :param text: данные для парсинга;
+        :return: текст заголовка.
+        """
+
+        soup = BeautifulSoup(text, 'html.parser')
+
+        return (soup
+                .find('div', id='mainContainerSub')
+                .find('div', id='generalBody')
+                .find_all('table')[1]
+                .find_all('th')[0]
+                .text)
+
+    def platforms(self, text: str) -> list[str]:
+        """
+        Находит игровые платформы в фильтре каталога (console);
+
+        :param text: данные для парсинга;
+        :return: значения фильтра игровых платформ.
+        """
+
+        soup = BeautifulSoup(text, 'html.parser')
+        select = soup.find('select', attrs={'name': 'console'})
+        options = select.find_all('option') if select else []
+
+        return [option['value'] for option in options
+                if option.get('value', '').strip()]
+
+    def details(self, text: str) -> dict:
+        """
+        Находит атрибуты видеоигры на ее странице: значением атрибута
+        является текст элемента, следующего за заголовком из DETAIL_FIELDS;
+
+        :param text: данные для парсинга;
+        :return: атрибуты видеоигры.
+        """
+
+        labels = {label: field for field, label in DETAIL_FIELDS.items()}
+        box = BeautifulSoup(text, 'html.parser').find('div',
+                                                      id='gameGenInfoBox')
+
+        details = {}
+
+        for header in box.find_all('h2') if box else []:
+            field = labels.get(header.get_text().strip())
+            sibling = header.find_next_sibling()
+
+            if field and sibling:
+                details[field] = sibling.get_text().strip()
+
+        return details
@@ -0,0 +1,123 @@
+from lxml import html
+
+from config.parser.managers.parsing import DETAIL_FIELDS
+from parser.backends.backend import Backend
+
+
+class XPathBackend(Backend):
+    """
+    Движок парсинга на основе lxml. Строит дерево html-документа средствами
+    libxml2, что значительно быстрее BeautifulSoup.
+
+    :var parser: парсер html-документов lxml.
+    """
+
+    def __init__(self):
+        self.parser: html.HTMLParser = html.HTMLParser(encoding='utf-8')
+
+    def tree(self, text: str) -> html.HtmlElement:
+        """
+        Строит дерево html-документа;
+
+        :param text: данные для парсинга;
+        :return: корневой элемент дерева.
+        """
+
+        return html.fromstring(text.encode('utf-8'), parser=self.parser)
+
+    def rows(self, text: str) -> list:
+        """
+        Находит строки таблицы с данными;
+
+        :param text: данные для парсинга;
+        :return: строки таблицы.
+        """
+
+        table = self.tree(text).xpath('(//div[@id="generalBody"])[1]'
+                                      '//table')[0]
+
+        return [*table.iter('tr')][3:]
+
+    def cells(self, row) -> list:
+        """
+        Разбивает строку таблицы на ячейки;
+
+        :param row: строка таблицы;
+        :return: ячейки строки.
+        """
+
+        return [*row.iter('td')]
+
+    def value(self, cell, source: str) -> str | None:
+        """
+        Извлекает значение из ячейки;
+
+        :param cell: ячейка строки;
+        :param source: источник значения (text, link, href, image);
+        :return: значение или None, если значение отсутствует.
+        """
+
+        if source == 'text':
+            return str(cell.text_content())
+
+        if source == 'link':
+            link = cell.find('.//a')
+            return str(link.text_content()) if link is not None else None
+
+        if source == 'href':
+            link = cell.find('.//a')
+            return link.get('href') if link is not None else None
+
+        if source == 'image':
+            image = cell.find('.//img')
+            return image.get('alt') if image is not None else None
+
+    def total(self, text: str) -> str:
+        """
+        Находит заголовок с общим количеством записей;
+
+        :param text: данные для парсинга;
+        :return: текст заголовка.
+        """
+
+        table = self.tree(text).xpath('(//div[@id="mainContainerSub"])[1]'
+                                      '//div[@id="generalBody"]'
+                                      '//table')[1]
+
+        return str(next(table.iter('th')).text_content())
+
+    def platforms(self, text: str) -> list[str]:
+        """
+        Находит игровые платформы в фильтре каталога (console);
+
+        :param text: данные для парсинга;
+        :return: значения фильтра игровых платформ.
+        """
+
+        values = self.tree(text).xpath('//select[@name="console"]'
+                                       '/option/@value')
+
+        return [str(value) for value in values if value.strip()]
+
+    def details(self, text: str) -> dict:
+        """
+        Находит атрибуты видеоигры на ее странице: значением атрибута
+        является текст элемента, следующего за заголовком из DETAIL_FIELDS;
+
+        :param text: данные для парсинга;
+        :return: атрибуты видеоигры.
+        """
+
+        labels = {label: field for field, label in DETAIL_FIELDS.items()}
+        box = self.tree(text).find('.//div[@id="gameGenInfoBox"]')
+
+        details = {}
+
+        for header in box.iter('h2') if box is not None else []:
+            field = labels.get(header.text_content().strip())
+            sibling = header.getnext()
+
+            if field and sibling is not None:
+                details[field] = str(sibling.text_content()).strip()
+
+        return details
@@ -0,0 +1,93 @@
+import datetime
+import functools
+import re
+
+from config.parser.managers.parsing import DATE_CACHE
+from config.parser.managers.parsing import DATE_HORIZON
+
+
+MONTHS = {month: index for index, month in enumerate(
+    ['jan', 'feb', 'mar', 'apr', 'may', 'jun',
+     'jul', 'aug', 'sep', 'oct', 'nov', 'dec'], 1
+)}
+
+DATE = re.compile(r'(\d{1,2})(?:st|nd|rd|th)?\s+'
+                  rf'({"|".join(MONTHS)})\s+(\d{{2}})',
+                  re.IGNORECASE)
+
+# Наибольший двузначный год, относящийся к XXI веку. Вычисляется один раз
+# при запуске.
+PIVOT = datetime.date.today().year % 100 + DATE_HORIZON
+
+
+def raw(value: str) -> str:
+    """
+    Возвращает значение без изменений;
+
+    :param value: значение ячейки;
+    :return: значение ячейки.
+    """
+
+    return value
+
+
+def string(value: str) -> str:
+    """
+    Удаляет пробельные символы в начале и конце строки;
+
+    :param value: значение ячейки;
+    :return: строка.
+    """
+
+    return value.strip()
+
+
+def score(value: str) -> float:
+    """
+    Преобразует оценку в число с одним знаком после запятой;
+
+    :param value: значение ячейки;
+    :return: оценка.
+    """
+
+    return round(float(value), 1)
+
+
+def sales(value: str) -> float:
+    """
+    Преобразует количество копий (в миллионах) в число;
+
+    :param value: значение ячейки;
+    :return: количество копий.
+    """
+
+    return float(value.replace('m', ''))
+
+
+@functools.lru_cache(maxsize=DATE_CACHE)
+def date(value: str) -> str:
+    """
+    Преобразует дату вида "18th Nov 11" в формат "2011-11-18". Различных
+    дат немного, поэтому результаты преобразования кэшируются по тексту
+    ячейки. Двузначный год относится к XXI веку, если не превышает PIVOT;
+
+    :param value: значение ячейки;
+    :return: дата.
+    """
+
+    if (match := DATE.fullmatch(value.strip())) is None:
+        raise ValueError(value)
+
+    day, month, year = match.groups()
+    year = int(year) + (2000 if int(year) <= PIVOT else 1900)
+
+    return datetime.date(year, MONTHS[month.lower()], int(day)).isoformat()
+
+
+CONVERTERS = {
+    'raw': raw,
+    'string': string,
+    'score': score,
+    'sales': sales,
+    'date': date,
+}
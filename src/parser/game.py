@@ -1,9 +1,11 @@
-import datetime
+from typing import NamedTuple
 
 
-class Game(object):
+class Game(NamedTuple):
     """
-    Видеоигра;
+    Видеоигра. Хранится как кортеж значений полей в порядке FIELD_NAMES
+    без словаря атрибутов экземпляра, поэтому передается в хранилище
+    собранных данных как есть, без промежуточных копий;
 
     :var name: название;
     :var date: дата выхода;
@@ -19,48 +21,27 @@ class Game(object):
     :var vgc: оценка VGChartz.com;
     :var critic: оценка критиков;
     :var user: оценка пользователей;
+    :var update: дата последнего обновления данных;
+    :var url: адрес страницы видеоигры;
 
     """
 
-    def __init__(self):
-        self.name: str | None = None
-        self.date: datetime.date | None = None
-        self.platform: str | None = None
-        self.publisher: str | None = None
-        self.developer: str | None = None
-        self.shipped: int | None = None
-        self.total: int | None = None
-        self.america: int | None = None
-        self.europe: int | None = None
-        self.japan: int | None = None
-        self.other: int | None = None
-        self.vgc: float | None = None
-        self.critic: float | None = None
-        self.user: float | None = None
+    name: str | None = None
+    date: str | None = None
+    platform: str | None = None
+    publisher: str | None = None
+    developer: str | None = None
+    shipped: float | None = None
+    total: float | None = None
+    america: float | None = None
+    europe: float | None = None
+    japan: float | None = None
+    other: float | None = None
+    vgc: float | None = None
+    critic: float | None = None
+    user: float | None = None
+    update: str | None = None
+    url: str | None = None
 
     def __bool__(self):
-        return any(getattr(self, attribute) for attribute in self.__dict__)
-
-    def csv(self) -> list:
-        """
-        Возвращает данные для записи в csv-файл.
-
-        :return: Данные для записи в csv-файл.
-        """
-
-        return [
-            self.name,
-            self.date,
-            self.platform,
-            self.publisher,
-            self.developer,
-            self.shipped,
-            self.total,
-            self.america,
-            self.europe,
-            self.japan,
-            self.other,
-            self.vgc,
-            self.critic,
-            self.user,
-        ]
+        return any(self)
@@ -0,0 +1,326 @@
+import hashlib
+import os
+import shutil
+import struct
+import time
+import zlib
+
+from config.parser.managers.archive import FRAME_HEADER
+from config.paths import ARCHIVE_PATH
+from parser.managers.metrics import MetricsManager
+
+
+HEADER = struct.Struct(FRAME_HEADER)
+
+
+class ArchiveManager(object):
+    """
+    Менеджер архива страниц, задачами которого являются:
+
+    - сохранение тела каждой полученной страницы каталога в архив, который
+      только дописывается: запись архива состоит из заголовка (номер
+      страницы, время получения, размер) и тела страницы, сжатого zlib;
+    - отбрасывание записей, сохраненных после контрольной точки,
+      или частично записанной последней записи архива, если сбор данных
+      был прерван во время записи;
+    - чтение записей архива для повторного парсинга без запросов
+      к серверу;
+    - объединение архивов шардов и разделов каталога в архив итогового
+      файла с данными;
+    - выдача тела страницы по его хешу: кэш ответов не хранит тела
+      страниц, сохраненных в архив;
+
+    Архив ведется для каждого файла с данными: при создании файла
+    с данными архив создается заново, при дозаписи (возобновление сбора
+    данных, инкрементальный сбор данных) - дополняется. Позиция архива
+    сохраняется в контрольной точке, поэтому возобновление сбора данных
+    не требует чтения архива;
+
+    :var enabled: флаг сохранения страниц в архив;
+    :var level: уровень сжатия zlib;
+    :var file: имя файла с данными;
+    :var handle: файл архива, открытый для дозаписи;
+    :var index: позиции записей архива по хешам тел страниц (None -
+        указатель еще не построен);
+    :var metrics: менеджер метрик.
+    """
+
+    def __init__(self, metrics: MetricsManager | None = None):
+        self.enabled: bool = False
+        self.level: int | None = None
+        self.file: str | None = None
+        self.handle = None
+        self.index: dict[str, int] | None = None
+        self.metrics: MetricsManager = metrics or MetricsManager()
+
+    @staticmethod
+    def path(file: str) -> str:
+        """
+        Формирует путь к архиву страниц для файла с данными. Отбрасывается
+        только расширение, поэтому разделы каталога (games.PS4.csv) имеют
+        собственные архивы;
+
+        :param file: имя файла с данными;
+        :return: путь к архиву страниц.
+        """
+
+        return fr'{ARCHIVE_PATH}\{file.rsplit(".", 1)[0]}.pages'
+
+    @staticmethod
+    def digest(data: bytes) -> str:
+        """
+        Вычисляет хеш тела страницы;
+
+        :param data: тело страницы в кодировке utf-8;
+        :return: хеш тела страницы.
+        """
+
+        return hashlib.sha1(data).hexdigest()
+
+    def write(self, page: int, text: str) -> None:
+        """
+        Сжимает тело страницы и дописывает его в архив. Страница невелика,
+        поэтому сжимается в текущем потоке;
+
+        :param page: номер страницы;
+        :param text: тело страницы;
+        :return: None.
+        """
+
+        if self.handle is None:
+            return
+
+        data = text.encode('utf-8')
+        body = zlib.compress(data, self.level)
+
+        if self.index is not None:
+            self.index[self.digest(data)] = self.handle.tell()
+
+        self.handle.write(HEADER.pack(page, time.time(), len(body)) + body)
+
+        self.metrics.count('archived_bytes', HEADER.size + len(body))
+
+    def flush(self) -> None:
+        """
+        Передает буфер архива операционной системе. Позиция архива после
+        сброса буфера сохраняется в контрольной точке;
+
+        :return: None.
+        """
+
+        if self.handle is not None:
+            self.handle.flush()
+
+    def sync(self) -> None:
+        """
+        Сбрасывает архив на диск, чтобы позиция архива в контрольной точке
+        не указывала за пределы записанных на диск данных. Выполняется
+        в потоке записи данных перед записью контрольной точки;
+
+        :return: None.
+        """
+
+        if self.handle is not None:
+            os.fsync(self.handle.fileno())
+
+    def body(self, digest: str) -> str | None:
+        """
+        Читает из архива тело страницы по его хешу. Указатель записей
+        архива строится при первом обращении: архив, открытый
+        для дозаписи, читается один раз;
+
+        :param digest: хеш тела страницы;
+        :return: тело страницы или None, если оно не сохранено в архиве.
+        """
+
+        if self.handle is None:
+            return None
+
+        self.handle.flush()
+
+        path = self.path(self.file)
+
+        if self.index is None:
+            self.index = {
+                self.digest(zlib.decompress(body)):
+                    end - HEADER.size - len(body)
+                for _, _, body, end in self.frames(path)
+            }
+
+        if (offset := self.index.get(digest)) is None:
+            return None
+
+        with open(path, 'rb') as file:
+            file.seek(offset)
+            *_, length = HEADER.unpack(file.read(HEADER.size))
+            body = file.read(length)
+
+        return zlib.decompress(body).decode('utf-8')
+
+    @staticmethod
+    def frames(path: str):
+        """
+        Читает записи архива по порядку. Чтение прекращается на частично
+        записанной записи;
+
+        :param path: путь к архиву страниц;
+        :return: генератор записей архива: номер страницы, время получения,
+            сжатое тело страницы и позиция конца записи.
+        """
+
+        with open(path, 'rb') as file:
+            while len(header := file.read(HEADER.size)) == HEADER.size:
+                page, fetched, length = HEADER.unpack(header)
+
+                if len(body := file.read(length)) < length:
+                    return
+
+                yield page, fetched, body, file.tell()
+
+    def read(self, file: str):
+        """
+        Читает записи архива страниц файла с данными по порядку;
+
+        :param file: имя файла с данными;
+        :return: генератор записей архива: номер страницы, время получения
+            и сжатое тело страницы.
+        """
+
+        for page, fetched, body, _ in self.frames(self.path(file)):
+            yield page, fetched, body
+
+    @staticmethod
+    def end(path: str) -> int:
+        """
+        Находит конец последней целой записи архива. Читаются только
+        заголовки записей: тела страниц пропускаются;
+
+        :param path: путь к архиву страниц;
+        :return: позиция конца последней целой записи.
+        """
+
+        size, position = os.path.getsize(path), 0
+
+        with open(path, 'rb') as file:
+            while len(header := file.read(HEADER.size)) == HEADER.size:
+                *_, length = HEADER.unpack(header)
+
+                if position + HEADER.size + length > size:
+                    break
+
+                position = file.seek(length, os.SEEK_CUR)
+
+        return position
+
+    def repair(self, path: str, offset: int | None = None) -> None:
+        """
+        Отбрасывает записи архива, сохраненные после контрольной точки,
+        а без контрольной точки - частично записанную последнюю запись,
+        чтобы следующие записи дописывались после последней целой записи;
+
+        :param path: путь к архиву страниц;
+        :param offset: позиция архива из контрольной точки;
+        :return: None.
+        """
+
+        end = self.end(path) if offset is None else offset
+
+        if os.path.getsize(path) > end:
+            os.truncate(path, end)
+
+    def merge(self, file: str, files: list[str]) -> None:
+        """
+        Объединяет архивы страниц файлов с данными в архив страниц
+        файла с данными: записи копируются без распаковки, частично
+        записанные последние записи отбрасываются. Объединяемые архивы
+        сохраняются;
+
+        :param file: имя файла с данными;
+        :param files: имена объединяемых файлов с данными по порядку;
+        :return: None.
+        """
+
+        sources = [self.path(name) for name in files
+                   if os.path.exists(self.path(name))]
+
+        if not sources:
+            return
+
+        path = self.path(file)
+
+        with open(path + '.tmp', 'wb') as target:
+            for source in sources:
+                end = target.tell() + self.end(source)
+
+                with open(source, 'rb') as archive:
+                    shutil.copyfileobj(archive, target)
+
+                target.truncate(end)
+                target.seek(end)
+
+        os.replace(path + '.tmp', path)
+
+    def close(self) -> None:
+        """
+        Закрывает архив страниц;
+
+        :return: None.
+        """
+
+        if self.handle is not None:
+            self.handle.close()
+            self.handle = None
+
+    def setting(self,
+                file: str,
+                mode: str,
+                enabled: bool,
+                level: int,
+                offset: int | None = None) -> None:
+        """
+        Настраивает менеджер: создает архив страниц или открывает его
+        для дозаписи в соответствии с режимом работы с файлом с данными;
+
+        :param file: имя файла с данными;
+        :param mode: режим работы с файлом с данными;
+        :param enabled: флаг сохранения страниц в архив;
+        :param level: уровень сжатия zlib;
+        :param offset: позиция архива из контрольной точки;
+        :return: None.
+        """
+
+        self.close()
+
+        self.file = file
+        self.enabled = enabled
+        self.level = level
+        self.index = None
+
+        if not enabled:
+            return
+
+        path = self.path(file)
+
+        if mode == 'a' and os.path.exists(path):
+            self.repair(path, offset)
+        else:
+            self.index = {}
+
+        self.handle = open(path,  # noqa: SIM115
+                           'wb' if mode == 'w' else 'ab')
+
+    def json(self) -> dict:
+        """
+        Возвращает текущие параметры:
+
+        - archive: флаг сохранения страниц в архив, уровень сжатия
+          и позиция архива, до которой записи сброшены на диск;
+
+        :return: текущие параметры.
+        """
+
+        offset = self.handle.tell() if self.handle is not None else None
+
+        return {'archive': {'enabled': self.enabled,
+                            'level': self.level,
+                            'offset': offset}}
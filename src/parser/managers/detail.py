@@ -0,0 +1,340 @@
+import asyncio
+import json
+import sqlite3
+import time
+
+from concurrent.futures import Future
+from concurrent.futures import ThreadPoolExecutor
+from urllib.parse import urlsplit
+
+from config.parser.managers.parsing import DETAIL_FIELDS
+from config.parser.parser import PERMANENT_CODES
+from config.paths import DETAIL_PATH
+from parser.managers.network.delay import DelayManager
+
+
+class DetailManager(object):
+    """
+    Менеджер страниц видеоигр, задачами которого являются:
+
+    - передача адресов страниц видеоигр, найденных на страницах каталога,
+      обработчикам страниц видеоигр через ограниченную очередь: если
+      очередь заполнена, обработка страниц каталога приостанавливается;
+    - хранение на диске множества известных страниц видеоигр и их
+      атрибутов: уже полученные страницы повторно не запрашиваются,
+      а неполученные запрашиваются при следующем запуске через ту же
+      очередь, чередуясь со страницами текущего запуска;
+    - задержка перед запросами страниц видеоигр, ограничивающая их долю
+      в общей частоте запросов к серверу;
+    - выдача атрибутов видеоигр для выгрузки хранилища записей;
+
+    Операции с базой данных страниц видеоигр выполняются в отдельном
+    потоке, чтобы не задерживать получение страниц. Страница завершена,
+    если получены ее атрибуты или она отсутствует на сервере (коды
+    статусов PERMANENT_CODES): завершенные страницы повторно
+    не запрашиваются;
+
+    :var enabled: флаг получения страниц видеоигр;
+    :var workers: количество одновременно обрабатываемых страниц видеоигр;
+    :var size: максимальное количество страниц видеоигр в очереди;
+    :var delay: менеджер задержки запросов страниц видеоигр (доля общей
+        частоты запросов);
+    :var queue: очередь страниц видеоигр;
+    :var backlog: страницы видеоигр, не полученные при предыдущих запусках
+        (результат чтения в потоке базы данных);
+    :var connection: соединение с базой данных страниц видеоигр;
+    :var executor: поток, осуществляющий операции с базой данных страниц
+        видеоигр.
+    """
+
+    def __init__(self):
+        self.enabled: bool = False
+        self.workers: int = 0
+        self.size: int = 0
+        self.delay: DelayManager = DelayManager()
+        self.queue: asyncio.Queue | None = None
+        self.backlog: Future | None = None
+        self.connection: sqlite3.Connection | None = None
+        self.executor: ThreadPoolExecutor | None = None
+
+    async def execute(self, function, *args):
+        """
+        Выполняет операцию с базой данных страниц видеоигр в потоке базы
+        данных;
+
+        :param function: операция с базой данных страниц видеоигр;
+        :param args: аргументы операции;
+        :return: результат операции.
+        """
+
+        loop = asyncio.get_running_loop()
+
+        return await loop.run_in_executor(self.executor, function, *args)
+
+    def select(self, urls: list[str | None]) -> list[str]:
+        """
+        Отмечает страницы видеоигр известными и отбирает те, которые
+        встречаются впервые. Страница определяется путем адреса, поэтому
+        не зависит от адреса сайта;
+
+        :param urls: адреса страниц видеоигр;
+        :return: пути страниц видеоигр, которые встречаются впервые.
+        """
+
+        paths = []
+
+        with self.connection:
+            for url in urls:
+                if not url:
+                    continue
+
+                path = urlsplit(url).path
+                cursor = self.connection.execute(
+                    'INSERT OR IGNORE INTO details (path, done) VALUES (?, 0)',
+                    (path,)
+                )
+
+                if cursor.rowcount:
+                    paths.append(path)
+
+        return paths
+
+    async def put(self, urls: list[str | None]) -> None:
+        """
+        Помещает в очередь страницы видеоигр, которые встречаются впервые.
+        Ожидает, пока в очереди не освободится место;
+
+        :param urls: адреса страниц видеоигр;
+        :return: None.
+        """
+
+        if not self.enabled:
+            return
+
+        for path in await self.execute(self.select, urls):
+            await self.queue.put(path)
+
+    async def stop(self) -> None:
+        """
+        Сообщает каждому обработчику страниц видеоигр, что новых страниц
+        больше не будет;
+
+        :return: None.
+        """
+
+        for _ in range(self.workers):
+            await self.queue.put(None)
+
+    async def feed(self) -> None:
+        """
+        Помещает в очередь страницы видеоигр, не полученные при предыдущих
+        запусках. Выполняется отдельной задачей одновременно с обработкой
+        страниц каталога, поэтому ожидание места в очереди не задерживает
+        ни одну из них;
+
+        :return: None.
+        """
+
+        if not self.enabled:
+            return
+
+        for path in await asyncio.wrap_future(self.backlog):
+            await self.queue.put(path)
+
+    async def take(self) -> str | None:
+        """
+        Выдает следующую страницу видеоигры из очереди;
+
+        :return: путь страницы видеоигры или None, если страниц больше нет.
+        """
+
+        return await self.queue.get()
+
+    async def save(self,
+                   path: str,
+                   code: int,
+                   details: dict | None = None) -> None:
+        """
+        Сохраняет результат запроса страницы видеоигры в потоке базы данных;
+
+        :param path: путь страницы видеоигры;
+        :param code: код статуса запроса;
+        :param details: атрибуты видеоигры;
+        :return: None.
+        """
+
+        await self.execute(self.update, path, code, details)
+
+    def update(self,
+               path: str,
+               code: int,
+               details: dict | None = None) -> None:
+        """
+        Записывает результат запроса страницы видеоигры. Страница отмечается
+        завершенной, если получены ее атрибуты или она отсутствует
+        на сервере;
+
+        :param path: путь страницы видеоигры;
+        :param code: код статуса запроса;
+        :param details: атрибуты видеоигры;
+        :return: None.
+        """
+
+        with self.connection:
+            self.connection.execute(
+                'UPDATE details SET done = ?, code = ?, data = ?, time = ? '
+                'WHERE path = ?',
+                (details is not None or code in PERMANENT_CODES,
+                 code,
+                 (json.dumps(details, ensure_ascii=False)
+                  if details is not None
+                  else None),
+                 time.time(),
+                 path)
+            )
+
+    def pending(self) -> list[str]:
+        """
+        Возвращает страницы видеоигр, которые известны, но не получены;
+
+        :return: пути страниц видеоигр.
+        """
+
+        return [path for path, in self.connection.execute(
+            'SELECT path FROM details WHERE done = 0'
+        )]
+
+    def attributes(self) -> dict[str, dict]:
+        """
+        Читает атрибуты полученных страниц видеоигр;
+
+        :return: атрибуты видеоигр по путям их страниц.
+        """
+
+        rows = self.connection.execute(
+            'SELECT path, data FROM details WHERE data IS NOT NULL'
+        )
+
+        return {path: json.loads(data) for path, data in rows}
+
+    @staticmethod
+    def join(records: list,
+             attributes: dict[str, dict],
+             url: int) -> list[tuple]:
+        """
+        Дополняет записи атрибутами видеоигр (DETAIL_FIELDS) по путям
+        адресов их страниц. Атрибуты неполученных страниц пусты;
+
+        :param records: записи;
+        :param attributes: атрибуты видеоигр по путям их страниц;
+        :param url: номер поля адреса страницы видеоигры в записи;
+        :return: дополненные записи.
+        """
+
+        joined = []
+
+        for record in records:
+            path = urlsplit(record[url]).path if record[url] else None
+            details = attributes.get(path, {})
+
+            joined.append(
+                (*record, *(details.get(field) for field in DETAIL_FIELDS))
+            )
+
+        return joined
+
+    def open(self) -> None:
+        """
+        Открывает базу данных страниц видеоигр и запускает поток базы
+        данных;
+
+        :return: None.
+        """
+
+        if self.connection is not None:
+            return
+
+        self.executor = ThreadPoolExecutor(max_workers=1)
+        self.connection = sqlite3.connect(
+            fr'{DETAIL_PATH}\details.sqlite',
+            check_same_thread=False
+        )
+        self.connection.execute(
+            'CREATE TABLE IF NOT EXISTS details ('
+            'path TEXT PRIMARY KEY, '
+            'done INTEGER, '
+            'code INTEGER, '
+            'data TEXT, '
+            'time REAL)'
+        )
+
+    def setting(self,
+                enabled: bool,
+                workers: int,
+                queue: int,
+                rates: tuple,
+                factor: int,
+                threshold: int) -> None:
+        """
+        Настраивает менеджер. Страницы видеоигр, не полученные
+        при предыдущих запусках, читаются в потоке базы данных
+        до страниц текущего запуска и обрабатываются первыми;
+
+        :param enabled: флаг получения страниц видеоигр;
+        :param workers: количество одновременно обрабатываемых страниц
+            видеоигр;
+        :param queue: максимальное количество страниц видеоигр в очереди;
+        :param rates: минимальная и максимальная частота запросов страниц
+            видеоигр;
+        :param factor: масштаб задержки;
+        :param threshold: порог смены типа задержки;
+        :return: None.
+        """
+
+        self.enabled = enabled
+        self.workers = workers
+        self.size = queue
+
+        self.delay.setting(rates, factor, threshold, burst=1)
+
+        if not enabled:
+            return
+
+        self.queue = asyncio.Queue(maxsize=queue)
+
+        self.open()
+
+        self.backlog = self.executor.submit(self.pending)
+
+    def close(self) -> None:
+        """
+        Закрывает соединение с базой данных страниц видеоигр и завершает
+        работу потока базы данных;
+
+        :return: None.
+        """
+
+        if self.executor is not None:
+            self.executor.shutdown()
+            self.executor = None
+
+        if self.connection is not None:
+            self.connection.close()
+            self.connection = None
+
+    def json(self) -> dict:
+        """
+        Возвращает текущие параметры:
+
+        - details: флаг получения страниц видеоигр, количество
+          одновременно обрабатываемых страниц, максимальное количество
+          страниц в очереди и минимальная и максимальная частота
+          запросов;
+
+        :return: текущие параметры.
+        """
+
+        return {'details': {'enabled': self.enabled,
+                            'workers': self.workers,
+                            'queue': self.size,
+                            'rates': self.delay.rates}}
@@ -1,76 +1,378 @@
-import csv
+import asyncio
+import copy
 import json
 import os
+import time
 
+from concurrent.futures import ThreadPoolExecutor
+
+from config.parser.managers.file import EXPORT_BATCH
 from config.parser.managers.file import FIELD_NAMES
+from config.parser.managers.parsing import DETAIL_FIELDS
 from config.paths import CHECKPOINT_PATH
 from config.paths import FILE_RAW_PATH
+from parser.managers.detail import DetailManager
+from parser.managers.metrics import MetricsManager
+from parser.sinks.columnar import ParquetSink
+from parser.sinks.database import SqliteSink
+from parser.sinks.sink import Sink
+from parser.sinks.text import CsvSink
+
+
+SINKS = {
+    'csv': CsvSink,
+    'parquet': ParquetSink,
+    'sqlite': SqliteSink,
+}
 
 
 class FileManager(object):
     """
     Файловый менеджер, задачами которого являются:
 
-    - запись собранных файлов в csv файл;
+    - запись собранных файлов в csv или parquet файл или в хранилище
+      записей sqlite, обновляющее повторно собранные видеоигры
+      (в зависимости от расширения имени файла);
+    - выгрузка хранилища записей в csv или parquet файл, в том числе
+      вместе с атрибутами видеоигр;
     - учет количества собранных данных;
     - чтение и запись контрольной точки в формате json;
+    - учет метрик записи: времени записи пакета, количества записанных
+      строк и байт;
+
+    Файл с данными остается открытым в течение всего сбора данных. Данные
+    поступают в очередь и записываются пакетами в отдельном потоке, чтобы
+    операции с диском не задерживали получение страниц. Контрольная точка
+    поступает в ту же очередь и записывается после данных, переданных
+    до нее, поэтому соответствует им без ожидания записи;
 
     :var file: имя файла с данными;
     :var checkpoint: имя файла контрольной точки в формате json;
     :var size: размер файла с данными;
-    :var records: количество собранных данных.
+    :var records: количество собранных данных;
+    :var offset: позиция хранилища, до которой данные сброшены на диск;
+    :var unflushed: количество данных, переданных на запись после сброса
+        на диск;
+    :var sink: хранилище собранных данных;
+    :var queue: очередь данных и контрольных точек, ожидающих записи;
+    :var executor: поток, осуществляющий запись данных;
+    :var writer: задача, передающая данные из очереди в поток записи;
+    :var metrics: менеджер метрик.
     """
 
-    def __init__(self):
+    def __init__(self, metrics: MetricsManager | None = None):
         self.file: str | None = ''
         self.checkpoint: str | None = ''
         self.size: int | None = None
         self.records: int | None = None
+        self.offset: int | None = None
+        self.unflushed: int = 0
+        self.sink: Sink | None = None
+        self.queue: asyncio.Queue | None = None
+        self.executor: ThreadPoolExecutor | None = None
+        self.writer: asyncio.Task | None = None
+        self.metrics: MetricsManager = metrics or MetricsManager()
 
     def create(self) -> None:
         """
-        Создает csv-файл с данными;
+        Создает файл с данными;
 
         :return: None.
         """
 
-        path = fr'{FILE_RAW_PATH}\{self.file}'
-        with open(path, 'w', newline='', encoding='utf-8') as file:
-            writer = csv.writer(file, delimiter=',')
-            writer.writerow(FIELD_NAMES)
+        self.sink.create()
 
-        self.size, self.records = 0, 0
+        self.size, self.records = self.sink.size(), self.sink.count()
+        self.offset = self.sink.offset()
+
+    def open(self) -> None:
+        """
+        Открывает файл с данными для дозаписи, запускает поток записи
+        и задачу, передающую ему данные из очереди;
+
+        :return: None.
+        """
+
+        self.sink.open()
+
+        self.queue = asyncio.Queue()
+        self.executor = ThreadPoolExecutor(max_workers=1)
+        self.writer = asyncio.create_task(self.transfer())
 
     async def write(self, records: list[list]) -> None:
         """
-        Записывает данные в csv-файл. Учитывает количество собранных данных;
+        Передает данные в очередь на запись в файл;
+
+        :param records: записываемые данные;
+        :return: None.
+        """
+
+        if self.writer is None:
+            self.open()
+
+        self.unflushed += len(records)
+
+        await self.queue.put(records)
+
+    def due(self) -> bool:
+        """
+        Проверяет, накоплено ли достаточно данных для сброса на диск
+        в соответствии с хранилищем (например, для части parquet-файла);
+
+        :return: True, если данные можно сбросить на диск.
+        """
+
+        return self.unflushed >= self.sink.batch
+
+    async def transfer(self) -> None:
+        """
+        Извлекает из очереди все накопившиеся данные и записывает их одним
+        пакетом в потоке записи. Учитывает размер файла, количество
+        собранных данных и время записи. Данные извлекаются до первой
+        контрольной точки в очереди: после их записи данные сбрасываются
+        на диск, а затем записывается контрольная точка;
+
+        :return: None.
+        """
+
+        loop = asyncio.get_running_loop()
+
+        while True:
+            batches = [await self.queue.get()]
+
+            while (not self.queue.empty()
+                   and not isinstance(batches[-1], tuple)):
+                batches.append(self.queue.get_nowait())
+
+            records = [record for batch in batches
+                       if not isinstance(batch, tuple)
+                       for record in batch]
+
+            try:
+                if records:
+                    await self.record(records)
+
+                if isinstance(batches[-1], tuple):
+                    checkpoint, sync = batches[-1]
+
+                    await self.sync()
+
+                    if sync is not None:
+                        await loop.run_in_executor(self.executor, sync)
+
+                    await loop.run_in_executor(self.executor, self.dump,
+                                               self.json() | checkpoint)
+            finally:
+                for _ in batches:
+                    self.queue.task_done()
+
+    async def record(self, records: list[list]) -> None:
+        """
+        Записывает пакет данных в потоке записи. Учитывает размер файла,
+        количество собранных данных и время записи;
 
         :param records: записываемые данные;
         :return: None.
         """
 
-        path = fr'{FILE_RAW_PATH}\{self.file}'
-        with open(path, 'a', newline='', encoding='utf-8') as file:
-            writer = csv.writer(file, delimiter=',')
+        loop = asyncio.get_running_loop()
+
+        size, start = self.size, time.perf_counter()
+
+        self.size = await loop.run_in_executor(
+            self.executor,
+            self.sink.write,
+            records
+        )
+        self.records += self.sink.added(records)
+
+        self.metrics.observe('write_seconds', time.perf_counter() - start)
+        self.metrics.count('written_rows', len(records))
+        self.metrics.count('written_bytes', max(self.size - size, 0))
+
+    async def sync(self) -> None:
+        """
+        Сбрасывает записанные данные на диск в потоке записи и запоминает
+        позицию хранилища, до которой они сброшены;
+
+        :return: None.
+        """
+
+        loop = asyncio.get_running_loop()
+
+        self.size = await loop.run_in_executor(self.executor, self.sink.sync)
+        self.offset = self.sink.offset()
 
-            for record in records:
-                writer.writerow(record)
+    async def flush(self) -> None:
+        """
+        Дожидается записи всех данных из очереди и сбрасывает их на диск.
+        Если запись завершилась ошибкой, возбуждает ее;
+
+        :return: None.
+        """
 
-        self.size = os.path.getsize(path)
-        self.records += len(records)
+        if self.writer is None:
+            return
 
-    async def save(self, checkpoint: dict) -> None:
+        join = asyncio.create_task(self.queue.join())
+        await asyncio.wait([join, self.writer],
+                           return_when=asyncio.FIRST_COMPLETED)
+
+        if self.writer.done():
+            join.cancel()
+            self.writer.result()
+
+        await self.sync()
+
+        self.unflushed = 0
+
+    async def close(self, compact: bool = False) -> None:
+        """
+        Записывает оставшиеся данные, закрывает файл с данными и завершает
+        работу потока записи;
+
+        :param compact: флаг завершения сбора данных, после которого
+            хранилище приводится к окончательному виду;
+        :return: None.
         """
-        Записывает контрольную точки в формат json;
+
+        if self.writer is None:
+            return
+
+        await self.flush()
+
+        self.writer.cancel()
+
+        loop = asyncio.get_running_loop()
+        await loop.run_in_executor(self.executor, self.sink.close)
+
+        if compact:
+            await loop.run_in_executor(self.executor, self.sink.compact)
+
+        self.executor.shutdown()
+        self.size = self.sink.size()
+
+        self.queue, self.executor, self.writer = None, None, None
+
+    def merge(self, files: list[str]) -> None:
+        """
+        Объединяет файлы с данными того же формата в файл с данными
+        менеджера;
+
+        :param files: имена объединяемых файлов с данными по порядку;
+        :return: None.
+        """
+
+        self.sink.merge([fr'{FILE_RAW_PATH}\{file}' for file in files])
+
+        self.size, self.records = self.sink.size(), self.sink.count()
+        self.offset = self.sink.offset()
+
+    def export(self, file: str, details: dict | None = None) -> int:
+        """
+        Выгружает записи хранилища записей в csv или parquet файл
+        (в зависимости от расширения имени файла) пакетами в порядке
+        уникального индекса. Если переданы атрибуты видеоигр, записи
+        дополняются полями DETAIL_FIELDS;
+
+        :param file: имя файла с данными;
+        :param details: атрибуты видеоигр по путям их страниц;
+        :return: количество выгруженных записей.
+        """
+
+        fields = FIELD_NAMES
+
+        if details is not None:
+            fields = [*FIELD_NAMES, *DETAIL_FIELDS]
+
+        extension = file.split('.')[-1]
+        target = SINKS[extension](fr'{FILE_RAW_PATH}\{file}', fields)
+
+        target.create()
+        target.open()
+
+        url = FIELD_NAMES.index('url')
+
+        records = 0
+        for batch in self.sink.read():
+            if details is not None:
+                batch = DetailManager.join(batch, details, url)
+
+            target.write(batch)
+            records += len(batch)
+
+        target.sync()
+        target.close()
+        target.compact()
+
+        return records
+
+    def rebuild(self, records: list) -> None:
+        """
+        Записывает данные в файл с данными менеджера пакетами
+        по EXPORT_BATCH в текущем потоке, без очереди и потока записи
+        (например, при повторном парсинге архива страниц);
+
+        :param records: записываемые данные;
+        :return: None.
+        """
+
+        self.sink.open()
+
+        for start in range(0, len(records), EXPORT_BATCH):
+            self.sink.write(records[start:start + EXPORT_BATCH])
+
+        self.sink.sync()
+        self.sink.close()
+        self.sink.compact()
+
+        self.size, self.records = self.sink.size(), self.sink.count()
+        self.offset = self.sink.offset()
+
+    def save(self, checkpoint: dict, sync=None) -> None:
+        """
+        Записывает контрольную точки в формат json. Контрольная точка
+        записывается во временный файл, который затем заменяет предыдущую,
+        поэтому прерывание записи не повреждает контрольную точку. Если
+        поток записи запущен, контрольная точка ставится в очередь
+        и записывается в нем после данных, переданных на запись до нее,
+        поэтому не задерживает получение страниц. В очередь ставится копия
+        контрольной точки, которую не изменяют следующие страницы.
+        Дождаться ее записи позволяет метод flush;
+
+        :param checkpoint: контрольная точка;
+        :param sync: функция, сбрасывающая на диск данные, на которые
+            ссылается контрольная точка (например, архив страниц);
+        :return: None.
+        """
+
+        if self.writer is None:
+            if sync is not None:
+                sync()
+
+            self.dump(self.json() | checkpoint)
+            return
+
+        self.unflushed = 0
+
+        self.queue.put_nowait((copy.deepcopy(checkpoint), sync))
+
+    def dump(self, checkpoint: dict) -> None:
+        """
+        Записывает контрольную точку во временный файл, сбрасывает его
+        на диск и заменяет им предыдущую контрольную точку;
 
         :param checkpoint: контрольная точка;
         :return: None.
         """
 
         path = fr'{CHECKPOINT_PATH}\{self.checkpoint}'
-        with open(path, 'w') as json_file:
-            checkpoint = self.json() | checkpoint
+        with open(path + '.tmp', 'w') as json_file:
             json_file.write(json.dumps(checkpoint, indent=4))
+            json_file.flush()
+            os.fsync(json_file.fileno())
+
+        os.replace(path + '.tmp', path)
 
     @staticmethod
     def load(checkpoint: str) -> dict:
@@ -85,6 +387,17 @@ class FileManager(object):
         with open(path) as file:
             return json.loads(file.read())
 
+    @staticmethod
+    def exists(file: str) -> bool:
+        """
+        Проверяет наличие файла с данными;
+
+        :param file: имя файла с данными;
+        :return: True, если файл существует.
+        """
+
+        return os.path.exists(fr'{FILE_RAW_PATH}\{file}')
+
     def delete(self) -> None:
         """
         Удаляет контрольную точки в формате json;
@@ -98,36 +411,56 @@ class FileManager(object):
         except FileNotFoundError:
             pass
 
-    def setting(self, file: str, mode: str, checkpoint: str | None) -> None:
+    def setting(self,
+                file: str,
+                mode: str,
+                checkpoint: str | None,
+                offset: int | None = None,
+                records: int | None = None) -> None:
         """
-        Настраивает менеджер;
+        Настраивает менеджер. Формат файла определяется расширением имени
+        файла (csv, parquet). При возобновлении сбора данных с контрольной
+        точки отбрасывает данные, записанные после нее (в том числе частично
+        записанную строку), и восстанавливает количество собранных данных
+        без чтения файла. Записи хранилища записей (sqlite), сохраненные
+        после контрольной точки, не отбрасываются и учитываются;
 
         :param file: имя файла с данными;
         :param mode: режим работы с файлом;
         :param checkpoint: имя файла контрольной точки в формате json;
+        :param offset: позиция хранилища в контрольной точке;
+        :param records: количество собранных данных в контрольной точке;
         :return: None.
         """
 
         self.file = file
         self.checkpoint = checkpoint
 
+        extension = file.split('.')[-1]
+        self.sink = SINKS[extension](fr'{FILE_RAW_PATH}\{file}')
+
         if mode == 'w':
             self.create()
         elif mode == 'a':
-            path = fr'{FILE_RAW_PATH}\{file}'
-            with open(path, newline='', encoding='utf-8') as file:
-                rows = csv.reader(file, delimiter=',')
-                self.records = sum([1 for _ in rows]) - 1
+            if offset is not None and records is not None:
+                self.records = records + self.sink.truncate(offset)
+            else:
+                self.records = self.sink.count()
 
-            self.size = os.path.getsize(path)
+            self.size = self.sink.size()
+            self.offset = self.sink.offset()
 
     def json(self) -> dict:
         """
         Возвращает текущие параметры:
 
-        - имя файла с данными;
+        - file: имя файла с данными;
+        - offset: позиция хранилища, до которой данные сброшены на диск;
+        - records: количество записанных данных;
 
         :return: текущие параметры.
         """
 
-        return {'file': self.file}
+        return {'file': self.file,
+                'offset': self.offset,
+                'records': self.records}
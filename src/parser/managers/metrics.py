@@ -0,0 +1,355 @@
+import bisect
+import datetime
+import itertools
+import json
+import math
+import time
+
+from aiohttp import web
+
+from config.parser.managers.metrics import BUCKETS
+from config.parser.managers.metrics import METRICS
+from config.parser.managers.metrics import PREFIX
+from config.paths import METRICS_PATH
+
+
+CONTENT_TYPE = 'application/openmetrics-text; version=1.0.0; charset=utf-8'
+
+
+class Histogram(object):
+    """
+    Гистограмма наблюдаемых значений с фиксированными интервалами;
+
+    :var buckets: верхние границы интервалов;
+    :var counts: количество значений в каждом интервале (последний
+        интервал не ограничен сверху);
+    :var sum: сумма значений;
+    :var count: количество значений.
+    """
+
+    def __init__(self, buckets: tuple = BUCKETS):
+        self.buckets: tuple = buckets
+        self.counts: list[int] = [0] * (len(buckets) + 1)
+        self.sum: float = 0
+        self.count: int = 0
+
+    def observe(self, value: float) -> None:
+        """
+        Учитывает значение;
+
+        :param value: значение;
+        :return: None.
+        """
+
+        self.counts[bisect.bisect_left(self.buckets, value)] += 1
+        self.sum += value
+        self.count += 1
+
+    def cumulative(self) -> dict[str, int]:
+        """
+        Вычисляет количество значений, не превышающих каждую из верхних
+        границ интервалов;
+
+        :return: количество значений по верхней границе интервала.
+        """
+
+        bounds = [*map(str, self.buckets), '+Inf']
+
+        return dict(zip(bounds, itertools.accumulate(self.counts),
+                        strict=True))
+
+    def json(self) -> dict:
+        """
+        Возвращает текущие значения:
+
+        - buckets: количество значений, не превышающих каждую из верхних
+          границ интервалов;
+        - sum: сумма значений;
+        - count: количество значений;
+
+        :return: текущие значения.
+        """
+
+        return {'buckets': self.cumulative(),
+                'sum': self.sum,
+                'count': self.count}
+
+
+class MetricsManager(object):
+    """
+    Менеджер метрик, задачами которого являются:
+
+    - учет счетчиков, текущих значений и гистограмм времени выполнения
+      операций сбора данных (METRICS) с метками;
+    - периодическая запись метрик в файл в формате JSON Lines;
+    - выдача метрик в текстовом формате OpenMetrics по адресу /metrics;
+
+    :var counters: счетчики по имени метрики и меткам;
+    :var gauges: текущие значения по имени метрики и меткам;
+    :var histograms: гистограммы по имени метрики и меткам;
+    :var file: имя файла с метриками в формате JSON Lines;
+    :var interval: задержка между записями метрик в файл (сек.), 0 - метрики
+        в файл не записываются;
+    :var port: порт, по которому выдаются метрики, None - метрики
+        не выдаются;
+    :var start: время начала учета метрик;
+    :var time: время последней записи метрик в файл;
+    :var runner: web-сервер, выдающий метрики.
+    """
+
+    def __init__(self):
+        self.counters: dict[str, dict[tuple, float]] = {}
+        self.gauges: dict[str, dict[tuple, float]] = {}
+        self.histograms: dict[str, dict[tuple, Histogram]] = {}
+        self.file: str | None = None
+        self.interval: float = 0
+        self.port: int | None = None
+        self.start: float = time.monotonic()
+        self.time: float | None = None
+        self.runner: web.AppRunner | None = None
+
+    def count(self, name: str, value: float = 1, **labels) -> None:
+        """
+        Увеличивает счетчик;
+
+        :param name: имя метрики;
+        :param value: приращение;
+        :param labels: метки;
+        :return: None.
+        """
+
+        key = tuple(sorted(labels.items()))
+        counter = self.counters.setdefault(name, {})
+        counter[key] = counter.get(key, 0) + value
+
+    def gauge(self, name: str, value: float, **labels) -> None:
+        """
+        Устанавливает текущее значение;
+
+        :param name: имя метрики;
+        :param value: значение;
+        :param labels: метки;
+        :return: None.
+        """
+
+        self.gauges.setdefault(name, {})[tuple(sorted(labels.items()))] = value
+
+    def observe(self, name: str, value: float, **labels) -> None:
+        """
+        Учитывает значение в гистограмме;
+
+        :param name: имя метрики;
+        :param value: значение;
+        :param labels: метки;
+        :return: None.
+        """
+
+        key = tuple(sorted(labels.items()))
+        histograms = self.histograms.setdefault(name, {})
+
+        if key not in histograms:
+            histograms[key] = Histogram()
+
+        histograms[key].observe(value)
+
+    @staticmethod
+    def labels(key: tuple, extra: str = '') -> str:
+        """
+        Формирует метки в текстовом формате OpenMetrics;
+
+        :param key: метки;
+        :param extra: дополнительная метка в текстовом формате;
+        :return: метки в текстовом формате.
+        """
+
+        pairs = [f'{label}="{value}"' for label, value in key]
+        pairs += [extra] if extra else []
+
+        return '{' + ','.join(pairs) + '}' if pairs else ''
+
+    @staticmethod
+    def text(key: tuple) -> str:
+        """
+        Формирует метки строкой вида "status=200" для записи в формате
+        JSON Lines;
+
+        :param key: метки;
+        :return: метки строкой.
+        """
+
+        return ','.join(f'{label}={value}' for label, value in key)
+
+    @staticmethod
+    def number(value: float) -> str:
+        """
+        Формирует значение в текстовом формате OpenMetrics (бесконечные
+        значения записываются как +Inf и -Inf);
+
+        :param value: значение;
+        :return: значение в текстовом формате.
+        """
+
+        if math.isinf(value):
+            return '+Inf' if value > 0 else '-Inf'
+
+        return str(value)
+
+    def openmetrics(self) -> str:
+        """
+        Формирует метрики в текстовом формате OpenMetrics;
+
+        :return: метрики в текстовом формате.
+        """
+
+        lines = []
+
+        for name, (kind, description) in METRICS.items():
+            metric = f'{PREFIX}_{name}'
+
+            if kind == 'counter' and name in self.counters:
+                lines += [f'# TYPE {metric} counter',
+                          f'# HELP {metric} {description}.']
+                lines += [f'{metric}_total{self.labels(key)} {value}'
+                          for key, value in self.counters[name].items()]
+            elif kind == 'gauge' and name in self.gauges:
+                lines += [f'# TYPE {metric} gauge',
+                          f'# HELP {metric} {description}.']
+                lines += [f'{metric}{self.labels(key)} {self.number(value)}'
+                          for key, value in self.gauges[name].items()]
+            elif kind == 'histogram' and name in self.histograms:
+                lines += [f'# TYPE {metric} histogram',
+                          f'# HELP {metric} {description}.']
+
+                for key, histogram in self.histograms[name].items():
+                    for bound, count in histogram.cumulative().items():
+                        labels = self.labels(key, f'le="{bound}"')
+                        lines.append(f'{metric}_bucket{labels} {count}')
+
+                    lines += [
+                        f'{metric}_sum{self.labels(key)} {histogram.sum}',
+                        f'{metric}_count{self.labels(key)} {histogram.count}'
+                    ]
+
+        lines.append('# EOF')
+
+        return '\n'.join(lines) + '\n'
+
+    def snapshot(self) -> dict:
+        """
+        Формирует текущие значения метрик для записи в формате JSON Lines.
+        Бесконечные текущие значения (например, неограниченная частота
+        запросов) записываются как null;
+
+        :return: текущие значения метрик.
+        """
+
+        text = self.text
+
+        return {
+            'time': datetime.datetime.now().isoformat(timespec='seconds'),
+            'elapsed': round(time.monotonic() - self.start, 3),
+            'counters': {name: {text(key): value
+                                for key, value in values.items()}
+                         for name, values in self.counters.items()},
+            'gauges': {name: {text(key): (value
+                                          if math.isfinite(value)
+                                          else None)
+                              for key, value in values.items()}
+                       for name, values in self.gauges.items()},
+            'histograms': {name: {text(key): histogram.json()
+                                  for key, histogram in values.items()}
+                           for name, values in self.histograms.items()},
+        }
+
+    def dump(self, force: bool = False) -> None:
+        """
+        Дописывает текущие значения метрик в файл в формате JSON Lines,
+        если с момента предыдущей записи прошло не меньше interval секунд;
+
+        :param force: флаг записи независимо от времени предыдущей записи;
+        :return: None.
+        """
+
+        if not self.interval or not self.file:
+            return
+
+        now = time.monotonic()
+
+        if (not force
+                and self.time is not None
+                and now - self.time < self.interval):
+            return
+
+        self.time = now
+
+        with open(fr'{METRICS_PATH}\{self.file}', 'a') as file:
+            file.write(json.dumps(self.snapshot(), ensure_ascii=False) + '\n')
+
+    async def metrics(self, request: web.Request) -> web.Response:
+        """
+        Обрабатывает запрос метрик;
+
+        :param request: запрос;
+        :return: ответ.
+        """
+
+        return web.Response(body=self.openmetrics().encode('utf-8'),
+                            headers={'Content-Type': CONTENT_TYPE})
+
+    async def serve(self) -> None:
+        """
+        Запускает web-сервер, выдающий метрики, если задан порт;
+
+        :return: None.
+        """
+
+        if self.port is None or self.runner is not None:
+            return
+
+        application = web.Application()
+        application.router.add_get('/metrics', self.metrics)
+
+        self.runner = web.AppRunner(application)
+        await self.runner.setup()
+        await web.TCPSite(self.runner, port=self.port).start()
+
+    async def close(self) -> None:
+        """
+        Останавливает web-сервер, выдающий метрики;
+
+        :return: None.
+        """
+
+        if self.runner is not None:
+            await self.runner.cleanup()
+            self.runner = None
+
+    def setting(self,
+                checkpoint: str,
+                interval: float,
+                port: int | None = None) -> None:
+        """
+        Настраивает менеджер. Имя файла с метриками совпадает с именем
+        контрольной точки;
+
+        :param checkpoint: имя файла контрольной точки в формате json;
+        :param interval: задержка между записями метрик в файл (сек.);
+        :param port: порт, по которому выдаются метрики;
+        :return: None.
+        """
+
+        self.file = checkpoint.rsplit('.', 1)[0] + '.jsonl'
+        self.interval = interval
+        self.port = port
+
+    def json(self) -> dict:
+        """
+        Возвращает текущие параметры:
+
+        - metrics: задержка между записями метрик в файл и порт, по которому
+          выдаются метрики;
+
+        :return: текущие параметры.
+        """
+
+        return {'metrics': {'interval': self.interval, 'port': self.port}}
@@ -0,0 +1,332 @@
+import asyncio
+import hashlib
+import json
+import sqlite3
+import time
+import zlib
+
+from concurrent.futures import ThreadPoolExecutor
+
+from config.parser.managers.network.network import CACHE
+from config.paths import CACHE_PATH
+from parser.managers.archive import ArchiveManager
+
+
+class CacheManager(object):
+    """
+    Менеджер кэша, задачами которого являются:
+
+    - хранение на диске тел ответов вместе с заголовками ETag
+      и Last-Modified;
+    - формирование заголовков условного запроса
+      (If-None-Match, If-Modified-Since);
+    - выдача сохраненных ответов без отправки запроса, если они не устарели;
+    - удаление давних ответов при открытии кэша (CACHE);
+
+    Сжатие ответов и операции с базой данных кэша выполняются в отдельном
+    потоке, чтобы не задерживать получение других страниц. Ответы без
+    заголовков ETag и Last-Modified при ttl = 0 не сохраняются: условный
+    запрос для них невозможен, а выдача без запроса отключена. Для ответов,
+    тела которых сохраняются в архив страниц, хранятся только заголовки
+    и хеш тела, а тело читается из архива. Если тела нет в архиве (архив
+    создан заново), ответ запрашивается без условного запроса;
+
+    :var enabled: флаг использования кэша;
+    :var ttl: время (сек.), в течение которого ответ выдается без запроса;
+    :var connection: соединение с базой данных кэша;
+    :var executor: поток, осуществляющий операции с базой данных кэша;
+    :var source: функция, читающая тело ответа из архива страниц по его
+        хешу.
+    """
+
+    def __init__(self):
+        self.enabled: bool = False
+        self.ttl: int = 0
+        self.connection: sqlite3.Connection | None = None
+        self.executor: ThreadPoolExecutor | None = None
+        self.source = None
+
+    @staticmethod
+    def key(link: str, params: dict | None) -> str:
+        """
+        Формирует ключ ответа по адресу и параметрам запроса;
+
+        :param link: адрес запроса;
+        :param params: параметры запроса;
+        :return: ключ ответа.
+        """
+
+        request = json.dumps([link, params or {}], sort_keys=True)
+
+        return hashlib.sha1(request.encode('utf-8')).hexdigest()
+
+    async def execute(self, function, *args):
+        """
+        Выполняет операцию с базой данных кэша в потоке кэша;
+
+        :param function: операция с базой данных кэша;
+        :param args: аргументы операции;
+        :return: результат операции.
+        """
+
+        loop = asyncio.get_running_loop()
+
+        return await loop.run_in_executor(self.executor, function, *args)
+
+    async def get(self, key: str) -> dict | None:
+        """
+        Возвращает сохраненный ответ;
+
+        :param key: ключ ответа;
+        :return: тело ответа, заголовки ETag и Last-Modified, время
+            сохранения или None, если ответ не сохранен.
+        """
+
+        if not self.enabled:
+            return None
+
+        entry = await self.execute(self.select, key)
+
+        if entry is not None and entry['text'] is None:
+            if self.source is not None:
+                entry['text'] = self.source(entry['hash'])
+
+            if entry['text'] is None:
+                return None
+
+        return entry
+
+    def select(self, key: str) -> dict | None:
+        """
+        Читает и распаковывает сохраненный ответ;
+
+        :param key: ключ ответа;
+        :return: тело ответа (None, если хранится только его хеш), хеш тела,
+            заголовки ETag и Last-Modified, время сохранения или None, если
+            ответ не сохранен.
+        """
+
+        row = self.connection.execute(
+            'SELECT body, hash, etag, modified, time '
+            'FROM responses WHERE key = ?',
+            (key,)
+        ).fetchone()
+
+        if row is None:
+            return None
+
+        body, digest, etag, modified, saved = row
+
+        return {
+            'text': (zlib.decompress(body).decode('utf-8')
+                     if body is not None
+                     else None),
+            'hash': digest,
+            'etag': etag,
+            'modified': modified,
+            'time': saved
+        }
+
+    async def put(self,
+                  key: str,
+                  text: str,
+                  etag: str | None,
+                  modified: str | None,
+                  archived: bool = False) -> None:
+        """
+        Сохраняет ответ, если он может быть использован повторно: выдан
+        без запроса (ttl > 0) или подтвержден условным запросом;
+
+        :param key: ключ ответа;
+        :param text: тело ответа;
+        :param etag: заголовок ETag;
+        :param modified: заголовок Last-Modified;
+        :param archived: флаг сохранения тела ответа в архив страниц;
+        :return: None.
+        """
+
+        if not self.enabled or not (self.ttl or etag or modified):
+            return
+
+        await self.execute(self.insert, key, text, etag, modified, archived)
+
+    def insert(self,
+               key: str,
+               text: str,
+               etag: str | None,
+               modified: str | None,
+               archived: bool = False) -> None:
+        """
+        Сжимает и записывает ответ в базу данных кэша. Вместо тела ответа,
+        сохраняемого в архив страниц, записывается его хеш;
+
+        :param key: ключ ответа;
+        :param text: тело ответа;
+        :param etag: заголовок ETag;
+        :param modified: заголовок Last-Modified;
+        :param archived: флаг сохранения тела ответа в архив страниц;
+        :return: None.
+        """
+
+        data = text.encode('utf-8')
+
+        if archived:
+            body, digest = None, ArchiveManager.digest(data)
+        else:
+            body, digest = zlib.compress(data), None
+
+        with self.connection:
+            self.connection.execute(
+                'INSERT OR REPLACE INTO responses '
+                '(key, body, etag, modified, time, hash) '
+                'VALUES (?, ?, ?, ?, ?, ?)',
+                (key, body, etag, modified, time.time(), digest)
+            )
+
+    def purge(self) -> None:
+        """
+        Удаляет ответы, сохраненные более CACHE['age'] секунд назад, и самые
+        давние ответы, если суммарный размер тел ответов превышает
+        CACHE['size'] байт. Освобожденное место используется базой данных
+        кэша повторно;
+
+        :return: None.
+        """
+
+        with self.connection:
+            self.connection.execute(
+                'DELETE FROM responses WHERE time < ?',
+                (time.time() - CACHE['age'],)
+            )
+            self.connection.execute(
+                'DELETE FROM responses WHERE key IN ('
+                'SELECT key FROM ('
+                'SELECT key, SUM(IFNULL(LENGTH(body), 0)) '
+                'OVER (ORDER BY time DESC, key) AS total FROM responses) '
+                'WHERE total > ?)',
+                (CACHE['size'],)
+            )
+
+    async def touch(self, key: str) -> None:
+        """
+        Обновляет время сохранения ответа, подтвержденного сервером (код 304);
+
+        :param key: ключ ответа;
+        :return: None.
+        """
+
+        await self.execute(self.update, key)
+
+    def update(self, key: str) -> None:
+        """
+        Записывает время сохранения ответа в базу данных кэша;
+
+        :param key: ключ ответа;
+        :return: None.
+        """
+
+        with self.connection:
+            self.connection.execute(
+                'UPDATE responses SET time = ? WHERE key = ?',
+                (time.time(), key)
+            )
+
+    def fresh(self, entry: dict) -> bool:
+        """
+        Проверяет, может ли ответ быть выдан без отправки запроса;
+
+        :param entry: сохраненный ответ;
+        :return: True, если ответ не устарел.
+        """
+
+        return time.time() - entry['time'] < self.ttl
+
+    @staticmethod
+    def headers(entry: dict | None) -> dict:
+        """
+        Формирует заголовки условного запроса;
+
+        :param entry: сохраненный ответ;
+        :return: заголовки условного запроса.
+        """
+
+        headers = {}
+
+        if entry is None:
+            return headers
+
+        if entry['etag']:
+            headers['If-None-Match'] = entry['etag']
+        if entry['modified']:
+            headers['If-Modified-Since'] = entry['modified']
+
+        return headers
+
+    def setting(self, cache: bool, ttl: int) -> None:
+        """
+        Настраивает менеджер. При открытии базы данных кэша давние ответы
+        удаляются в потоке кэша до первого обращения к ней;
+
+        :param cache: флаг использования кэша;
+        :param ttl: время (сек.), в течение которого ответ выдается
+            без запроса;
+        :return: None.
+        """
+
+        self.enabled = cache
+        self.ttl = ttl
+
+        if cache and self.connection is None:
+            self.executor = ThreadPoolExecutor(max_workers=1)
+            self.connection = sqlite3.connect(
+                fr'{CACHE_PATH}\responses.sqlite',
+                check_same_thread=False
+            )
+            self.connection.execute(
+                'CREATE TABLE IF NOT EXISTS responses ('
+                'key TEXT PRIMARY KEY, '
+                'body BLOB, '
+                'etag TEXT, '
+                'modified TEXT, '
+                'time REAL, '
+                'hash TEXT)'
+            )
+
+            columns = [column for _, column, *_ in self.connection.execute(
+                'PRAGMA table_info(responses)'
+            )]
+
+            if 'hash' not in columns:
+                self.connection.execute(
+                    'ALTER TABLE responses ADD COLUMN hash TEXT'
+                )
+
+            self.executor.submit(self.purge)
+
+    def close(self) -> None:
+        """
+        Закрывает соединение с базой данных кэша и завершает работу потока
+        кэша;
+
+        :return: None.
+        """
+
+        if self.executor is not None:
+            self.executor.shutdown()
+            self.executor = None
+
+        if self.connection is not None:
+            self.connection.close()
+            self.connection = None
+
+    def json(self) -> dict:
+        """
+        Возвращает текущие параметры:
+
+        - cache: флаг использования кэша;
+        - ttl: время, в течение которого ответ выдается без запроса;
+
+        :return: текущие параметры.
+        """
+
+        return {'cache': self.enabled, 'ttl': self.ttl}
@@ -1,28 +1,80 @@
 import asyncio
-
-from random import uniform
+import email.utils
+import math
+import time
 
 
 class DelayManager(object):
     """
     Менеджер задержки, задачами которого являются:
 
-    - Задержка выполнения программы перед отправкой запроса;
-    - Получение кода статуса отправленного запроса для масштабирования задержки;
-
-    :var span: диапазон задержки;
-    :var factor: масштаб задержки;
-    :var type: тип текущей задержки;
-    :var success: количество отправленных запросов с кодом 200;
-    :var threshold: порог смены типа задержки.
+    - Задержка выполнения программы перед отправкой запроса так, чтобы
+      суммарная частота запросов всех задач не превышала текущую
+      (алгоритм "token bucket");
+    - Получение кода статуса отправленного запроса для масштабирования
+      частоты запросов: аддитивное увеличение после успешных запросов,
+      мультипликативное уменьшение после кодов 429 и 5xx;
+    - Соблюдение заголовка Retry-After;
+
+    :var rates: минимальная и максимальная частота запросов (запр./сек.);
+        максимальная частота None - без ограничения;
+    :var factor: во сколько раз уменьшается частота после кодов 429 и 5xx;
+    :var threshold: количество успешных запросов, за которое частота
+        восстанавливается от минимальной до максимальной;
+    :var burst: максимальное количество запросов, отправляемых без задержки;
+    :var rate: текущая частота запросов (запр./сек.);
+    :var tokens: количество запросов, доступных для отправки без задержки;
+    :var time: время последнего пополнения запросов;
+    :var until: время, до которого запросы не отправляются (Retry-After);
+    :var lock: блокировка, упорядочивающая ожидающие задачи.
     """
 
     def __init__(self):
-        self.span: list[int, int] | None = None
+        self.rates: list[float, float | None] | None = None
         self.factor: int | None = None
-        self.type: str = 'normal'
-        self.success: int = 0
         self.threshold: int | None = None
+        self.burst: int | None = None
+        self.rate: float | None = None
+        self.tokens: float = 0
+        self.time: float | None = None
+        self.until: float = 0
+        self.lock: asyncio.Lock = asyncio.Lock()
+
+    def maximum(self) -> float:
+        """
+        Вычисляет максимальную частоту запросов;
+
+        :return: максимальная частота запросов (запр./сек.).
+        """
+
+        return self.rates[1] if self.rates[1] else float('inf')
+
+    def minimum(self) -> float:
+        """
+        Вычисляет минимальную частоту запросов;
+
+        :return: минимальная частота запросов (запр./сек.).
+        """
+
+        return self.rates[0] if self.rates[0] else self.maximum()
+
+    def refill(self) -> None:
+        """
+        Пополняет запросы, доступные для отправки без задержки, пропорционально
+        времени, прошедшему с момента последнего пополнения;
+
+        :return: None.
+        """
+
+        now = time.monotonic()
+
+        if self.time is None or math.isinf(self.rate):
+            self.tokens = self.burst
+        else:
+            self.tokens += (now - self.time) * self.rate
+            self.tokens = min(self.tokens, self.burst)
+
+        self.time = now
 
     async def delay(self) -> None:
         """
@@ -31,52 +83,111 @@ class DelayManager(object):
         :return: None.
         """
 
-        if self.type == 'normal':
-            span = self.span
-        else:
-            span = [s * self.factor for s in self.span]
+        async with self.lock:
+            while True:
+                if (wait := self.until - time.monotonic()) > 0:
+                    await asyncio.sleep(wait)
+                    continue
+
+                self.refill()
 
-        await asyncio.sleep(uniform(*span))
+                if self.tokens >= 1:
+                    self.tokens -= 1
+                    return
 
-    async def current(self) -> list:
+                await asyncio.sleep((1 - self.tokens) / self.rate)
+
+    async def current(self) -> float:
         """
-        Возвращает тип текущей задержки.
+        Возвращает текущую частоту запросов.
 
-        :return:
+        :return: текущая частота запросов (запр./сек.).
         """
 
-        if self.type == 'normal':
-            return self.span
-        else:
-            return [s * self.factor for s in self.span]
+        return self.rate
 
-    async def code(self, code: int) -> None:
+    async def code(self, code: int, retry: str | None = None) -> None:
         """
-        Получает код статуса отправленного запроса для масштабирования задержки;
+        Получает код статуса отправленного запроса для масштабирования частоты
+        запросов;
 
         :param code: код статуса запроса;
+        :param retry: значение заголовка Retry-After;
         :return: None.
         """
 
-        if code == 429:
-            self.type = 'increased'
-        elif code == 200 and self.type == 'increased':
-            self.success += 1
+        if code == 429 or 500 <= code < 600:
+            self.rate = max(self.rate / self.factor, self.minimum())
+            self.tokens = min(self.tokens, 0)
 
-            if self.success >= self.threshold:
-                self.type = 'normal'
-                self.success = 0
+            if (seconds := self.retry(retry)) is not None:
+                self.until = max(self.until, time.monotonic() + seconds)
+        elif code in (200, 304):
+            increase = (self.maximum() - self.minimum()) / self.threshold
+            self.rate = min(self.rate + increase, self.maximum())
 
-    def setting(self, span: tuple, factor: int, threshold: int) -> None:
+    @staticmethod
+    def retry(value: str | None) -> float | None:
+        """
+        Преобразует значение заголовка Retry-After (количество секунд или дата)
+        в количество секунд;
+
+        :param value: значение заголовка Retry-After;
+        :return: количество секунд или None, если значение некорректно.
+        """
+
+        if not value:
+            return None
+
+        if value.strip().isdigit():
+            return float(value)
+
+        try:
+            date = email.utils.parsedate_to_datetime(value)
+        except (TypeError, ValueError):
+            return None
+
+        return max(date.timestamp() - time.time(), 0)
+
+    def setting(self,
+                rates: tuple,
+                factor: int,
+                threshold: int,
+                burst: int,
+                rate: float | None = None) -> None:
         """
         Настраивает менеджер;
 
-        :param span: диапазон задержки;
+        :param rates: минимальная и максимальная частота запросов;
         :param factor: масштаб задержки;
         :param threshold: порог смены типа задержки;
+        :param burst: максимальное количество запросов без задержки;
+        :param rate: сохраненная частота запросов;
         :return: None.
         """
 
-        self.span = span
+        self.rates = rates
         self.factor = factor
         self.threshold = threshold
+        self.burst = burst
+        self.rate = rate if rate else self.maximum()
+        self.time = None
+
+    def json(self) -> dict:
+        """
+        Возвращает текущие параметры:
+
+        - rates: минимальная и максимальная частота запросов;
+        - factor: масштаб задержки;
+        - threshold: порог смены типа задержки;
+        - burst: максимальное количество запросов без задержки;
+        - rate: текущая частота запросов;
+
+        :return: текущие параметры.
+        """
+
+        return {'rates': self.rates,
+                'factor': self.factor,
+                'threshold': self.threshold,
+                'burst': self.burst,
+                'rate': self.rate}
@@ -1,10 +1,25 @@
+import asyncio
+import time
+import zlib
+
 import aiohttp
 
+from config.parser.managers.network.network import CONNECTOR
 from config.parser.managers.network.network import HEADERS
 from config.parser.managers.network.network import URL
+from parser.managers.metrics import MetricsManager
+from parser.managers.network.cache import CacheManager
 from parser.managers.network.delay import DelayManager
 
 
+try:
+    import brotli
+except ImportError:
+    brotli = None
+
+ENCODINGS = 'gzip, deflate, br' if brotli else 'gzip, deflate'
+
+
 class NetworkManager(object):
     """
     Сетевой менеджер, задачами которого являются:
@@ -12,64 +27,129 @@ class NetworkManager(object):
     - Создание клиентской сессии;
     - Проверка соединения с сервером перед началом сбора данных;
     - Отправление get-запроса по указанному адресу;
-    - учет размера входящего трафика;
+    - учет размера входящего трафика (переданного по сети и распакованного);
+    - согласование сжатия ответов (gzip, deflate, br - если установлен
+      пакет Brotli) и их распаковка;
     - учет статусов отправленных запросов;
+    - учет обращений к кэшу ответов;
     - хранение и выдача адресов страниц для сбора данных;
+    - учет метрик запросов: количества и времени выполнения запросов
+      по коду статуса, времени ожидания перед запросом;
 
-    :var delay: менеджер задержки;
+    :var delay: менеджер задержки (может быть общим для нескольких
+        сетевых менеджеров, которые в этом случае разделяют частоту
+        запросов);
+    :var shared: флаг общего менеджера задержки: он настраивается один
+        раз владельцем, а не каждым сетевым менеджером;
+    :var cache: менеджер кэша;
+    :var metrics: менеджер метрик;
     :var headers: заголовки get-запросов;
-    :var traffic: размер входящего трафика;
+    :var traffic: размер входящего трафика, полученного по сети (network),
+        распакованного (decoded) и выданного из кэша (cache);
     :var url: адрес сайта web-ресурса;
     :var session: клиентская сессия для отправления запросов;
     :var statuses: статусы отправленных запросов;
     """
 
-    def __init__(self):
-        self.delay: DelayManager = DelayManager()
+    def __init__(self,
+                 metrics: MetricsManager | None = None,
+                 delay: DelayManager | None = None):
+        self.delay: DelayManager = delay or DelayManager()
+        self.shared: bool = delay is not None
+        self.cache: CacheManager = CacheManager()
+        self.metrics: MetricsManager = metrics or MetricsManager()
 
         self.headers: dict = HEADERS
-        self.traffic: int = 0
+        self.traffic: dict = {
+            "network": 0,
+            "decoded": 0,
+            "cache": 0
+        }
         self.url: str = URL
         self.session: aiohttp.ClientSession | None = None
         self.statuses: dict = {
             "successful": 0,
-            "failed": {}
+            "failed": {},
+            "cache": {"hit": 0, "miss": 0, "not modified": 0}
         }
 
     async def connect(self) -> int:
         """
-        Создает экземпляр клиентской сессии ClientSession. Проверяет соединение
-        с сервером перед началом сбора данных;
+        Создает экземпляр клиентской сессии ClientSession с пулом соединений,
+        удерживающим неактивные соединения и кэширующим результаты
+        DNS-запросов. Ответы распаковываются менеджером, чтобы учитывать
+        размер трафика до и после распаковки. Проверяет соединение с сервером
+        перед началом сбора данных;
 
         :return: код статуса ответа на запрос.
         """
 
+        connector = aiohttp.TCPConnector(use_dns_cache=True, **CONNECTOR)
+
         self.session = aiohttp.ClientSession(
-            headers=self.headers
+            connector=connector,
+            headers=self.headers | {'Accept-Encoding': ENCODINGS},
+            auto_decompress=False
         )
 
         async with self.session.get(self.url) as response:
             return response.status
 
-    async def get(self, link: str, params: dict = None) -> dict:
+    async def get(self,
+                  link: str,
+                  params: dict = None,
+                  delay: DelayManager | None = None,
+                  archived: bool = False) -> dict:
         """
         Отправляет get-запрос по указанному адресу. Учитывает размер входящего
-        трафика и статусы отправленных запросов;
+        трафика, статусы и время выполнения отправленных запросов
+        (код 0 - ошибка соединения). Если ответ сохранен в кэше,
+        отправляет условный запрос, а ответ с кодом 304 выдает из кэша.
+        Запрос, для которого передан собственный менеджер задержки
+        (например, доля частоты запросов страниц видеоигр), ожидает
+        и его, и общий менеджер задержки. Код статуса передается обоим,
+        поэтому код 429 или заголовок Retry-After замедляют все запросы
+        к серверу;
 
         :param link: адрес, по которому будет отправлен запрос;
         :param params: параметры запроса;
+        :param delay: собственный менеджер задержки запроса;
+        :param archived: флаг сохранения тела ответа в архив страниц: кэш
+            хранит только его хеш;
         :return: код статуса запроса, текст тела запроса.
         """
 
-        await self.delay.delay()
+        delays = [self.delay] if delay is None else [delay, self.delay]
+
+        key = self.cache.key(link, params)
+        entry = await self.cache.get(key)
+
+        if entry is not None and self.cache.fresh(entry):
+            self.statuses["cache"]["hit"] += 1
+            self.traffic["cache"] += len(entry['text'])
+            self.metrics.count('cache', result='hit')
+            return {'code': 200, 'text': entry['text']}
+
+        start = time.perf_counter()
+        for manager in delays:
+            await manager.delay()
+        self.metrics.observe('delay_seconds', time.perf_counter() - start)
+
+        code, start = 0, time.perf_counter()
 
         try:
-            async with self.session.get(link, params=params) as response:
+            async with self.session.get(
+                    link,
+                    params=params,
+                    headers=self.cache.headers(entry)
+            ) as response:
                 code = response.status
+                retry = response.headers.get('Retry-After')
 
-                await self.delay.code(code)
+                for manager in delays:
+                    await manager.code(code, retry)
 
-                if code == 200:
+                if code in (200, 304):
                     self.statuses["successful"] += 1
                 else:
                     if code in self.statuses["failed"]:
@@ -77,41 +157,128 @@ class NetworkManager(object):
                     else:
                         self.statuses["failed"][code] = 1
 
+                if code == 304 and entry is not None:
+                    self.statuses["cache"]["not modified"] += 1
+                    self.traffic["cache"] += len(entry['text'])
+                    self.metrics.count('cache', result='not modified')
+                    await self.cache.touch(key)
+                    return {'code': 200, 'text': entry['text']}
+
                 if code != 404:
-                    self.traffic += int(response
-                                        .headers
-                                        .get('Content-Length', 0))
-                    return {'code': code, 'text': await response.text()}
+                    body = await response.read()
+                    data = self.decompress(
+                        body=body,
+                        encoding=response.headers.get('Content-Encoding')
+                    )
+                    text = data.decode(response.charset or 'utf-8',
+                                       errors='replace')
+
+                    self.traffic["network"] += len(body)
+                    self.traffic["decoded"] += len(data)
+                    self.metrics.count('received_bytes', len(body),
+                                       encoding='network')
+                    self.metrics.count('received_bytes', len(data),
+                                       encoding='decoded')
+
+                    if code == 200:
+                        self.statuses["cache"]["miss"] += 1
+                        self.metrics.count('cache', result='miss')
+                        await self.cache.put(
+                            key=key,
+                            text=text,
+                            etag=response.headers.get('ETag'),
+                            modified=response.headers.get('Last-Modified'),
+                            archived=archived
+                        )
+
+                    return {'code': code, 'text': text}
                 else:
                     return {'code': code, 'text': ''}
-        except aiohttp.ClientConnectorError:
-            return {'code': 0, 'text': ''}
+        except (aiohttp.ClientError, asyncio.TimeoutError, zlib.error):
+            code = 0
+            return {'code': code, 'text': ''}
+        finally:
+            elapsed = time.perf_counter() - start
+            self.metrics.count('requests', status=code)
+            self.metrics.observe('request_seconds', elapsed, status=code)
 
-    def setting(self, span: tuple, factor: int, threshold: int) -> None:
+    @staticmethod
+    def decompress(body: bytes, encoding: str | None) -> bytes:
         """
-        Настраивает менеджер;
+        Распаковывает тело ответа в соответствии с заголовком
+        Content-Encoding;
 
-        :param span: диапазон задержки;
+        :param body: тело ответа, полученное по сети;
+        :param encoding: значение заголовка Content-Encoding;
+        :return: распакованное тело ответа.
+        """
+
+        encoding = (encoding or '').strip().lower()
+
+        if encoding == 'gzip':
+            body = zlib.decompress(body, 16 + zlib.MAX_WBITS)
+        elif encoding == 'deflate':
+            try:
+                body = zlib.decompress(body)
+            except zlib.error:
+                body = zlib.decompress(body, -zlib.MAX_WBITS)
+        elif encoding == 'br' and brotli is not None:
+            body = brotli.decompress(body)
+
+        return body
+
+    async def disconnect(self) -> None:
+        """
+        Закрывает клиентскую сессию и соединение с базой данных кэша;
+
+        :return: None.
+        """
+
+        await self.session.close()
+
+        self.cache.close()
+
+    def setting(self,
+                rates: tuple,
+                factor: int,
+                threshold: int,
+                burst: int,
+                cache: bool,
+                ttl: int,
+                rate: float | None = None) -> None:
+        """
+        Настраивает менеджер. Общий менеджер задержки не перенастраивается:
+        частота запросов, сниженная после кодов 429 и 5xx запросами других
+        сетевых менеджеров, сохраняется;
+
+        :param rates: минимальная и максимальная частота запросов;
         :param factor: масштаб задержки;
         :param threshold: порог смены типа задержки;
+        :param burst: максимальное количество запросов без задержки;
+        :param cache: флаг использования кэша;
+        :param ttl: время, в течение которого ответ выдается без запроса;
+        :param rate: сохраненная частота запросов;
         :return: None.
         """
 
-        self.delay.span = span
-        self.delay.factor = factor
-        self.delay.threshold = threshold
+        if not self.shared:
+            self.delay.setting(rates, factor, threshold, burst, rate)
+
+        self.cache.setting(cache, ttl)
 
     def json(self) -> dict:
         """
-        Возвращает текущие параметры:
+        Возвращает текущие параметры менеджеров задержки и кэша:
 
-        - span: Диапазон задержки;
+        - rates: Минимальная и максимальная частота запросов;
         - factor: Масштаб задержки;
-        - threshold: Порог смены типа задержки.
+        - threshold: Порог смены типа задержки;
+        - burst: Максимальное количество запросов без задержки;
+        - rate: Текущая частота запросов;
+        - cache: Флаг использования кэша;
+        - ttl: Время, в течение которого ответ выдается без запроса.
 
         :return: Текущие параметры.
         """
 
-        return {'span': self.delay.span,
-                'factor': self.delay.factor,
-                'threshold': self.delay.threshold}
+        return self.delay.json() | self.cache.json()
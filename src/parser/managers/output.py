@@ -1,5 +1,9 @@
 import asyncio
+import itertools
 import os
+import sys
+
+from config.parser.managers.output import HEARTBEAT
 
 
 class ProgressBar(object):
@@ -40,25 +44,94 @@ class ProgressBar(object):
                 f'({self.current} из {self.maximum}) - {h:02} час. {m:02} мин.')
 
 
+class Screen(object):
+    """
+    Экран терминала, на котором текст перерисовывается на месте
+    управляющими последовательностями ANSI: после первого вывода
+    перерисовываются только изменившиеся строки. Если вывод
+    перенаправлен в файл, текст выводится целиком;
+
+    :var stream: поток вывода;
+    :var lines: строки, выведенные на экран.
+    """
+
+    def __init__(self, stream=sys.stdout):
+        self.stream = stream
+        self.lines: list[str] = []
+
+        # Включает обработку управляющих последовательностей ANSI
+        # в консоли Windows.
+        if os.name == 'nt':
+            os.system('')
+
+    def render(self, text: str) -> None:
+        """
+        Выводит текст на экран, перерисовывая только строки, которые
+        отличаются от выведенных ранее;
+
+        :param text: текст;
+        :return: None.
+        """
+
+        lines = text.split('\n')
+
+        if not self.stream.isatty():
+            self.stream.write(text + '\n\n')
+        elif not self.lines:
+            self.stream.write('\x1b[2J\x1b[H' + text + '\n')
+        else:
+            output = [f'\x1b[{row};1H{line}\x1b[K'
+                      for row, (line, previous)
+                      in enumerate(itertools.zip_longest(lines, self.lines), 1)
+                      if line != previous and line is not None]
+            output += [f'\x1b[{row};1H\x1b[K'
+                       for row in range(len(lines) + 1, len(self.lines) + 1)]
+            output += [f'\x1b[{len(lines) + 1};1H']
+
+            self.stream.write(''.join(output))
+
+        self.stream.flush()
+        self.lines = lines
+
+    def reset(self) -> None:
+        """
+        Сбрасывает выведенные строки: следующий вывод очищает экран
+        и выводит текст целиком;
+
+        :return: None.
+        """
+
+        self.lines = []
+
+
 class OutputManager(object):
     """
     Менеджер вывода, задачами которого являются:
 
     - отображение текущего состояния сбора данных;
+    - ожидание событий, после которых состояние обновляется (завершение
+      страницы), но не чаще одного раза в timeout секунд;
+
+    В режиме без вывода (headless) состояние не формируется
+    и не отображается;
 
     :var passed: пройденное времени с момента начала сора данных;
     :var timeout: задержка между выводами текущего состояния;
+    :var headless: флаг режима без вывода;
     :var states: состояния менеджеров для отображения на экране;
-    :var stopped: флаг остановки вывода данных;
-    :var total: прогресс сбора всех данных.
+    :var total: прогресс сбора всех данных;
+    :var screen: экран терминала;
+    :var event: событие, после которого состояние обновляется.
     """
 
     def __init__(self):
         self.passed: float | None = None
         self.timeout: int | None = None
+        self.headless: bool = False
         self.states: dict = {}
-        self.stopped: bool = False
         self.total: ProgressBar = ProgressBar()
+        self.screen: Screen = Screen()
+        self.event: asyncio.Event = asyncio.Event()
 
     async def file(self, file: str, size: int, records: int) -> None:
         """
@@ -76,13 +149,17 @@ class OutputManager(object):
             f'Количество записей: {records:15}.'
         )
 
-    async def network(self, statuses: dict, traffic: int, span: list) -> None:
+    async def network(self,
+                      statuses: dict,
+                      traffic: dict,
+                      rate: float) -> None:
         """
         Получает данные и формирует состояние сетевого менеджера;
 
-        :param statuses: статусы отправленных запросов;
-        :param traffic: размер входящего трафика;
-        :param span: диапазон задержки;
+        :param statuses: статусы отправленных запросов и обращений к кэшу;
+        :param traffic: размер входящего трафика (по сети, распакованного
+            и из кэша);
+        :param rate: текущая частота запросов (запр./сек.);
         :return: None.
         """
 
@@ -92,16 +169,23 @@ class OutputManager(object):
 
         total = statuses["successful"]
         total += sum(statuses["failed"].values())
-        spans = f'{span[0]} - {span[1]}'
+        rate = rate * 60
+        cache = statuses["cache"]
 
         self.states['network'] = (
-            f'Входящий трафик: {traffic / 2 ** 10:15.2f} KB.\n'
-            f'Задержка: {spans:>21} сек.\n'
+            f'Входящий трафик: {traffic["network"] / 2 ** 10:15.2f} KB.\n'
+            f'После распаковки: {traffic["decoded"] / 2 ** 10:14.2f} KB.\n'
+            f'Трафик из кэша: {traffic["cache"] / 2 ** 10:16.2f} KB.\n'
+            f'Частота запросов: {rate:12.2f} запр./мин.\n'
             f'Коды статусов отправленных запросов:\n'
             f'{"Успешно":10} {statuses["successful"]:24};\n'
             f'{"Неуспешно":10} {sum(statuses["failed"].values()):24};\n'
             f'{failed}'
-            f'{"Всего":10} {total:24}.'
+            f'{"Всего":10} {total:24}.\n'
+            f'Обращения к кэшу:\n'
+            f'{"Выдано":10} {cache["hit"]:24};\n'
+            f'{"Загружено":10} {cache["miss"]:24};\n'
+            f'{"Код 304":10} {cache["not modified"]:24}.'
         )
 
     async def parsing(self, success: dict, failed: dict) -> None:
@@ -131,7 +215,8 @@ class OutputManager(object):
                        passed: float,
                        finish: list,
                        speed: float,
-                       interval: int) -> None:
+                       interval: int,
+                       dead: int) -> None:
         """
         Получает данные и формирует состояние менеджера прогресса;
 
@@ -139,6 +224,7 @@ class OutputManager(object):
         :param finish: количество завершенных страниц;
         :param speed: текущая скорость обработки 1 страницы (стр./мин.);
         :param interval: время обработки 1 страницы (мин.);
+        :param dead: количество страниц, которые не удалось получить;
         :return: None.
         """
 
@@ -161,56 +247,91 @@ class OutputManager(object):
         self.states['progress'] = (
             f'Скорость обработки: {speed:9.2f} стр./мин.\n'
             f'Время обработки: {interval:12} сек./стр.\n'
+            f'Недоставленные страницы: {dead:4} стр.\n'
             f'{releases}\n\n'
             f'Всего: {self.total}'
         )
 
-    def setting(self, timeout: int) -> None:
+    def setting(self, timeout: int, headless: bool = False) -> None:
         """
         Настраивает менеджер;
 
         :param timeout: задержка между выводами текущего состояния;
+        :param headless: флаг режима без вывода;
         :return: None.
         """
 
         self.timeout = timeout
+        self.headless = headless
 
-    async def state(self, repeat: bool = False) -> None:
+    async def state(self) -> None:
         """
         Отображает текущее состояние сбора данных;
 
-        :param repeat: повтор вывода текущего состояния;
         :return: None.
         """
 
-        while not self.stopped:
-            s = self.passed
-            h, m, s = int(s // 3600), int(s % 3600 // 60), int(s % 3600 % 60)
+        if self.headless:
+            return
+
+        s = self.passed or 0
+        h, m, s = int(s // 3600), int(s % 3600 // 60), int(s % 3600 % 60)
+
+        states = '\n\n'.join(self.states.values())
+
+        state = (
+            f'Время выполнения: {h:02} час. {m:02} мин. {s:02} сек.\n'
+            f'\n'
+            f'{states}'
+        )
 
-            states = '\n\n'.join(self.states.values())
+        self.screen.render(state)
+
+    def clear(self) -> None:
+        """
+        Очищает экран перед следующим отображением текущего состояния;
+
+        :return: None.
+        """
 
-            state = (
-                f'Время выполнения: {h:02} час. {m:02} мин. {s:02} сек.\n'
-                f'\n'
-                f'{states}'
-            )
+        self.screen.reset()
 
-            os.system('cls')
+    def notify(self) -> None:
+        """
+        Сообщает о событии, после которого состояние обновляется;
+
+        :return: None.
+        """
+
+        self.event.set()
+
+    async def wait(self) -> None:
+        """
+        Дожидается следующего события, но не менее timeout секунд после
+        предыдущего обновления состояния. Если событий нет (например,
+        запросы приостановлены), состояние обновляется не реже одного раза
+        в HEARTBEAT секунд;
+
+        :return: None.
+        """
 
-            print(state, flush=True)
+        await asyncio.sleep(self.timeout)
 
-            if not repeat:
-                break
+        try:
+            await asyncio.wait_for(self.event.wait(), HEARTBEAT)
+        except asyncio.TimeoutError:
+            pass
 
-            await asyncio.sleep(self.timeout)
+        self.event.clear()
 
     def json(self) -> dict:
         """
         Возвращает текущие параметры:
 
         - timeout: задержка между выводами текущего состояния;
+        - headless: флаг режима без вывода;
 
         :return: Текущие параметры.
         """
 
-        return {'timeout': self.timeout}
+        return {'timeout': self.timeout, 'headless': self.headless}
@@ -1,9 +1,183 @@
-import datetime
+import asyncio
+import functools
+import os
+import sys
+import time
+import zlib
 
-from bs4 import BeautifulSoup
+from concurrent.futures import ProcessPoolExecutor
 
+from config.parser.managers.file import FIELD_TYPES
+from config.parser.managers.parsing import COLUMNS
 from config.parser.managers.parsing import PARSING_FIELDS
+from parser.backends.backend import Backend
+from parser.backends.soup import SoupBackend
+from parser.backends.xpath import XPathBackend
+from parser.converters import CONVERTERS
 from parser.game import Game
+from parser.managers.metrics import MetricsManager
+
+
+BACKENDS = {
+    'bs4': SoupBackend,
+    'lxml': XPathBackend,
+}
+
+SOURCES = [
+    (COLUMNS[field]['index'], COLUMNS[field]['source'])
+    for field in PARSING_FIELDS
+]
+
+TYPES = [CONVERTERS[COLUMNS[field]['type']] for field in PARSING_FIELDS]
+
+# Номера категориальных полей: значения повторяются во многих строках
+# (платформа, издатель, разработчик), поэтому хранятся интернированными.
+CATEGORIES = [index for index, field in enumerate(PARSING_FIELDS)
+              if FIELD_TYPES[field] == 'category']
+
+
+@functools.cache
+def backend(engine: str) -> Backend:
+    """
+    Создает движок парсинга. Движок создается один раз в каждом процессе;
+
+    :param engine: название движка парсинга;
+    :return: движок парсинга.
+    """
+
+    return BACKENDS[engine]()
+
+
+def intern(row: list) -> list:
+    """
+    Заменяет значения категориальных полей интернированными строками,
+    чтобы одинаковые значения разных строк хранились в памяти один раз;
+
+    :param row: значения полей строки таблицы;
+    :return: значения полей строки таблицы.
+    """
+
+    for index in CATEGORIES:
+        if row[index] is not None:
+            row[index] = sys.intern(row[index])
+
+    return row
+
+
+def extract(text: str, engine: str) -> tuple[list[Game], list, list]:
+    """
+    Осуществляет парсинг основных данных. Может выполняться как в текущем
+    процессе, так и в процессе-обработчике;
+
+    :param text: данные для парсинга;
+    :param engine: название движка парсинга;
+    :return: видеоигры в каждой строке таблицы, количество успешно
+        и неуспешно спарсенных значений каждого поля.
+    """
+
+    rows = []
+    success = [0] * len(PARSING_FIELDS)
+    failed = [0] * len(PARSING_FIELDS)
+
+    for values in backend(engine).extract(text, SOURCES):
+        row = []
+
+        columns = zip(TYPES, values, strict=True)
+
+        for i, (converter, value) in enumerate(columns):
+            try:
+                if value is None:
+                    raise ValueError(PARSING_FIELDS[i])
+
+                row.append(converter(value))
+                success[i] += 1
+            except (AttributeError, ValueError, IndexError, TypeError):
+                row.append(None)
+                failed[i] += 1
+
+        rows.append(Game._make(intern(row)))
+
+    return rows, success, failed
+
+
+def unpack(body: bytes, engine: str) -> tuple[list[Game], list, list]:
+    """
+    Осуществляет парсинг основных данных страницы из архива страниц.
+    Процессу-обработчику передается сжатое тело страницы, поэтому
+    распаковка тоже выполняется в нем;
+
+    :param body: тело страницы, сжатое zlib;
+    :param engine: название движка парсинга;
+    :return: видеоигры в каждой строке таблицы, количество успешно
+        и неуспешно спарсенных значений каждого поля.
+    """
+
+    return extract(zlib.decompress(body).decode('utf-8'), engine)
+
+
+def number(text: str, engine: str, results: int) -> int:
+    """
+    Осуществляет парсинг номера последней страницы. Может выполняться как
+    в текущем процессе, так и в процессе-обработчике;
+
+    :param text: данные для парсинга;
+    :param engine: название движка парсинга;
+    :param results: количество записей на странице;
+    :return: номер последней страницы.
+    """
+
+    number = backend(engine).total(text)
+
+    number = (number
+              .split()[1]
+              .replace('(', '')
+              .replace(')', '')
+              .replace(',', ''))
+
+    number = (int(number) // results
+              if int(number) % results == 0
+              else int(number) // results + 1)
+
+    return number
+
+
+def count(text: str, engine: str) -> int:
+    """
+    Подсчитывает количество записей на странице. Может выполняться как
+    в текущем процессе, так и в процессе-обработчике;
+
+    :param text: данные для парсинга;
+    :param engine: название движка парсинга;
+    :return: количество записей.
+    """
+
+    return len(backend(engine).rows(text))
+
+
+def platforms(text: str, engine: str) -> list[str]:
+    """
+    Осуществляет парсинг игровых платформ в фильтре каталога. Может
+    выполняться как в текущем процессе, так и в процессе-обработчике;
+
+    :param text: данные для парсинга;
+    :param engine: название движка парсинга;
+    :return: значения фильтра игровых платформ.
+    """
+
+    return backend(engine).platforms(text)
+
+
+def details(text: str, engine: str) -> dict:
+    """
+    Осуществляет парсинг атрибутов видеоигры на ее странице. Может
+    выполняться как в текущем процессе, так и в процессе-обработчике;
+
+    :param text: данные для парсинга;
+    :param engine: название движка парсинга;
+    :return: атрибуты видеоигры.
+    """
+
+    return backend(engine).details(text)
 
 
 class ParsingManager(object):
@@ -12,417 +186,172 @@ class ParsingManager(object):
 
     - парсинг полученных данных;
     - учет успешно и неуспешно спарсенных данных;
+    - учет метрик парсинга: времени парсинга страницы и количества строк;
 
     :var success: успешно спарсенные данные;
-    :var failed: неуспешно спарсенные данные.
+    :var failed: неуспешно спарсенные данные;
+    :var engine: название движка парсинга;
+    :var pool: флаг парсинга в пуле процессов;
+    :var results: количество записей на странице;
+    :var executor: пул процессов-обработчиков;
+    :var metrics: менеджер метрик.
     """
 
-    def __init__(self):
+    def __init__(self, metrics: MetricsManager | None = None):
         self.success: dict[str: int] = {field: 0 for field in PARSING_FIELDS}
         self.failed: dict[str: int] = {field: 0 for field in PARSING_FIELDS}
+        self.engine: str | None = None
+        self.pool: bool = False
+        self.results: int | None = None
+        self.executor: ProcessPoolExecutor | None = None
+        self.metrics: MetricsManager = metrics or MetricsManager()
 
     async def parse(self, table: str) -> list[Game]:
         """
-        Осуществляет парсинг основных данных;
+        Осуществляет парсинг основных данных. Строки, полученные
+        из процесса-обработчика, восстанавливаются из pickle заново,
+        поэтому значения категориальных полей интернируются повторно;
 
         :param table: данные для парсинга;
-        :return: None.
+        :return: видеоигры, размещенные на странице.
         """
 
-        games = []
-
-        soup = BeautifulSoup(table, 'html.parser')
-        rows = (soup
-                .find('div', id='generalBody')
-                .find('table')
-                .find_all('tr')[3:])
-
-        for row in rows:
-            game = Game()
-            game.name = await self.name(row)
-            game.platform = await self.platform(row)
-            game.publisher = await self.publisher(row)
-            game.developer = await self.developer(row)
-            game.vgc = await self.vgc(row)
-            game.critic = await self.critic(row)
-            game.user = await self.user(row)
-            game.shipped = await self.shipped(row)
-            game.total = await self.total(row)
-            game.america = await self.america(row)
-            game.europe = await self.europe(row)
-            game.japan = await self.japan(row)
-            game.other = await self.other(row)
-            game.date = await self.date(row)
-
-            games.append(game)
-
-        return games
-
-    async def name(self, soup: BeautifulSoup) -> str | None:
-        """
-        Осуществляет парсинг названия видеоигры;
+        start = time.perf_counter()
+        rows, success, failed = await self.execute(extract, table)
 
-        :param soup: объект BeautifulSoup;
-        :return: название видеоигры.
-        """
+        self.metrics.observe('parse_seconds', time.perf_counter() - start,
+                             backend=self.engine)
+        self.metrics.count('parsed_rows', len(rows))
 
-        try:
-            name = (soup
-                    .find_all('td')[2]
-                    .find('a')
-                    .text
-                    .strip())
-
-            self.success['name'] += 1
-            return name
-        except AttributeError:
-            self.failed['name'] += 1
-        except ValueError:
-            self.failed['name'] += 1
-        except IndexError:
-            self.failed['name'] += 1
-
-    async def platform(self, soup: BeautifulSoup) -> str | None:
-        """
-        Осуществляет парсинг игровой платформы;
+        self.merge(success, failed)
 
-        :param soup: объект BeautifulSoup;
-        :return: название видеоигры.
-        """
+        if self.executor is not None:
+            rows = [Game._make(intern([*game])) for game in rows]
 
-        try:
-            platform = (soup
-                        .find_all('td')[3]
-                        .find('img')['alt'])
-            self.success['platform'] += 1
-
-            return platform
-        except AttributeError:
-            self.failed['platform'] += 1
-        except ValueError:
-            self.failed['platform'] += 1
-        except IndexError:
-            self.failed['platform'] += 1
-
-    async def publisher(self, soup: BeautifulSoup) -> str | None:
-        """
-        Осуществляет парсинг издателя;
+        return rows
 
-        :param soup: объект BeautifulSoup;
-        :return: издатель.
+    async def page(self, text: str) -> int:
         """
+        Осуществляет парсинг номера последней страницы;
 
-        try:
-            publisher = (soup
-                         .find_all('td')[4]
-                         .text
-                         .strip())
-
-            self.success['publisher'] += 1
-            return publisher
-        except AttributeError:
-            self.failed['publisher'] += 1
-        except ValueError:
-            self.failed['publisher'] += 1
-        except IndexError:
-            self.failed['publisher'] += 1
-
-    async def developer(self, soup: BeautifulSoup) -> str | None:
+        :param text: данные для парсинга;
+        :return: номер последней страницы;
         """
-        Осуществляет парсинг разработчика;
 
-        :param soup: объект BeautifulSoup;
-        :return: разработчик.
-        """
+        return await self.execute(
+            functools.partial(number, results=self.results),
+            text
+        )
 
-        try:
-            developer = (soup
-                         .find_all('td')[5]
-                         .text
-                         .strip())
-
-            self.success['developer'] += 1
-            return developer
-        except AttributeError:
-            self.failed['developer'] += 1
-        except ValueError:
-            self.failed['developer'] += 1
-        except IndexError:
-            self.failed['developer'] += 1
-
-    async def vgc(self, soup: BeautifulSoup) -> float | None:
+    async def count(self, text: str) -> int:
         """
-        Осуществляет парсинг оценки VGChartz.com;
+        Подсчитывает количество записей на странице;
 
-        :param soup: объект BeautifulSoup;
-        :return: оценка VGChartz.com.
+        :param text: данные для парсинга;
+        :return: количество записей.
         """
 
-        try:
-            vgc = (soup
-                   .find_all('td')[6]
-                   .text)
-            vgc = round(float(vgc), 1)
-
-            self.success['vgc'] += 1
-            return vgc
-        except AttributeError:
-            self.failed['vgc'] += 1
-        except ValueError:
-            self.failed['vgc'] += 1
-        except IndexError:
-            self.failed['vgc'] += 1
-
-    async def critic(self, soup: BeautifulSoup) -> float | None:
-        """
-        Осуществляет парсинг оценки критиков;
+        return await self.execute(count, text)
 
-        :param soup: объект BeautifulSoup;
-        :return: оценка критиков.
+    async def platforms(self, text: str) -> list[str]:
         """
+        Осуществляет парсинг игровых платформ в фильтре каталога;
 
-        try:
-            critic = (soup
-                      .find_all('td')[7]
-                      .text)
-            critic = round(float(critic), 1)
-
-            self.success['critic'] += 1
-            return critic
-        except AttributeError:
-            self.failed['critic'] += 1
-        except ValueError:
-            self.failed['critic'] += 1
-        except IndexError:
-            self.failed['critic'] += 1
-
-    async def user(self, soup: BeautifulSoup) -> float | None:
+        :param text: данные для парсинга;
+        :return: значения фильтра игровых платформ.
         """
-        Осуществляет парсинг оценки пользователей;
 
-        :param soup: объект BeautifulSoup;
-        :return: оценка пользователей.
-        """
+        return await self.execute(platforms, text)
 
-        try:
-            user = (soup
-                    .find_all('td')[8]
-                    .text)
-            user = round(float(user), 1)
-
-            self.success['user'] += 1
-            return user
-        except AttributeError:
-            self.failed['user'] += 1
-        except ValueError:
-            self.failed['user'] += 1
-        except IndexError:
-            self.failed['user'] += 1
-
-    async def shipped(self, soup: BeautifulSoup) -> float | None:
+    async def details(self, text: str) -> dict:
         """
-        Осуществляет парсинг количества отданных копий;
+        Осуществляет парсинг атрибутов видеоигры на ее странице;
 
-        :param soup: объект BeautifulSoup;
-        :return: количество отданных копий.
+        :param text: данные для парсинга;
+        :return: атрибуты видеоигры.
         """
 
-        try:
-            shipped = (soup
-                       .find_all('td')[9]
-                       .text)
-            shipped = float(shipped.replace('m', ''))
-
-            self.success['shipped'] += 1
-            return shipped
-        except AttributeError:
-            self.failed['shipped'] += 1
-        except ValueError:
-            self.failed['shipped'] += 1
-        except IndexError:
-            self.failed['shipped'] += 1
-
-    async def total(self, soup: BeautifulSoup) -> float | None:
-        """
-        Осуществляет парсинг общего количество проданных копий;
+        return await self.execute(details, text)
 
-        :param soup: объект BeautifulSoup;
-        :return: общее количество проданных копий.
+    async def execute(self, function, text: str):
         """
+        Выполняет парсинг в пуле процессов-обработчиков, если он создан,
+        иначе - в текущем процессе;
 
-        try:
-            total = (soup
-                     .find_all('td')[10]
-                     .text)
-            total = float(total.replace('m', ''))
-
-            self.success['total'] += 1
-            return total
-        except AttributeError:
-            self.failed['total'] += 1
-        except ValueError:
-            self.failed['total'] += 1
-        except IndexError:
-            self.failed['total'] += 1
-
-    async def america(self, soup: BeautifulSoup) -> float | None:
+        :param function: функция парсинга;
+        :param text: данные для парсинга;
+        :return: результат функции парсинга.
         """
-        Осуществляет парсинг количества проданных копий в Америке;
 
-        :param soup: объект BeautifulSoup;
-        :return: количество проданных копий в Америке.
-        """
+        if self.executor is None:
+            return function(text, self.engine)
 
-        try:
-            america = (soup
-                       .find_all('td')[11]
-                       .text)
-            america = float(america.replace('m', ''))
-
-            self.success['america'] += 1
-            return america
-        except AttributeError:
-            self.failed['america'] += 1
-        except ValueError:
-            self.failed['america'] += 1
-        except IndexError:
-            self.failed['america'] += 1
-
-    async def europe(self, soup: BeautifulSoup) -> float | None:
-        """
-        Осуществляет парсинг количества проданных копий в Европе;
+        loop = asyncio.get_running_loop()
 
-        :param soup: объект BeautifulSoup;
-        :return: количество проданных копий в Европе.
-        """
+        return await loop.run_in_executor(
+            self.executor,
+            function,
+            text,
+            self.engine
+        )
 
-        try:
-            europe = (soup
-                      .find_all('td')[12]
-                      .text)
-            europe = float(europe.replace('m', ''))
-
-            self.success['europe'] += 1
-            return europe
-        except AttributeError:
-            self.failed['europe'] += 1
-        except ValueError:
-            self.failed['europe'] += 1
-        except IndexError:
-            self.failed['europe'] += 1
-
-    async def japan(self, soup: BeautifulSoup) -> float | None:
+    def merge(self, success: list, failed: list) -> None:
         """
-        Осуществляет парсинг количества проданных копий в Японии;
+        Учитывает количество успешно и неуспешно спарсенных значений,
+        полученных от функции парсинга;
 
-        :param soup: объект BeautifulSoup;
-        :return: количество проданных копий в Японии.
+        :param success: количество успешно спарсенных значений каждого поля;
+        :param failed: количество неуспешно спарсенных значений каждого поля;
+        :return: None.
         """
 
-        try:
-            japan = (soup
-                     .find_all('td')[13]
-                     .text)
-            japan = float(japan.replace('m', ''))
-
-            self.success['japan'] += 1
-            return japan
-        except AttributeError:
-            self.failed['japan'] += 1
-        except ValueError:
-            self.failed['japan'] += 1
-        except IndexError:
-            self.failed['japan'] += 1
-
-    async def other(self, soup: BeautifulSoup) -> float | None:
-        """
-        Осуществляет парсинг количества проданных копий в остальном мире;
+        for field, s, f in zip(PARSING_FIELDS, success, failed,
+                               strict=True):
+            self.success[field] += s
+            self.failed[field] += f
 
-        :param soup: объект BeautifulSoup;
-        :return: количество проданных копий в Океании.
+    def setting(self, backend: str, pool: bool, results: int) -> None:
         """
+        Настраивает менеджер;
 
-        try:
-            other = (soup
-                     .find_all('td')[14]
-                     .text)
-            other = float(other.replace('m', ''))
-
-            self.success['other'] += 1
-            return other
-        except AttributeError:
-            self.failed['other'] += 1
-        except ValueError:
-            self.failed['other'] += 1
-        except IndexError:
-            self.failed['other'] += 1
-
-    async def date(self, soup: BeautifulSoup) -> str | None:
+        :param backend: название движка парсинга (bs4, lxml);
+        :param pool: флаг парсинга в пуле процессов, размер которого
+            соответствует количеству доступных ядер процессора;
+        :param results: количество записей на странице;
+        :return: None.
         """
-        Осуществляет парсинг даты выхода;
 
-        :param soup: объект BeautifulSoup;
-        :return: дата выхода.
-        """
+        self.engine = backend
+        self.pool = pool
+        self.results = results
 
-        try:
-            date = (soup
-                    .find_all('td')[15]
-                    .text)
-
-            date = (date
-                    .replace('th', '')
-                    .replace('st', '')
-                    .replace('rd', '')
-                    .replace('nd', ''))
-
-            date = date.split()
-            if int(date[2]) > datetime.date.today().year % 100:
-                date[2] = '19' + date[2]
-            else:
-                date[2] = '20' + date[2]
-            date = ' '.join(date)
-
-            date = (datetime
-                    .datetime
-                    .strptime(date, '%d %b %Y')
-                    .strftime('%Y-%m-%d'))
-
-            self.success['date'] += 1
-            return date
-        except AttributeError:
-            self.failed['date'] += 1
-        except ValueError:
-            self.failed['date'] += 1
-        except IndexError:
-            self.failed['date'] += 1
-
-    @staticmethod
-    async def page(text: str) -> int:
+        self.close()
+
+        if pool:
+            self.executor = ProcessPoolExecutor(max_workers=os.cpu_count())
+
+    def close(self) -> None:
         """
-        Осуществляет парсинг номера последней страницы;
+        Завершает работу пула процессов-обработчиков;
 
-        :param text: данные для парсинга;
-        :return: номер последней страницы;
+        :return: None.
         """
 
-        soup = BeautifulSoup(text, 'html.parser')
+        if self.executor is not None:
+            self.executor.shutdown()
+            self.executor = None
 
-        number = (soup
-                  .find('div', id='mainContainerSub')
-                  .find('div', id='generalBody')
-                  .find_all('table')[1]
-                  .find_all('th')[0]
-                  .text)
+    def json(self) -> dict:
+        """
+        Возвращает текущие параметры:
 
-        number = (number
-                  .split()[1]
-                  .replace('(', '')
-                  .replace(')', '')
-                  .replace(',', ''))
+        - backend: название движка парсинга;
+        - pool: флаг парсинга в пуле процессов;
+        - results: количество записей на странице;
 
-        number = (int(number) // 50
-                  if int(number) % 50 == 0
-                  else int(number) // 50 + 1)
+        :return: текущие параметры.
+        """
 
-        return number
+        return {'backend': self.engine,
+                'pool': self.pool,
+                'results': self.results}
@@ -0,0 +1,129 @@
+import os
+
+from config.paths import CHECKPOINT_PATH
+from config.paths import PARTITION_PATH
+
+
+class PartitionManager(object):
+    """
+    Менеджер разделов, задачами которого являются:
+
+    - отбор разделов каталога - игровых платформ, данные которых
+      собираются независимо друг от друга (фильтр console);
+    - пропуск разделов платформ, новые данные о которых не появляются;
+    - формирование имен файлов с данными и контрольных точек разделов;
+    - учет незавершенных разделов и файлов с данными разделов;
+
+    Файлы с данными разделов сохраняются после объединения, поэтому
+    разделы могут обновляться независимо, в том числе инкрементально;
+
+    :var file: имя итогового файла с данными;
+    :var retired: платформы, новые данные о которых не появляются.
+    """
+
+    def __init__(self):
+        self.file: str | None = None
+        self.retired: tuple = ()
+
+    def select(self,
+               platforms: list[str],
+               active: bool = False) -> list[str]:
+        """
+        Отбирает разделы для сбора данных;
+
+        :param platforms: игровые платформы;
+        :param active: флаг пропуска платформ, новые данные о которых
+            не появляются;
+        :return: отобранные игровые платформы.
+        """
+
+        return [platform for platform in dict.fromkeys(platforms)
+                if not (active and platform in self.retired)]
+
+    def name(self, platform: str) -> str:
+        """
+        Формирует имя файла с данными раздела относительно каталога
+        исходных данных;
+
+        :param platform: игровая платформа;
+        :return: имя файла с данными раздела.
+        """
+
+        stem, extension = self.file.rsplit('.', 1)
+
+        return fr'partitions\{stem}.{platform}.{extension}'
+
+    def checkpoint(self, platform: str) -> str:
+        """
+        Формирует имя контрольной точки раздела;
+
+        :param platform: игровая платформа;
+        :return: имя контрольной точки раздела.
+        """
+
+        stem = self.file.rsplit('.', 1)[0]
+
+        return f'{stem}.{platform}.json'
+
+    def platforms(self) -> list[str]:
+        """
+        Находит разделы итогового файла, для которых созданы файлы
+        с данными;
+
+        :return: игровые платформы.
+        """
+
+        stem, extension = self.file.rsplit('.', 1)
+
+        return sorted(name[len(stem) + 1:-len(extension) - 1]
+                      for name in os.listdir(PARTITION_PATH)
+                      if name.startswith(f'{stem}.')
+                      and name.endswith(f'.{extension}')
+                      and name.count('.') == stem.count('.') + 2)
+
+    def segments(self) -> list[str]:
+        """
+        Формирует имена файлов с данными разделов итогового файла;
+
+        :return: имена файлов с данными разделов относительно каталога
+            исходных данных.
+        """
+
+        return [self.name(platform) for platform in self.platforms()]
+
+    def unfinished(self) -> list[str]:
+        """
+        Находит разделы, сбор данных которых не завершен: их контрольные
+        точки еще не удалены;
+
+        :return: имена контрольных точек незавершенных разделов.
+        """
+
+        return [self.checkpoint(platform) for platform in self.platforms()
+                if os.path.exists(
+                    fr'{CHECKPOINT_PATH}\{self.checkpoint(platform)}'
+                )]
+
+    def setting(self, file: str, retired: tuple) -> None:
+        """
+        Настраивает менеджер;
+
+        :param file: имя итогового файла с данными;
+        :param retired: платформы, новые данные о которых не появляются;
+        :return: None.
+        """
+
+        self.file = file
+        self.retired = tuple(retired)
+
+    def json(self) -> dict:
+        """
+        Возвращает текущие параметры:
+
+        - file: имя итогового файла с данными;
+        - retired: платформы, новые данные о которых не появляются;
+
+        :return: текущие параметры.
+        """
+
+        return {'file': self.file, 'retired': self.retired}
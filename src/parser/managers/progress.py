@@ -1,11 +1,92 @@
+import bisect
 import time
 
 
+class Journal(object):
+    """
+    Журнал завершенных страниц. Хранит номера страниц в виде упорядоченных
+    непересекающихся отрезков [начало, конец], поэтому его размер
+    не зависит от количества завершенных страниц, если они завершаются
+    почти по порядку;
+
+    :var ranges: отрезки номеров завершенных страниц.
+    """
+
+    def __init__(self, ranges: list | None = None):
+        self.ranges: list[list[int, int]] = []
+
+        for start, stop in ranges or []:
+            for page in range(start, stop + 1):
+                self.add(page)
+
+    def add(self, page: int) -> None:
+        """
+        Добавляет номер страницы в журнал, объединяя соседние отрезки;
+
+        :param page: номер страницы;
+        :return: None.
+        """
+
+        if page in self:
+            return
+
+        i = bisect.bisect_right(self.ranges, [page, page])
+
+        left = i > 0 and self.ranges[i - 1][1] == page - 1
+        right = i < len(self.ranges) and self.ranges[i][0] == page + 1
+
+        if left and right:
+            self.ranges[i - 1][1] = self.ranges.pop(i)[1]
+        elif left:
+            self.ranges[i - 1][1] = page
+        elif right:
+            self.ranges[i][0] = page
+        else:
+            self.ranges.insert(i, [page, page])
+
+    def count(self, first: int, last: int) -> int:
+        """
+        Вычисляет количество завершенных страниц в указанном диапазоне;
+
+        :param first: номер первой страницы;
+        :param last: номер последней страницы;
+        :return: количество завершенных страниц.
+        """
+
+        return sum(max(min(stop, last) - max(start, first) + 1, 0)
+                   for start, stop in self.ranges)
+
+    def missing(self, first: int, last: int) -> list[int]:
+        """
+        Возвращает номера незавершенных страниц в указанном диапазоне;
+
+        :param first: номер первой страницы;
+        :param last: номер последней страницы;
+        :return: номера незавершенных страниц.
+        """
+
+        return [page for page in range(first, last + 1) if page not in self]
+
+    def __contains__(self, page: int) -> bool:
+        i = bisect.bisect_right(self.ranges, [page, float('inf')])
+
+        return i > 0 and self.ranges[i - 1][1] >= page
+
+    def json(self) -> list:
+        """
+        Возвращает отрезки номеров завершенных страниц;
+
+        :return: отрезки номеров завершенных страниц.
+        """
+
+        return [[start, stop] for start, stop in self.ranges]
+
+
 class ProgressManager(object):
     """
     Менеджер прогресса, задачами которого являются:
 
-    - учет текущего прогресса;
+    - учет завершенных страниц в журнале;
     - расчет оставшегося времени до завершения сбора данных;
     - расчет времени обработки 1 страницы (мин);
     - расчет текущей скорости обработки 1 страницы (стр/мин);
@@ -13,7 +94,9 @@ class ProgressManager(object):
 
     :var start: время начала сбора данных;
     :var release: тип текущего релиза;
-    :var progress: текущее количество страниц;
+    :var progress: номера первой и последней страницы;
+    :var journal: журнал завершенных страниц;
+    :var shard: флаг сбора данных фиксированного отрезка страниц (шарда);
     :var finished: количество завершенных страниц;
     :var speed: текущая скорость обработки 1 страницы (стр/мин);
     :var interval: время обработки 1 страницы (мин);
@@ -24,21 +107,40 @@ class ProgressManager(object):
         self.start: float | None = None
         self.release: str | None = None
         self.progress: list = []
+        self.journal: Journal = Journal()
+        self.shard: bool = False
         self.finished: list = []
         self.speed: float | None = None
         self.interval: int | None = None
         self.time: int | None = None
 
-    def setting(self, progress: list) -> None:
+    def setting(self,
+                progress: list,
+                pages: list | None = None,
+                shard: bool = False) -> None:
         """
         Настраивает менеджер;
 
-        :param progress: текущий прогресс;
+        :param progress: номера первой и последней страницы;
+        :param pages: отрезки номеров завершенных страниц;
+        :param shard: флаг сбора данных фиксированного отрезка страниц;
         :return: None.
         """
 
         self.progress = progress
-        self.finished = [progress[0] - 1, progress[1]]
+        self.shard = shard
+        self.journal = Journal(pages)
+        self.finished = [self.journal.count(*progress),
+                         progress[1] - progress[0] + 1]
+
+    def missing(self) -> list[int]:
+        """
+        Возвращает номера страниц, которые осталось обработать;
+
+        :return: номера незавершенных страниц.
+        """
+
+        return self.journal.missing(*self.progress)
 
     def starting(self) -> None:
         """
@@ -85,24 +187,47 @@ class ProgressManager(object):
         else:
             self.speed = None
 
-    async def next(self, pages: int) -> None:
+    async def next(self, pages: list[int]) -> None:
         """
-        Увеличивает текущий прогресс;
+        Отмечает страницы завершенными в журнале;
 
-        :var pages: количество страниц;
+        :var pages: номера страниц;
         :return: None.
         """
 
-        self.timer(pages)
+        self.timer(len(pages))
         self.speeder()
-        self.finished[0] += pages
-        self.progress[0] += pages
+
+        for page in pages:
+            self.journal.add(page)
+
+        self.finished[0] = self.journal.count(*self.progress)
+
+    def limit(self, last: int) -> None:
+        """
+        Уменьшает номер последней страницы, если сбор данных прекращается
+        досрочно;
+
+        :param last: номер последней страницы;
+        :return: None.
+        """
+
+        self.progress[1] = min(self.progress[1], last)
+        self.finished = [self.journal.count(*self.progress),
+                         self.progress[1] - self.progress[0] + 1]
 
     def json(self) -> dict:
         """
-        Возвращает текущие параметры;
+        Возвращает текущие параметры:
+
+        - pages: отрезки номеров завершенных страниц;
+        - shard: номера первой и последней страницы шарда (только при сборе
+          данных шарда);
 
         :return: Текущие параметры.
         """
 
-        return {'progress': self.progress[0]}
+        if self.shard:
+            return {'pages': self.journal.json(), 'shard': self.progress}
+
+        return {'pages': self.journal.json()}
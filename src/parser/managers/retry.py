@@ -0,0 +1,133 @@
+import random
+
+from config.parser.parser import PERMANENT_CODES
+
+
+class RetryManager(object):
+    """
+    Менеджер повторных запросов, задачами которого являются:
+
+    - ограничение количества попыток получения страницы;
+    - расчет задержки перед повторным запросом (экспоненциальная задержка
+      со случайной составляющей);
+    - учет страниц, которые не удалось получить (очередь недоставленных
+      страниц), для повторной обработки при следующем запуске;
+    - учет страниц, отсутствующих на сервере;
+
+    Коды статусов из PERMANENT_CODES (страница отсутствует) не повторяются,
+    а страница учитывается как отсутствующая: повторный запрос ее тоже
+    не вернет, поэтому она не задерживает завершение сбора данных.
+    Остальные неуспешные коды (429, 5xx, 0 - ошибка соединения) повторяются
+    до исчерпания попыток, после чего страница становится недоставленной;
+
+    :var attempts: максимальное количество попыток получения страницы;
+    :var backoff: начальная задержка перед повторным запросом (сек.);
+    :var ceiling: максимальная задержка перед повторным запросом (сек.);
+    :var dead: страницы, которые не удалось получить, и коды статусов
+        последнего запроса;
+    :var absent: страницы, отсутствующие на сервере, и коды статусов.
+    """
+
+    def __init__(self):
+        self.attempts: int | None = None
+        self.backoff: float | None = None
+        self.ceiling: float | None = None
+        self.dead: dict[int, int] = {}
+        self.absent: dict[int, int] = {}
+
+    def retry(self, code: int, attempt: int) -> bool:
+        """
+        Проверяет, следует ли повторить запрос страницы;
+
+        :param code: код статуса запроса;
+        :param attempt: количество сделанных попыток;
+        :return: True, если запрос следует повторить.
+        """
+
+        return code not in PERMANENT_CODES and attempt < self.attempts
+
+    def delay(self, attempt: int) -> float:
+        """
+        Вычисляет задержку перед повторным запросом: случайное значение
+        от 0 до backoff * 2 ^ (attempt - 1), но не более ceiling.
+        Случайная составляющая не дает одновременно прерванным запросам
+        повторяться одновременно;
+
+        :param attempt: количество сделанных попыток;
+        :return: задержка (сек.).
+        """
+
+        return random.uniform(0, min(self.ceiling,
+                                     self.backoff * 2 ** (attempt - 1)))
+
+    def bury(self, page: int, code: int) -> None:
+        """
+        Помещает страницу в очередь недоставленных страниц или, если код
+        статуса входит в PERMANENT_CODES, учитывает ее как отсутствующую;
+
+        :param page: номер страницы;
+        :param code: код статуса последнего запроса;
+        :return: None.
+        """
+
+        if code in PERMANENT_CODES:
+            self.absent[page] = code
+        else:
+            self.dead[page] = code
+
+    def revive(self, page: int) -> None:
+        """
+        Удаляет страницу из очереди недоставленных страниц и из числа
+        отсутствующих после того, как ее удалось получить;
+
+        :param page: номер страницы;
+        :return: None.
+        """
+
+        self.dead.pop(page, None)
+        self.absent.pop(page, None)
+
+    def setting(self,
+                attempts: int,
+                backoff: float,
+                ceiling: float,
+                dead: dict | None = None,
+                absent: dict | None = None) -> None:
+        """
+        Настраивает менеджер;
+
+        :param attempts: максимальное количество попыток получения страницы;
+        :param backoff: начальная задержка перед повторным запросом;
+        :param ceiling: максимальная задержка перед повторным запросом;
+        :param dead: страницы, которые не удалось получить при предыдущем
+            запуске;
+        :param absent: страницы, отсутствовавшие на сервере при предыдущем
+            запуске;
+        :return: None.
+        """
+
+        self.attempts = attempts
+        self.backoff = backoff
+        self.ceiling = ceiling
+        self.dead = {int(page): code for page, code in (dead or {}).items()}
+        self.absent = {int(page): code
+                       for page, code in (absent or {}).items()}
+
+    def json(self) -> dict:
+        """
+        Возвращает текущие параметры:
+
+        - attempts: максимальное количество попыток получения страницы;
+        - backoff: начальная задержка перед повторным запросом;
+        - ceiling: максимальная задержка перед повторным запросом;
+        - dead: страницы, которые не удалось получить;
+        - absent: страницы, отсутствующие на сервере;
+
+        :return: текущие параметры.
+        """
+
+        return {'attempts': self.attempts,
+                'backoff': self.backoff,
+                'ceiling': self.ceiling,
+                'dead': self.dead,
+                'absent': self.absent}
@@ -0,0 +1,133 @@
+import asyncio
+
+
+class SchedulerManager(object):
+    """
+    Менеджер планирования, задачами которого являются:
+
+    - формирование очереди страниц для сбора данных;
+    - поддержание заданного количества одновременно обрабатываемых страниц;
+    - досрочное прекращение обработки страниц;
+    - постепенное увеличение количества одновременно обрабатываемых
+      страниц (окна), если обработка может быть прекращена досрочно:
+      окно начинается с одной страницы и увеличивается на одну после
+      каждой страницы, обработка которой не прекращает обработку
+      следующих, пока не достигнет workers;
+
+    :var workers: количество одновременно обрабатываемых страниц;
+    :var queue: очередь страниц, ожидающих обработки;
+    :var last: номер последней страницы, данные которой будут записаны;
+    :var window: семафор окна обрабатываемых страниц;
+    :var permits: размер окна.
+    """
+
+    def __init__(self):
+        self.workers: int | None = None
+        self.queue: asyncio.Queue = asyncio.Queue()
+        self.last: int | None = None
+        self.window: asyncio.Semaphore | None = None
+        self.permits: int = 0
+
+    def fill(self, pages: list[int], window: int | None = None) -> None:
+        """
+        Формирует очередь страниц, ожидающих обработки;
+
+        :param pages: номера страниц;
+        :param window: начальный размер окна (None - workers);
+        :return: None.
+        """
+
+        self.queue = asyncio.Queue()
+        self.last = max(pages, default=None)
+
+        self.permits = window or self.workers
+        self.window = asyncio.Semaphore(self.permits)
+
+        for page in pages:
+            self.queue.put_nowait(page)
+
+    def size(self) -> int:
+        """
+        Вычисляет количество одновременно запускаемых обработчиков страниц;
+
+        :return: количество обработчиков.
+        """
+
+        return max(min(self.workers, self.queue.qsize()), 1)
+
+    async def take(self) -> int | None:
+        """
+        Дожидается места в окне и извлекает из очереди следующую страницу
+        для обработки. По завершении обработки страница освобождает место
+        в окне (done);
+
+        :return: номер страницы или None, если очередь пуста.
+        """
+
+        await self.window.acquire()
+
+        try:
+            return self.queue.get_nowait()
+        except asyncio.QueueEmpty:
+            self.window.release()
+            return None
+
+    def done(self, grow: bool = False) -> None:
+        """
+        Освобождает место в окне после обработки страницы и, если
+        необходимо, увеличивает окно на одну страницу;
+
+        :param grow: флаг увеличения окна;
+        :return: None.
+        """
+
+        self.window.release()
+
+        if grow and self.permits < self.workers:
+            self.permits += 1
+            self.window.release()
+
+    def accept(self, page: int) -> bool:
+        """
+        Проверяет, должны ли быть записаны данные обработанной страницы;
+
+        :param page: номер страницы;
+        :return: True, если страница не следует за последней.
+        """
+
+        return self.last is not None and page <= self.last
+
+    def stop(self, page: int) -> None:
+        """
+        Прекращает обработку страниц, следующих за указанной: очищает очередь,
+        а данные страниц, обработка которых уже начата, не будут записаны;
+
+        :param page: номер последней страницы;
+        :return: None.
+        """
+
+        self.last = min(self.last, page)
+
+        while not self.queue.empty():
+            self.queue.get_nowait()
+
+    def setting(self, workers: int) -> None:
+        """
+        Настраивает менеджер;
+
+        :param workers: количество одновременно обрабатываемых страниц;
+        :return: None.
+        """
+
+        self.workers = workers
+
+    def json(self) -> dict:
+        """
+        Возвращает текущие параметры:
+
+        - workers: количество одновременно обрабатываемых страниц;
+
+        :return: текущие параметры.
+        """
+
+        return {'workers': self.workers}
@@ -0,0 +1,351 @@
+import asyncio
+import json
+import os
+import socket
+import sqlite3
+import time
+
+from config.paths import CHECKPOINT_PATH
+from config.paths import FILE_RAW_PATH
+from config.paths import SHARD_PATH
+
+
+class ShardManager(object):
+    """
+    Менеджер шардов, задачами которого являются:
+
+    - разбиение диапазона страниц на шарды - отрезки страниц фиксированного
+      размера;
+    - выдача шардов процессам-сборщикам, в том числе запущенным на разных
+      компьютерах с общим каталогом данных;
+    - продление аренды шарда во время сбора его данных и возврат шардов,
+      аренда которых истекла;
+    - откладывание шардов, страницы которых не удалось получить: такой
+      шард остается незавершенным и снова выдается после истечения
+      аренды;
+    - формирование имен файлов с данными и контрольных точек шардов;
+
+    Очередь шардов хранится в базе данных SQLite в каталоге шардов. Шард
+    выдается внутри транзакции BEGIN IMMEDIATE, поэтому один шард не может
+    быть выдан двум сборщикам одновременно. Общий каталог должен
+    поддерживать блокировку файлов;
+
+    :var file: имя итогового файла с данными;
+    :var lease: время аренды шарда (сек.);
+    :var owner: идентификатор сборщика;
+    :var shard: номер, первая и последняя страница арендованного шарда;
+    :var connection: соединение с базой данных очереди шардов.
+    """
+
+    def __init__(self):
+        self.file: str | None = None
+        self.lease: int | None = None
+        self.owner: str = f'{socket.gethostname()}:{os.getpid()}'
+        self.shard: list[int] | None = None
+        self.connection: sqlite3.Connection | None = None
+
+    def create(self, last: int, size: int) -> int:
+        """
+        Разбивает страницы с 1 по last на шарды по size страниц. Если очередь
+        уже сформирована, оставляет ее без изменений;
+
+        :param last: номер последней страницы;
+        :param size: количество страниц в шарде;
+        :return: количество шардов в очереди.
+        """
+
+        shards = [(first, min(first + size - 1, last))
+                  for first in range(1, last + 1, size)]
+
+        self.connection.execute('BEGIN IMMEDIATE')
+        try:
+            count, = self.connection.execute(
+                'SELECT COUNT(*) FROM shards'
+            ).fetchone()
+
+            if not count:
+                self.connection.executemany(
+                    'INSERT INTO shards (first, last) VALUES (?, ?)',
+                    shards
+                )
+                count = len(shards)
+
+            self.connection.execute('COMMIT')
+        except sqlite3.Error:
+            self.connection.execute('ROLLBACK')
+            raise
+
+        return count
+
+    def claim(self) -> list[int] | None:
+        """
+        Арендует незавершенный шард, который не арендован или аренда которого
+        истекла;
+
+        :return: номер, первая и последняя страница шарда или None, если
+            незавершенных шардов не осталось.
+        """
+
+        self.connection.execute('BEGIN IMMEDIATE')
+        try:
+            row = self.connection.execute(
+                'SELECT id, first, last FROM shards '
+                'WHERE done = 0 AND (owner IS NULL OR lease < ?) '
+                'ORDER BY id LIMIT 1',
+                (time.time(),)
+            ).fetchone()
+
+            if row is not None:
+                self.connection.execute(
+                    'UPDATE shards SET owner = ?, lease = ? WHERE id = ?',
+                    (self.owner, time.time() + self.lease, row[0])
+                )
+
+            self.connection.execute('COMMIT')
+        except sqlite3.Error:
+            self.connection.execute('ROLLBACK')
+            raise
+
+        self.shard = list(row) if row is not None else None
+
+        return self.shard
+
+    def renew(self) -> bool:
+        """
+        Продлевает аренду текущего шарда;
+
+        :return: True, если шард все еще арендован этим сборщиком.
+        """
+
+        cursor = self.connection.execute(
+            'UPDATE shards SET lease = ? WHERE id = ? AND owner = ?',
+            (time.time() + self.lease, self.shard[0], self.owner)
+        )
+
+        return cursor.rowcount == 1
+
+    async def keep(self) -> None:
+        """
+        Продлевает аренду текущего шарда до тех пор, пока задача не будет
+        отменена. Завершается, если аренда была утрачена (истекла и шард
+        арендовал другой сборщик);
+
+        :return: None.
+        """
+
+        while True:
+            await asyncio.sleep(self.lease / 3)
+
+            if not self.renew():
+                return
+
+    def complete(self, latest: str | None, keys: set[str]) -> None:
+        """
+        Отмечает текущий шард завершенным и сохраняет дату последнего
+        обновления его данных и ключи данных, обновленных в этот день;
+
+        :param latest: дата последнего обновления данных шарда;
+        :param keys: ключи данных шарда, обновленных в день latest;
+        :return: None.
+        """
+
+        self.connection.execute(
+            'UPDATE shards SET done = 1, latest = ?, keys = ? '
+            'WHERE id = ? AND owner = ?',
+            (latest, json.dumps(sorted(keys)), self.shard[0], self.owner)
+        )
+
+        self.shard = None
+
+    def defer(self) -> None:
+        """
+        Оставляет текущий шард незавершенным и арендованным еще на время
+        аренды: сборщик переходит к другим шардам, а по истечении аренды
+        шард снова выдается и его сбор продолжается с контрольной точки;
+
+        :return: None.
+        """
+
+        self.renew()
+
+        self.shard = None
+
+    def release(self) -> None:
+        """
+        Возвращает текущий шард в очередь до истечения аренды, чтобы его
+        сразу мог арендовать другой сборщик;
+
+        :return: None.
+        """
+
+        if self.shard is None:
+            return
+
+        self.connection.execute(
+            'UPDATE shards SET owner = NULL, lease = NULL '
+            'WHERE id = ? AND owner = ? AND done = 0',
+            (self.shard[0], self.owner)
+        )
+
+        self.shard = None
+
+    def status(self) -> dict:
+        """
+        Подсчитывает количество шардов в каждом состоянии;
+
+        :return: количество завершенных, арендованных и ожидающих шардов.
+        """
+
+        done, active, waiting = self.connection.execute(
+            'SELECT '
+            'COALESCE(SUM(done = 1), 0), '
+            'COALESCE(SUM(done = 0 AND lease >= ?), 0), '
+            'COALESCE(SUM(done = 0 AND (lease IS NULL OR lease < ?)), 0) '
+            'FROM shards',
+            (time.time(), time.time())
+        ).fetchone()
+
+        return {'done': done, 'active': active, 'waiting': waiting}
+
+    def shards(self) -> list[int]:
+        """
+        Возвращает номера всех шардов по порядку;
+
+        :return: номера шардов.
+        """
+
+        rows = self.connection.execute('SELECT id FROM shards ORDER BY id')
+
+        return [shard for shard, in rows]
+
+    def latest(self) -> str | None:
+        """
+        Возвращает дату последнего обновления данных всех завершенных
+        шардов;
+
+        :return: дата последнего обновления или None, если она неизвестна.
+        """
+
+        latest, = self.connection.execute(
+            'SELECT MAX(latest) FROM shards WHERE done = 1'
+        ).fetchone()
+
+        return latest
+
+    def keys(self) -> set[str]:
+        """
+        Возвращает ключи данных завершенных шардов, обновленных в день
+        последнего обновления данных всех шардов;
+
+        :return: ключи данных.
+        """
+
+        rows = self.connection.execute(
+            'SELECT keys FROM shards WHERE done = 1 AND latest = '
+            '(SELECT MAX(latest) FROM shards WHERE done = 1)'
+        )
+
+        return {key for keys, in rows for key in json.loads(keys or '[]')}
+
+    def name(self, shard: int) -> str:
+        """
+        Формирует имя файла с данными шарда относительно каталога
+        исходных данных;
+
+        :param shard: номер шарда;
+        :return: имя файла с данными шарда.
+        """
+
+        stem, extension = self.file.rsplit('.', 1)
+
+        return fr'shards\{stem}.{shard:05}.{extension}'
+
+    def checkpoint(self, shard: int) -> str:
+        """
+        Формирует имя контрольной точки шарда;
+
+        :param shard: номер шарда;
+        :return: имя контрольной точки шарда.
+        """
+
+        stem = self.file.rsplit('.', 1)[0]
+
+        return f'{stem}.{shard:05}.json'
+
+    def setting(self, file: str, lease: int) -> None:
+        """
+        Настраивает менеджер и открывает базу данных очереди шардов
+        итогового файла;
+
+        :param file: имя итогового файла с данными;
+        :param lease: время аренды шарда (сек.);
+        :return: None.
+        """
+
+        self.file = file
+        self.lease = lease
+
+        stem = file.rsplit('.', 1)[0]
+
+        self.close()
+        self.connection = sqlite3.connect(
+            fr'{SHARD_PATH}\{stem}.sqlite',
+            timeout=60,
+            isolation_level=None
+        )
+        self.connection.execute(
+            'CREATE TABLE IF NOT EXISTS shards ('
+            'id INTEGER PRIMARY KEY, '
+            'first INTEGER, '
+            'last INTEGER, '
+            'owner TEXT, '
+            'lease REAL, '
+            'done INTEGER DEFAULT 0, '
+            'latest TEXT, '
+            'keys TEXT)'
+        )
+
+    def close(self) -> None:
+        """
+        Закрывает соединение с базой данных очереди шардов;
+
+        :return: None.
+        """
+
+        if self.connection is not None:
+            self.connection.close()
+            self.connection = None
+
+    def delete(self) -> None:
+        """
+        Удаляет файлы с данными и контрольные точки шардов и базу данных
+        очереди шардов после объединения данных;
+
+        :return: None.
+        """
+
+        for shard in self.shards():
+            for path in (fr'{FILE_RAW_PATH}\{self.name(shard)}',
+                         fr'{CHECKPOINT_PATH}\{self.checkpoint(shard)}'):
+                try:
+                    os.remove(path)
+                except FileNotFoundError:
+                    pass
+
+        self.close()
+
+        stem = self.file.rsplit('.', 1)[0]
+        os.remove(fr'{SHARD_PATH}\{stem}.sqlite')
+
+    def json(self) -> dict:
+        """
+        Возвращает текущие параметры:
+
+        - file: имя итогового файла с данными;
+        - lease: время аренды шарда;
+        - owner: идентификатор сборщика;
+
+        :return: текущие параметры.
+        """
+
+        return {'file': self.file, 'lease': self.lease, 'owner': self.owner}
@@ -0,0 +1,225 @@
+import json
+import os
+
+from config.parser.parser import INCREMENTAL_PARAMS
+from config.paths import WATERMARK_PATH
+from parser.game import Game
+
+
+class WatermarkManager(object):
+    """
+    Менеджер отметки обновления, задачами которого являются:
+
+    - хранение даты последнего обновления данных, собранных предыдущим
+      запуском (отметки);
+    - отбор данных, обновленных после отметки, в режиме инкрементального
+      сбора данных;
+    - определение момента, после которого следующие страницы содержат
+      только устаревшие данные;
+
+    Дата обновления не содержит времени, поэтому данные, обновленные в день
+    отметки, отбираются по ключам: данные с ключами, собранными предыдущим
+    запуском в этот день, повторно не записываются;
+
+    :var crawl: режим сбора данных (full - полный,
+        incremental - инкрементальный);
+    :var watermark: дата последнего обновления данных предыдущего запуска;
+    :var keys: ключи данных предыдущего запуска, обновленных в день
+        отметки;
+    :var latest: дата последнего обновления данных текущего запуска;
+    :var seen: ключи данных текущего запуска, обновленных в день latest.
+    """
+
+    def __init__(self):
+        self.crawl: str = 'full'
+        self.watermark: str | None = None
+        self.keys: set[str] = set()
+        self.latest: str | None = None
+        self.seen: set[str] = set()
+
+    def params(self) -> dict:
+        """
+        Возвращает параметры запроса, соответствующие режиму сбора данных;
+
+        :return: параметры запроса.
+        """
+
+        return INCREMENTAL_PARAMS if self.incremental() else {}
+
+    def incremental(self) -> bool:
+        """
+        Проверяет, включен ли режим инкрементального сбора данных;
+
+        :return: True, если сбор данных инкрементальный.
+        """
+
+        return self.crawl == 'incremental' and self.watermark is not None
+
+    @staticmethod
+    def key(game: Game) -> str:
+        """
+        Формирует ключ видеоигры: адрес ее страницы, а если он неизвестен -
+        название и игровую платформу;
+
+        :param game: видеоигра;
+        :return: ключ видеоигры.
+        """
+
+        return game.url or f'{game.name}|{game.platform}'
+
+    def fresh(self, game: Game) -> bool:
+        """
+        Проверяет, обновлена ли видеоигра после отметки. Видеоигра,
+        обновленная в день отметки, считается обновленной, если предыдущий
+        запуск ее не собирал;
+
+        :param game: видеоигра;
+        :return: True, если видеоигра обновлена после отметки
+            или дата обновления неизвестна.
+        """
+
+        if not self.incremental() or game.update is None:
+            return True
+
+        if game.update == self.watermark:
+            return self.key(game) not in self.keys
+
+        return game.update > self.watermark
+
+    def select(self, games: list[Game]) -> tuple[list[Game], bool]:
+        """
+        Отбирает видеоигры, обновленные после отметки. Учитывает дату
+        последнего обновления данных текущего запуска;
+
+        :param games: видеоигры, размещенные на странице;
+        :return: отобранные видеоигры, флаг наличия устаревших данных
+            на странице.
+        """
+
+        for game in games:
+            if not game.update:
+                continue
+
+            if self.latest is None or game.update > self.latest:
+                self.latest, self.seen = game.update, set()
+
+            if game.update == self.latest:
+                self.seen.add(self.key(game))
+
+        selected = [game for game in games if self.fresh(game)]
+
+        return selected, len(selected) < len(games)
+
+    @staticmethod
+    def path(file: str) -> str:
+        """
+        Формирует путь к файлу отметки для файла с данными. Отбрасывается
+        только расширение, поэтому разделы каталога (games.PS4.csv) имеют
+        собственные отметки;
+
+        :param file: имя файла с данными;
+        :return: путь к файлу отметки.
+        """
+
+        return fr'{WATERMARK_PATH}\{file.rsplit(".", 1)[0]}.json'
+
+    def load(self, file: str) -> dict:
+        """
+        Читает отметку и ключи данных, обновленных в день отметки,
+        сохраненные предыдущим запуском;
+
+        :param file: имя файла с данными;
+        :return: отметка (watermark; None, если она отсутствует) и ключи
+            (keys).
+        """
+
+        try:
+            with open(self.path(file)) as json_file:
+                data = json.loads(json_file.read())
+        except FileNotFoundError:
+            return {'watermark': None, 'keys': None}
+
+        return {'watermark': data['watermark'], 'keys': data.get('keys')}
+
+    def boundary(self) -> tuple[str | None, set[str]]:
+        """
+        Определяет отметку для следующего запуска: дату последнего
+        обновления данных, собранных текущим и предыдущими запусками,
+        и ключи данных, обновленных в этот день;
+
+        :return: отметка и ключи.
+        """
+
+        if self.latest is None or (self.watermark is not None
+                                   and self.latest < self.watermark):
+            return self.watermark, self.keys
+
+        if self.latest == self.watermark:
+            return self.watermark, self.keys | self.seen
+
+        return self.latest, self.seen
+
+    def save(self, file: str) -> None:
+        """
+        Сохраняет отметку для следующего запуска;
+
+        :param file: имя файла с данными;
+        :return: None.
+        """
+
+        watermark, keys = self.boundary()
+
+        if watermark is None:
+            return
+
+        path = self.path(file)
+        with open(path + '.tmp', 'w') as json_file:
+            json_file.write(json.dumps({'watermark': watermark,
+                                        'keys': sorted(keys)}, indent=4))
+
+        os.replace(path + '.tmp', path)
+
+    def setting(self,
+                crawl: str,
+                watermark: str | None,
+                latest: str | None = None,
+                keys: list[str] | None = None,
+                seen: list[str] | None = None) -> None:
+        """
+        Настраивает менеджер;
+
+        :param crawl: режим сбора данных (full, incremental);
+        :param watermark: отметка предыдущего запуска;
+        :param latest: дата последнего обновления данных текущего запуска;
+        :param keys: ключи данных предыдущего запуска, обновленных в день
+            отметки;
+        :param seen: ключи данных текущего запуска, обновленных в день
+            latest;
+        :return: None.
+        """
+
+        self.crawl = crawl
+        self.watermark = watermark
+        self.latest = latest
+        self.keys = set(keys or [])
+        self.seen = set(seen or [])
+
+    def json(self) -> dict:
+        """
+        Возвращает текущие параметры:
+
+        - crawl: режим сбора данных;
+        - watermark: отметка предыдущего запуска;
+        - latest: дата последнего обновления данных текущего запуска;
+        - keys: ключи данных предыдущего запуска, обновленных в день
+          отметки;
+        - seen: ключи данных текущего запуска, обновленных в день latest;
+
+        :return: текущие параметры.
+        """
+
+        return {'crawl': self.crawl,
+                'watermark': self.watermark,
+                'latest': self.latest,
+                'keys': sorted(self.keys),
+                'seen': sorted(self.seen)}
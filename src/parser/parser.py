@@ -1,34 +1,69 @@
 import asyncio
+import time
 
+from config.parser.parser import CHECKPOINT
 from config.parser.parser import PARAMS
+from config.parser.parser import PROBE_RESULTS
+from config.parser.parser import SETTINGS
 from config.parser.parser import VALID_ATTEMPTS
 from parser.game import Game
+from parser.managers.archive import ArchiveManager
+from parser.managers.detail import DetailManager
 from parser.managers.file import FileManager
+from parser.managers.metrics import MetricsManager
+from parser.managers.network.delay import DelayManager
 from parser.managers.network.network import NetworkManager
 from parser.managers.output import OutputManager
 from parser.managers.parsing import ParsingManager
 from parser.managers.progress import ProgressManager
+from parser.managers.retry import RetryManager
+from parser.managers.scheduler import SchedulerManager
+from parser.managers.watermark import WatermarkManager
 
 
 class Parser(object):
     """
     Программа, осуществляющая сбор, обработку и хранение данных;
 
+    :var metrics: менеджер метрик;
+    :var archive: менеджер архива страниц;
+    :var detail: менеджер страниц видеоигр;
     :var file: файловый менеджер;
     :var network: сетевой менеджер;
     :var output: менеджер вывода;
     :var parsing: менеджер парсинга;
     :var progress: менеджер прогресса;
-    :var stopped: флаг остановки трансфера данных.
+    :var retry: менеджер повторных запросов;
+    :var scheduler: менеджер планирования;
+    :var watermark: менеджер отметки обновления;
+    :var lock: блокировка записи данных и постановки контрольной точки
+        в очередь записи;
+    :var unsaved: количество страниц, завершенных после сохранения
+        контрольной точки;
+    :var saved: время сохранения контрольной точки;
+    :var stopped: флаг остановки трансфера данных;
+    :var console: игровая платформа, если собираются данные только этого
+        раздела каталога.
     """
 
-    def __init__(self):
-        self.file: FileManager = FileManager()
-        self.network: NetworkManager = NetworkManager()
+    def __init__(self, delay: DelayManager | None = None):
+        self.metrics: MetricsManager = MetricsManager()
+        self.archive: ArchiveManager = ArchiveManager(self.metrics)
+        self.detail: DetailManager = DetailManager()
+        self.file: FileManager = FileManager(self.metrics)
+        self.network: NetworkManager = NetworkManager(self.metrics, delay)
+        self.network.cache.source = self.archive.body
         self.output: OutputManager = OutputManager()
-        self.parsing: ParsingManager = ParsingManager()
+        self.parsing: ParsingManager = ParsingManager(self.metrics)
         self.progress: ProgressManager = ProgressManager()
+        self.retry: RetryManager = RetryManager()
+        self.scheduler: SchedulerManager = SchedulerManager()
+        self.watermark: WatermarkManager = WatermarkManager()
+        self.lock: asyncio.Lock = asyncio.Lock()
+        self.unsaved: int = 0
+        self.saved: float = time.monotonic()
         self.stopped: bool = False
+        self.console: str | None = None
 
     async def connect(self) -> int:
         """
@@ -46,92 +81,226 @@ class Parser(object):
         Запускает:
 
         - процесс сбора данных;
-        - трансфер менеджеру вывода параметров остальных менеджеров;
-        - отображение текущего состояния сбора данных;
+        - трансфер менеджеру вывода параметров остальных менеджеров
+          и отображение текущего состояния сбора данных;
+        - учет и экспорт метрик сбора данных;
+
+        Может запускаться повторно тем же экземпляром (например,
+        по расписанию) после настройки менеджеров;
 
         :return: None.
         """
 
+        self.stopped = False
         self.progress.starting()
 
+        await self.metrics.serve()
+
+        self.output.clear()
+
         tasks = [
             asyncio.create_task(self.run()),
             asyncio.create_task(self.transfer(True)),
-            asyncio.create_task(self.output.state(True))
+            asyncio.create_task(self.monitor(True))
         ]
 
         await asyncio.gather(*tasks)
 
     async def run(self) -> None:
         """
-        Запускает процесс сбора данных;
+        Запускает процесс сбора данных. Одновременно обрабатывается
+        заданное количество страниц: как только обработка одной из них
+        завершается, начинается обработка следующей незавершенной страницы.
+        Если включено получение страниц видеоигр, они обрабатываются
+        одновременно со страницами каталога, а страницы видеоигр,
+        не полученные при предыдущих запусках, поступают в ту же очередь
+        из отдельной задачи. Если некоторые страницы
+        получить не удалось, контрольная точка сохраняется, чтобы повторить
+        их обработку при следующем запуске. Страницы, отсутствующие
+        на сервере, не повторяются и контрольную точку не сохраняют;
 
         :return: None
         """
-        current, last = self.progress.progress
 
-        for page in range(current, last + 1, 10):
-            if page + 10 <= last:
-                pages = range(page, page + 10)
-            else:
-                pages = range(page, last + 1)
+        self.scheduler.fill(self.progress.missing(),
+                            1 if self.watermark.incremental() else None)
 
-            tables = await self.tables([*pages])
+        fetchers = [
+            asyncio.create_task(self.fetcher())
+            for _ in range(self.detail.workers if self.detail.enabled else 0)
+        ]
 
-            data = [game.csv() for table in tables for game in table if game]
+        feeder = asyncio.create_task(self.detail.feed())
 
-            await self.file.write(data)
+        tasks = [
+            asyncio.create_task(self.worker())
+            for _ in range(self.scheduler.size())
+        ]
+
+        await asyncio.gather(*tasks)
+        await feeder
 
-            await self.progress.next(pages.stop - pages.start)
+        if fetchers:
+            await self.detail.stop()
+            await asyncio.gather(*fetchers)
 
+        if self.retry.dead:
             await self.save()
+            await self.file.close()
+        else:
+            await self.file.close(compact=True)
 
-        self.file.delete()
+            if not self.progress.shard:
+                self.watermark.save(self.file.file)
+
+            self.file.delete()
 
         await self.transfer()
         await self.output.state()
+        await self.monitor()
 
-        self.output.stopped = True
         self.stopped = True
+        self.output.notify()
 
-    async def table(self, page: int) -> list[Game]:
+    async def worker(self) -> None:
+        """
+        Обрабатывает страницы из очереди до тех пор, пока она не опустеет.
+        В режиме инкрементального сбора данных прекращает обработку следующих
+        страниц, как только на странице встречаются устаревшие данные,
+        а окно одновременно обрабатываемых страниц увеличивается только
+        после страниц, все данные которых обновлены, поэтому страницы
+        с устаревшими данными почти не запрашиваются.
+        Страницы, которые не удалось получить, пропускаются. Адреса страниц
+        видеоигр передаются обработчикам страниц видеоигр: пока очередь
+        заполнена, следующая страница каталога не обрабатывается;
+
+        :return: None.
         """
-        Получает данные, размещенные на странице;
+
+        while (page := await self.scheduler.take()) is not None:
+            if (games := await self.table(page)) is None:
+                self.scheduler.done()
+                continue
+
+            games, stale = self.watermark.select(games)
+
+            if stale:
+                self.scheduler.stop(page)
+                self.progress.limit(page)
+
+            if self.scheduler.accept(page):
+                await self.commit(page, games)
+                await self.detail.put([game.url for game in games])
+
+            self.scheduler.done(not stale)
+
+    async def fetcher(self) -> None:
+        """
+        Обрабатывает страницы видеоигр, пока они не закончатся: получает
+        страницу и сохраняет атрибуты видеоигры. Неуспешный запрос
+        повторяется с экспоненциальной задержкой, пока не будут исчерпаны
+        попытки, после чего страница остается неполученной до следующего
+        запуска. Страница, отсутствующая на сервере, повторно
+        не запрашивается;
+
+        :return: None.
+        """
+
+        while (path := await self.detail.take()) is not None:
+            link = f'{self.network.url}{path}'
+
+            attempt = 0
+
+            while True:
+                response = await self.network.get(link,
+                                                  delay=self.detail.delay)
+                code, attempt = response['code'], attempt + 1
+
+                if code == 200:
+                    details = await self.parsing.details(response['text'])
+                    await self.detail.save(path, code, details)
+                    break
+
+                if not self.retry.retry(code, attempt):
+                    await self.detail.save(path, code)
+                    break
+
+                await asyncio.sleep(self.retry.delay(attempt))
+
+            self.metrics.count('details_fetched', status=code)
+
+    async def commit(self, page: int, games: list[Game]) -> None:
+        """
+        Записывает данные страницы и отмечает ее завершенной в журнале.
+        Контрольная точка сохраняется не после каждой страницы,
+        а после завершения CHECKPOINT['pages'] страниц, если хранилище
+        накопило достаточно данных (например, для части parquet-файла),
+        или по истечении CHECKPOINT['seconds'] секунд. Под блокировкой
+        контрольная точка только ставится в очередь записи, а на диск
+        записывается в потоке записи, поэтому запись на диск
+        не задерживает остальные страницы. Страницы могут завершаться
+        в любом порядке: контрольная точка содержит только те страницы,
+        данные которых записаны на диск до нее;
 
         :param page: номер страницы;
-        :return: данные, размещенные на странице.
+        :param games: данные, размещенные на странице;
+        :return: None.
         """
 
-        link = f'{self.network.url}/games/games.php'
+        async with self.lock:
+            data = [game for game in games if game]
 
-        code, text = None, ''
+            await self.file.write(data)
 
-        while code != 200:
-            response = await self.network.get(link, PARAMS | {'page': page})
-            code = response['code']
+            await self.progress.next([page])
+            self.retry.revive(page)
 
-            if code == 200:
-                text = response['text']
+            self.unsaved += 1
 
-        games = await self.parsing.parse(text)
+            elapsed = time.monotonic() - self.saved
 
-        return games
+            if (self.unsaved >= CHECKPOINT['pages'] and self.file.due()
+                    or elapsed >= CHECKPOINT['seconds']):
+                self.checkpoint()
 
-    async def tables(self, pages: list):
+        self.output.notify()
+
+    async def table(self, page: int) -> list[Game]:
         """
-        Получает данные, размещенные на страницах;
+        Получает данные, размещенные на странице, и сохраняет страницу
+        в архив страниц. Неуспешный запрос
+        повторяется с экспоненциальной задержкой, пока не будут исчерпаны
+        попытки, после чего страница помещается в очередь недоставленных
+        страниц;
 
-        :param pages: номера страниц;
-        :return: данные, размещенные на странице.
+        :param page: номер страницы;
+        :return: данные, размещенные на странице, или None, если страницу
+            получить не удалось.
         """
 
-        tasks = []
-        for page in pages:
-            tasks.append(asyncio.create_task(self.table(page)))
+        link = f'{self.network.url}/games/games.php'
 
-        games = await asyncio.gather(*tasks)
+        attempt = 0
 
-        return games
+        while True:
+            params = self.params(page)
+            response = await self.network.get(
+                link,
+                params,
+                archived=self.archive.enabled
+            )
+            code, attempt = response['code'], attempt + 1
+
+            if code == 200:
+                self.archive.write(page, response['text'])
+                return await self.parsing.parse(response['text'])
+
+            if not self.retry.retry(code, attempt):
+                self.retry.bury(page, code)
+                self.output.notify()
+                return None
+
+            await asyncio.sleep(self.retry.delay(attempt))
 
     async def page(self) -> None | int:
         """
@@ -144,68 +313,245 @@ class Parser(object):
         link = f'{self.network.url}/games/games.php'
 
         while code != 200 and attempts < VALID_ATTEMPTS:
-            response = await self.network.get(link, PARAMS)
+            params = self.params()
+            response = await self.network.get(link, params)
             code, attempts = response['code'], attempts + 1
 
             if code == 200:
                 text = response['text']
                 number = await self.parsing.page(text)
+            elif attempts < VALID_ATTEMPTS:
+                await asyncio.sleep(self.retry.delay(attempts))
 
         return number
 
+    async def probe(self) -> int:
+        """
+        Подбирает наибольшее количество записей на странице, которое
+        принимает сервер: запрашивает первую страницу с размерами
+        из PROBE_RESULTS по возрастанию, пока страница содержит запрошенное
+        количество записей;
+
+        :return: количество записей на странице.
+        """
+
+        link = f'{self.network.url}/games/games.php'
+        results = self.parsing.results
+
+        for size in PROBE_RESULTS:
+            if size <= results:
+                continue
+
+            params = self.params(1) | {'results': size}
+            response = await self.network.get(link, params)
+
+            if response['code'] != 200:
+                break
+
+            if await self.parsing.count(response['text']) < size:
+                break
+
+            results = size
+
+        return results
+
+    async def platforms(self) -> list[str]:
+        """
+        Получает игровые платформы, по которым фильтруется каталог;
+
+        :return: значения фильтра игровых платформ.
+        """
+
+        code, platforms, attempts = None, [], 0
+        link = f'{self.network.url}/games/games.php'
+
+        while code != 200 and attempts < VALID_ATTEMPTS:
+            response = await self.network.get(link, self.params(1))
+            code, attempts = response['code'], attempts + 1
+
+            if code == 200:
+                platforms = await self.parsing.platforms(response['text'])
+            elif attempts < VALID_ATTEMPTS:
+                await asyncio.sleep(self.retry.delay(attempts))
+
+        return platforms
+
+    def params(self, page: int | None = None) -> dict:
+        """
+        Формирует параметры запроса страницы с учетом режима сбора данных,
+        количества записей на странице и раздела каталога;
+
+        :param page: номер страницы;
+        :return: параметры запроса.
+        """
+
+        params = PARAMS | self.watermark.params()
+        params |= {'results': self.parsing.results}
+
+        if self.console is not None:
+            params |= {'console': self.console}
+
+        if page is not None:
+            params |= {'page': page}
+
+        return params
+
     async def disconnect(self) -> None:
         """
-        Закрывает сессию;
+        Закрывает сессию, кэш ответов, файл с данными, архив страниц, базу
+        данных страниц видеоигр, пул процессов-обработчиков и web-сервер,
+        выдающий метрики;
 
         :return: None.
         """
 
-        await self.network.session.close()
+        await self.network.disconnect()
+        await self.file.close()
+        await self.metrics.close()
+
+        self.archive.close()
+        self.detail.close()
+        self.parsing.close()
 
     async def setting(self,
-                      span: tuple[int, int],
+                      rates: tuple[float, float | None],
                       factor: int,
                       threshold: int,
+                      burst: int,
+                      cache: bool,
+                      ttl: int,
                       file: str,
                       mode: str,
                       timeout: int,
-                      checkpoint: str):
+                      checkpoint: str,
+                      workers: int,
+                      backend: str,
+                      pool: bool,
+                      crawl: str,
+                      attempts: int,
+                      backoff: float,
+                      ceiling: float,
+                      results: int,
+                      probe: bool,
+                      metrics: dict,
+                      headless: bool,
+                      details: dict,
+                      archive: dict,
+                      shard: list | None = None,
+                      console: str | None = None,
+                      rate: float | None = None):
         """
         Настраивает менеджеры;
 
-        :param span: диапазон задержки;
+        :param rates: минимальная и максимальная частота запросов
+            (запр./сек.; None - без ограничения);
         :param factor: масштаб задержки;
         :param threshold: порог смены типа задержки;
+        :param burst: максимальное количество запросов без задержки;
+        :param cache: флаг использования кэша ответов;
+        :param ttl: время, в течение которого ответ выдается без запроса;
         :param file: имя файла с данными;
         :param mode: режим работы с файлом;
         :param timeout: задержка между выводами текущего состояния;
         :param checkpoint: имя файла контрольной точки в формате json;
+        :param workers: количество одновременно обрабатываемых страниц;
+        :param backend: название движка парсинга;
+        :param pool: флаг парсинга в пуле процессов;
+        :param crawl: режим сбора данных (full - полный, incremental -
+            только данные, обновленные после предыдущего запуска);
+        :param attempts: максимальное количество попыток получения страницы;
+        :param backoff: начальная задержка перед повторным запросом;
+        :param ceiling: максимальная задержка перед повторным запросом;
+        :param results: количество записей на странице;
+        :param probe: флаг подбора наибольшего количества записей
+            на странице, которое принимает сервер;
+        :param metrics: задержка между записями метрик в файл (interval)
+            и порт, по которому выдаются метрики (port);
+        :param headless: флаг режима без вывода: текущее состояние
+            не формируется и не отображается;
+        :param details: параметры получения страниц видеоигр: флаг
+            получения (enabled), количество одновременно обрабатываемых
+            страниц (workers), максимальное количество страниц в очереди
+            (queue) и минимальная и максимальная частота запросов (rates);
+        :param archive: параметры архива страниц: флаг сохранения страниц
+            (enabled) и уровень сжатия zlib (level);
+        :param shard: номера первой и последней страницы шарда, если
+            собираются данные только этого отрезка страниц;
+        :param console: игровая платформа, если собираются данные только
+            этого раздела каталога;
+        :param rate: частота запросов, достигнутая предыдущим запуском
+            (None - максимальная частота);
         :return: None.
         """
 
-        self.network.setting(span, factor, threshold)
+        self.console = console
+
+        self.watermark.setting(crawl, **self.watermark.load(file))
+
+        if self.watermark.incremental() and self.file.exists(file):
+            mode = 'a'
+
+        self.network.setting(rates, factor, threshold, burst, cache, ttl,
+                             rate)
+        self.retry.setting(attempts, backoff, ceiling)
+        self.scheduler.setting(workers)
+        self.parsing.setting(backend, pool, results)
         self.file.setting(file, mode, checkpoint)
+        self.archive.setting(file, mode, **archive)
+        self.metrics.setting(checkpoint, **metrics)
+        self.detail.setting(factor=factor, threshold=threshold, **details)
 
-        last = await self.page()
+        if probe:
+            self.parsing.results = await self.probe()
 
-        self.progress.setting([1, last])
-        self.output.setting(timeout)
+        if shard is not None:
+            self.progress.setting([*shard], shard=True)
+        else:
+            self.progress.setting([1, await self.page()])
+
+        self.output.setting(timeout, headless)
 
         await self.transfer()
 
     async def save(self) -> None:
         """
-        Записывает контрольную точки в формат json;
+        Записывает контрольную точку и дожидается ее записи на диск;
 
         :return: None.
         """
 
+        self.checkpoint()
+
+        await self.file.flush()
+
+    def checkpoint(self) -> None:
+        """
+        Формирует контрольную точку из текущего состояния менеджеров
+        и ставит ее в очередь записи после переданных на запись данных;
+
+        :return: None.
+        """
+
+        self.archive.flush()
+
         settings = {}
         settings |= self.progress.json()
         settings |= self.network.json()
         settings |= self.output.json()
+        settings |= self.scheduler.json()
+        settings |= self.parsing.json()
+        settings |= self.watermark.json()
+        settings |= self.retry.json()
+        settings |= self.metrics.json()
+        settings |= self.detail.json()
+        settings |= self.archive.json()
 
-        await self.file.save(settings)
+        if self.console is not None:
+            settings |= {'console': self.console}
+
+        self.file.save(settings, self.archive.sync)
+
+        self.unsaved, self.saved = 0, time.monotonic()
 
     async def load(self, checkpoint: str) -> None:
         """
@@ -217,30 +563,119 @@ class Parser(object):
 
         settings = self.file.load(checkpoint)
 
+        self.console = settings.get('console')
+
         self.file.setting(
             file=settings['file'],
             mode='a',
-            checkpoint=checkpoint
+            checkpoint=checkpoint,
+            offset=settings.get('offset'),
+            records=settings.get('records')
+        )
+
+        self.archive.setting(
+            file=settings['file'],
+            mode='a',
+            **settings.get('archive', SETTINGS['archive'])
         )
 
         self.network.setting(
-            span=settings['span'],
+            rates=settings.get('rates', SETTINGS['rates']),
             factor=settings['factor'],
-            threshold=settings['threshold']
+            threshold=settings['threshold'],
+            burst=settings.get('burst', SETTINGS['burst']),
+            cache=settings.get('cache', SETTINGS['cache']),
+            ttl=settings.get('ttl', SETTINGS['ttl']),
+            rate=settings.get('rate')
+        )
+
+        self.watermark.setting(
+            crawl=settings.get('crawl', SETTINGS['crawl']),
+            watermark=settings.get('watermark'),
+            latest=settings.get('latest'),
+            keys=settings.get('keys'),
+            seen=settings.get('seen')
         )
 
-        last = await self.page()
+        self.parsing.setting(
+            backend=settings.get('backend', SETTINGS['backend']),
+            pool=settings.get('pool', SETTINGS['pool']),
+            results=settings.get('results', SETTINGS['results'])
+        )
 
-        self.progress.setting(
-            progress=[settings['progress'], last]
+        self.retry.setting(
+            attempts=settings.get('attempts', SETTINGS['attempts']),
+            backoff=settings.get('backoff', SETTINGS['backoff']),
+            ceiling=settings.get('ceiling', SETTINGS['ceiling']),
+            dead=settings.get('dead'),
+            absent=settings.get('absent')
         )
 
+        self.metrics.setting(
+            checkpoint,
+            **settings.get('metrics', SETTINGS['metrics'])
+        )
+
+        self.detail.setting(
+            factor=settings['factor'],
+            threshold=settings['threshold'],
+            **settings.get('details', SETTINGS['details'])
+        )
+
+        if 'pages' in settings:
+            pages = settings['pages']
+        elif settings.get('progress', 1) > 1:
+            pages = [[1, settings['progress'] - 1]]
+        else:
+            pages = []
+
+        if 'shard' in settings:
+            self.progress.setting(
+                progress=settings['shard'],
+                pages=pages,
+                shard=True
+            )
+        else:
+            self.progress.setting(
+                progress=[1, await self.page()],
+                pages=pages
+            )
+
         self.output.setting(
-            timeout=settings['timeout']
+            timeout=settings['timeout'],
+            headless=settings.get('headless', SETTINGS['headless'])
+        )
+
+        self.scheduler.setting(
+            workers=settings.get('workers', SETTINGS['workers'])
         )
 
         await self.transfer()
 
+    async def summary(self) -> dict:
+        """
+        Формирует итоги сбора данных: файл с данными и количество записей,
+        завершенные, недоставленные и отсутствующие на сервере страницы,
+        статусы запросов и входящий трафик с момента соединения с сервером,
+        текущую частоту запросов и пройденное время;
+
+        :return: итоги сбора данных.
+        """
+
+        rate = await self.network.delay.current()
+
+        return {
+            'file': self.file.file,
+            'records': self.file.records,
+            'pages': self.progress.finished,
+            'dead': len(self.retry.dead),
+            'absent': len(self.retry.absent),
+            'statuses': self.network.statuses,
+            'traffic': self.network.traffic,
+            'rate': rate if rate != float('inf') else None,
+            'passed': round(self.progress.passed(), 3),
+        }
+
     async def state(self) -> None:
         """
         Выводит текущее состояние на экран;
@@ -250,13 +685,54 @@ class Parser(object):
 
         await self.output.state()
 
+    async def monitor(self, repeat: bool = False) -> None:
+        """
+        Обновляет текущие значения метрик (глубину очередей страниц,
+        страниц видеоигр и данных, ожидающих записи, частоту запросов,
+        прогресс)
+        и записывает метрики в файл. По завершении сбора данных метрики
+        записываются независимо от задержки между записями;
+
+        :param repeat: повтор обновления метрик;
+        :return: None.
+        """
+
+        while not self.stopped:
+            queue = self.file.queue.qsize() if self.file.queue else 0
+            details = self.detail.queue.qsize() if self.detail.queue else 0
+
+            self.metrics.gauge('pages_queue', self.scheduler.queue.qsize())
+            self.metrics.gauge('write_queue', queue)
+            self.metrics.gauge('details_queue', details)
+            self.metrics.gauge('request_rate',
+                               await self.network.delay.current())
+            self.metrics.gauge('pages_finished', self.progress.finished[0])
+            self.metrics.gauge('pages_total', self.progress.finished[1])
+            self.metrics.gauge('pages_dead', len(self.retry.dead))
+            self.metrics.gauge('pages_absent', len(self.retry.absent))
+
+            self.metrics.dump(force=not repeat)
+
+            if not repeat:
+                break
+
+            await asyncio.sleep(1)
+
     async def transfer(self, repeat: bool = False) -> None:
         """
-        Трансфер менеджеру вывода параметров остальных менеджеров;
+        Трансфер менеджеру вывода параметров остальных менеджеров.
+        При повторе отображает текущее состояние после каждого события
+        (завершение страницы, недоставленная страница), но не чаще одного
+        раза в timeout секунд. В режиме без вывода параметры
+        не передаются;
 
+        :param repeat: повтор трансфера и отображения текущего состояния;
         :return: None.
         """
 
+        if self.output.headless:
+            return
+
         while not self.stopped:
             await self.output.file(
                 file=self.file.file,
@@ -267,7 +743,7 @@ class Parser(object):
             await self.output.network(
                 statuses=self.network.statuses,
                 traffic=self.network.traffic,
-                span=await self.network.delay.current(),
+                rate=await self.network.delay.current(),
             )
 
             await self.output.parsing(
@@ -279,10 +755,12 @@ class Parser(object):
                 passed=self.progress.passed(),
                 finish=self.progress.finished,
                 speed=self.progress.speed,
-                interval=self.progress.interval
+                interval=self.progress.interval,
+                dead=len(self.retry.dead)
             )
 
             if not repeat:
                 break
 
-            await asyncio.sleep(1)
+            await self.output.state()
+            await self.output.wait()
@@ -0,0 +1,269 @@
+import glob
+import os
+import shutil
+
+import pyarrow as pa
+import pyarrow.parquet as pq
+
+from config.parser.managers.file import FIELD_TYPES
+from config.parser.managers.file import PART_ROWS
+from parser.sinks.sink import Sink
+
+
+TYPES = {
+    'string': pa.string(),
+    'category': pa.dictionary(pa.int32(), pa.string()),
+    'float': pa.float64(),
+    'date': pa.date32(),
+}
+
+
+class ParquetSink(Sink):
+    """
+    Хранилище собранных данных в формате parquet.
+
+    Parquet-файл нельзя дописать после закрытия, поэтому во время сбора данных
+    каждый сброс на диск (контрольная точка) сохраняет накопленные данные
+    в отдельную часть - parquet-файл в каталоге "<имя файла>.parts".
+    Контрольная точка ожидает накопления PART_ROWS записей (или истечения
+    времени между контрольными точками), поэтому часть содержит данные
+    нескольких страниц. Позицией хранилища является
+    количество сохраненных частей. Ранее объединенный parquet-файл
+    не изменяется до завершения сбора данных, после которого он и части
+    объединяются в один parquet-файл;
+
+    :var schema: схема parquet-файла с типами полей из FIELD_TYPES;
+    :var parts: количество сохраненных частей;
+    :var pending: данные, ожидающие сохранения в очередную часть;
+    :var bytes: суммарный размер сохраненных частей.
+    """
+
+    def __init__(self, path: str, fields: list[str] | None = None):
+        super().__init__(path, fields)
+        self.schema: pa.Schema = pa.schema(
+            [(field, TYPES[FIELD_TYPES[field]]) for field in self.fields]
+        )
+        self.parts: int = len(self.names())
+        self.pending: list[pa.Table] = []
+        self.bytes: int = 0
+        self.batch = PART_ROWS
+
+    def directory(self) -> str:
+        """
+        Возвращает путь к каталогу частей;
+
+        :return: путь к каталогу частей.
+        """
+
+        return self.path + '.parts'
+
+    def part(self, index: int) -> str:
+        """
+        Возвращает путь к части;
+
+        :param index: номер части;
+        :return: путь к части.
+        """
+
+        return os.path.join(self.directory(), f'part-{index:05}.parquet')
+
+    def names(self) -> list[str]:
+        """
+        Возвращает пути к сохраненным частям по порядку;
+
+        :return: пути к частям.
+        """
+
+        pattern = os.path.join(self.directory(), 'part-*.parquet')
+
+        return sorted(glob.glob(pattern))
+
+    def table(self, records: list[list]) -> pa.Table:
+        """
+        Преобразует данные в таблицу Arrow с типами полей из FIELD_TYPES;
+
+        :param records: данные;
+        :return: таблица Arrow.
+        """
+
+        columns = [*zip(*records, strict=True)] or [[] for _ in self.fields]
+
+        arrays = []
+        for field, column in zip(self.schema, columns, strict=True):
+            if pa.types.is_dictionary(field.type):
+                array = pa.array(column, pa.string()).dictionary_encode()
+            elif pa.types.is_date(field.type):
+                array = pa.array(column, pa.string()).cast(field.type)
+            else:
+                array = pa.array(column, field.type)
+
+            arrays.append(array)
+
+        return pa.Table.from_arrays(arrays, schema=self.schema)
+
+    def create(self) -> None:
+        """
+        Удаляет ранее собранные данные и создает пустой каталог частей;
+
+        :return: None.
+        """
+
+        shutil.rmtree(self.directory(), ignore_errors=True)
+
+        if os.path.exists(self.path):
+            os.remove(self.path)
+
+        os.makedirs(self.directory())
+
+        self.parts, self.pending, self.bytes = 0, [], 0
+
+    def open(self) -> None:
+        """
+        Открывает хранилище для дозаписи. Ранее объединенный parquet-файл
+        остается на месте: новые данные сохраняются в части;
+
+        :return: None.
+        """
+
+        os.makedirs(self.directory(), exist_ok=True)
+
+        self.bytes = self.size()
+
+    def write(self, records: list[list]) -> int:
+        """
+        Накапливает данные до очередного сброса на диск;
+
+        :param records: записываемые данные;
+        :return: размер хранилища.
+        """
+
+        if records:
+            self.pending.append(self.table(records))
+
+        return self.bytes
+
+    def sync(self) -> int:
+        """
+        Сохраняет накопленные данные в очередную часть. Часть записывается
+        во временный файл, который затем переименовывается, поэтому
+        прерывание записи не оставляет поврежденных частей;
+
+        :return: размер хранилища.
+        """
+
+        if not self.pending:
+            return self.bytes
+
+        table = pa.concat_tables(self.pending)
+        path = self.part(self.parts)
+
+        with open(path + '.tmp', 'wb') as file:
+            pq.write_table(table, file)
+            file.flush()
+            os.fsync(file.fileno())
+
+        os.replace(path + '.tmp', path)
+
+        self.parts += 1
+        self.pending = []
+        self.bytes += os.path.getsize(path)
+
+        return self.bytes
+
+    def offset(self) -> int:
+        """
+        Возвращает количество сохраненных частей;
+
+        :return: количество частей.
+        """
+
+        return self.parts
+
+    def close(self) -> None:
+        """
+        Закрывает хранилище. Данные, не сохраненные в часть, отбрасываются:
+        они не вошли в контрольную точку и будут собраны повторно;
+
+        :return: None.
+        """
+
+        self.pending = []
+
+    def compact(self) -> None:
+        """
+        Объединяет ранее объединенный parquet-файл и части в один
+        parquet-файл и удаляет каталог частей;
+
+        :return: None.
+        """
+
+        names = self.names()
+
+        if os.path.exists(self.path):
+            names.insert(0, self.path)
+
+        self.merge(names)
+
+    def merge(self, paths: list[str]) -> None:
+        """
+        Объединяет parquet-файлы в один, приводя словари категориальных
+        полей к общему виду. Объединенный файл заменяет все ранее собранные
+        данные, включая части;
+
+        :param paths: пути к объединяемым parquet-файлам по порядку;
+        :return: None.
+        """
+
+        tables = [pq.read_table(path, schema=self.schema) for path in paths]
+        table = pa.concat_tables(tables) if tables else self.table([])
+
+        pq.write_table(table.unify_dictionaries(), self.path + '.tmp')
+        os.replace(self.path + '.tmp', self.path)
+
+        shutil.rmtree(self.directory(), ignore_errors=True)
+
+        self.parts, self.bytes = 0, os.path.getsize(self.path)
+
+    def truncate(self, offset: int) -> int:
+        """
+        Удаляет части, сохраненные после контрольной точки;
+
+        :param offset: количество частей из контрольной точки;
+        :return: количество записей, сохраненных после контрольной точки.
+        """
+
+        for name in self.names()[offset:]:
+            os.remove(name)
+
+        self.parts = offset
+
+        return 0
+
+    def count(self) -> int:
+        """
+        Подсчитывает количество записей по метаданным частей
+        и объединенного файла;
+
+        :return: количество записей.
+        """
+
+        names = self.names()
+
+        if os.path.exists(self.path):
+            names.append(self.path)
+
+        return sum(pq.ParquetFile(name).metadata.num_rows for name in names)
+
+    def size(self) -> int:
+        """
+        Вычисляет суммарный размер частей и объединенного файла;
+
+        :return: размер хранилища.
+        """
+
+        names = self.names()
+
+        if os.path.exists(self.path):
+            names.append(self.path)
+
+        return sum(os.path.getsize(name) for name in names)
@@ -0,0 +1,239 @@
+import os
+import sqlite3
+
+from config.parser.managers.file import EXPORT_BATCH
+from config.parser.managers.file import FIELD_NAMES
+from config.parser.managers.file import FIELD_TYPES
+from config.parser.managers.file import RECORD_KEY
+from parser.sinks.sink import Sink
+
+
+COLUMNS = ', '.join(
+    f'"{field}" {"REAL" if FIELD_TYPES[field] == "float" else "TEXT"}'
+    for field in FIELD_NAMES
+)
+
+KEY = ', '.join(f"IFNULL(\"{field}\", '')" for field in RECORD_KEY)
+
+FIELDS = ', '.join(f'"{field}"' for field in FIELD_NAMES)
+
+UPDATES = ', '.join(f'"{field}" = excluded."{field}"'
+                    for field in FIELD_NAMES
+                    if field not in RECORD_KEY)
+
+UPSERT = (f'INSERT INTO games ({FIELDS}) '
+          f'VALUES ({", ".join("?" for _ in FIELD_NAMES)}) '
+          f'ON CONFLICT ({KEY}) DO UPDATE SET {UPDATES}')
+
+
+class SqliteSink(Sink):
+    """
+    Хранилище записей в базе данных SQLite. Видеоигра однозначно
+    определяется полями RECORD_KEY (уникальный индекс): повторно собранная
+    видеоигра обновляет ранее сохраненную запись (продажи, оценки), поэтому
+    размер хранилища пропорционален размеру каталога, а не количеству
+    запусков сбора данных. Пакет данных записывается одной транзакцией.
+
+    Записи, сохраненные ранее, при создании хранилища не удаляются.
+    Повторная запись страниц, собранных после контрольной точки,
+    не создает дубликатов, поэтому отбрасывать данные не требуется.
+    Записи не удаляются, поэтому наибольший rowid равен количеству
+    записей: он является позицией хранилища и определяет количество новых
+    записей пакета без подсчета всех записей;
+
+    :var connection: соединение с базой данных;
+    :var inserted: количество новых записей в последнем пакете.
+    """
+
+    def __init__(self, path: str):
+        super().__init__(path)
+        self.connection: sqlite3.Connection | None = None
+        self.inserted: int = 0
+
+    def connect(self) -> sqlite3.Connection:
+        """
+        Открывает соединение с базой данных, создавая таблицу записей
+        и уникальный индекс, если их нет. Соединение используется потоком
+        записи файлового менеджера;
+
+        :return: соединение с базой данных.
+        """
+
+        if self.connection is None:
+            self.connection = sqlite3.connect(self.path,
+                                              check_same_thread=False)
+            self.connection.execute(
+                f'CREATE TABLE IF NOT EXISTS games ({COLUMNS})'
+            )
+            self.connection.execute(
+                f'CREATE UNIQUE INDEX IF NOT EXISTS games_key ON games ({KEY})'
+            )
+
+        return self.connection
+
+    def create(self) -> None:
+        """
+        Создает базу данных с таблицей записей, если ее нет;
+
+        :return: None.
+        """
+
+        self.connect()
+
+    def open(self) -> None:
+        """
+        Открывает базу данных для записи;
+
+        :return: None.
+        """
+
+        self.connect()
+
+    def write(self, records: list[list]) -> int:
+        """
+        Добавляет новые и обновляет сохраненные записи одной транзакцией.
+        Учитывает количество новых записей;
+
+        :param records: записываемые данные;
+        :return: размер базы данных.
+        """
+
+        last = self.last()
+
+        with self.connection:
+            self.connection.executemany(UPSERT, records)
+
+        self.inserted = self.last() - last
+
+        return self.size()
+
+    def added(self, records: list[list]) -> int:
+        """
+        Возвращает количество новых записей в последнем пакете: обновленные
+        записи не учитываются;
+
+        :param records: записанные данные;
+        :return: количество новых записей.
+        """
+
+        return self.inserted
+
+    def sync(self) -> int:
+        """
+        Данные сохраняются при завершении каждой транзакции;
+
+        :return: размер базы данных.
+        """
+
+        return self.size()
+
+    def offset(self) -> int:
+        """
+        Возвращает наибольший rowid (количество записей);
+
+        :return: позиция хранилища.
+        """
+
+        return self.last()
+
+    def close(self) -> None:
+        """
+        Закрывает соединение с базой данных;
+
+        :return: None.
+        """
+
+        if self.connection is not None:
+            self.connection.close()
+            self.connection = None
+
+    def merge(self, paths: list[str]) -> None:
+        """
+        Объединяет базы данных в одну: записи следующих баз данных
+        обновляют записи предыдущих. Объединенная база данных заменяет
+        ранее собранные данные;
+
+        :param paths: пути к объединяемым базам данных по порядку;
+        :return: None.
+        """
+
+        self.close()
+
+        if os.path.exists(self.path):
+            os.remove(self.path)
+
+        connection = self.connect()
+
+        for path in paths:
+            connection.execute('ATTACH DATABASE ? AS source', (path,))
+
+            with connection:
+                connection.execute(
+                    f'INSERT INTO games ({FIELDS}) '
+                    f'SELECT {FIELDS} FROM source.games WHERE true '
+                    f'ON CONFLICT ({KEY}) DO UPDATE SET {UPDATES}'
+                )
+
+            connection.execute('DETACH DATABASE source')
+
+    def truncate(self, offset: int) -> int:
+        """
+        Данные, записанные после контрольной точки, не отбрасываются:
+        повторная запись тех же страниц обновляет их;
+
+        :param offset: позиция хранилища из контрольной точки;
+        :return: количество записей, сохраненных после контрольной точки.
+        """
+
+        return max(self.last() - offset, 0)
+
+    def read(self):
+        """
+        Читает записи пакетами по EXPORT_BATCH в порядке уникального
+        индекса;
+
+        :return: генератор пакетов записей.
+        """
+
+        cursor = self.connect().execute(
+            f'SELECT {FIELDS} FROM games ORDER BY {KEY}'
+        )
+
+        while records := cursor.fetchmany(EXPORT_BATCH):
+            yield records
+
+    def last(self) -> int:
+        """
+        Возвращает наибольший rowid: поиск по первичному ключу таблицы
+        не требует чтения всех записей;
+
+        :return: наибольший rowid или 0, если записей нет.
+        """
+
+        last, = self.connect().execute(
+            'SELECT IFNULL(MAX(rowid), 0) FROM games'
+        ).fetchone()
+
+        return last
+
+    def count(self) -> int:
+        """
+        Подсчитывает количество записей;
+
+        :return: количество записей.
+        """
+
+        count, = self.connect().execute(
+            'SELECT COUNT(*) FROM games'
+        ).fetchone()
+
+        return count
+
+    def size(self) -> int:
+        """
+        Вычисляет размер базы данных;
+
+        :return: размер базы данных.
+        """
+
+        return os.path.getsize(self.path)
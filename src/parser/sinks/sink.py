@@ -0,0 +1,137 @@
+import abc
+
+from config.parser.managers.file import FIELD_NAMES
+
+
+class Sink(abc.ABC):
+    """
+    Базовый класс хранилища собранных данных. Методы write, sync и close
+    вызываются в потоке записи файлового менеджера. Наследники обязаны
+    реализовать все абстрактные методы; чтение записей (read) реализует
+    только хранилище записей;
+
+    :var path: путь к файлу с данными;
+    :var fields: поля записей;
+    :var batch: минимальное количество записей, накопленных перед сбросом
+        на диск (0 - сброс после каждой контрольной точки).
+    """
+
+    def __init__(self, path: str, fields: list[str] | None = None):
+        self.path: str = path
+        self.fields: list[str] = fields or FIELD_NAMES
+        self.batch: int = 0
+
+    @abc.abstractmethod
+    def create(self) -> None:
+        """
+        Создает пустое хранилище, удаляя ранее собранные данные;
+
+        :return: None.
+        """
+
+    @abc.abstractmethod
+    def open(self) -> None:
+        """
+        Открывает хранилище для дозаписи;
+
+        :return: None.
+        """
+
+    @abc.abstractmethod
+    def write(self, records: list[list]) -> int:
+        """
+        Записывает данные;
+
+        :param records: записываемые данные;
+        :return: размер хранилища.
+        """
+
+    @abc.abstractmethod
+    def sync(self) -> int:
+        """
+        Сбрасывает записанные данные на диск;
+
+        :return: размер хранилища.
+        """
+
+    @abc.abstractmethod
+    def offset(self) -> int:
+        """
+        Возвращает позицию хранилища, до которой данные сброшены на диск.
+        Сохраняется в контрольной точке;
+
+        :return: позиция хранилища.
+        """
+
+    @abc.abstractmethod
+    def close(self) -> None:
+        """
+        Закрывает хранилище;
+
+        :return: None.
+        """
+
+    def compact(self) -> None:  # noqa: B027
+        """
+        Приводит хранилище к окончательному виду после завершения сбора
+        данных;
+
+        :return: None.
+        """
+
+        pass
+
+    @abc.abstractmethod
+    def merge(self, paths: list[str]) -> None:
+        """
+        Объединяет данные нескольких хранилищ того же формата в одно;
+
+        :param paths: пути к объединяемым файлам с данными по порядку;
+        :return: None.
+        """
+
+    @abc.abstractmethod
+    def truncate(self, offset: int) -> int:
+        """
+        Отбрасывает данные, записанные после указанной позиции;
+
+        :param offset: позиция хранилища из контрольной точки;
+        :return: количество записей, сохраненных после контрольной точки
+            (если хранилище их не отбрасывает).
+        """
+
+    def added(self, records: list[list]) -> int:
+        """
+        Возвращает количество новых записей в последнем записанном пакете.
+        Вызывается после записи пакета;
+
+        :param records: записанные данные;
+        :return: количество новых записей.
+        """
+
+        return len(records)
+
+    def read(self):
+        """
+        Читает записи пакетами для выгрузки в хранилище другого формата;
+
+        :return: генератор пакетов записей.
+        """
+
+        raise NotImplementedError
+
+    @abc.abstractmethod
+    def count(self) -> int:
+        """
+        Подсчитывает количество записей в хранилище;
+
+        :return: количество записей.
+        """
+
+    @abc.abstractmethod
+    def size(self) -> int:
+        """
+        Вычисляет размер хранилища;
+
+        :return: размер хранилища.
+        """
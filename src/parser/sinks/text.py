@@ -0,0 +1,135 @@
+import csv
+import os
+import shutil
+
+from parser.sinks.sink import Sink
+
+
+class CsvSink(Sink):
+    """
+    Хранилище собранных данных в формате csv. Файл остается открытым в течение
+    всего сбора данных, позицией хранилища является размер файла;
+
+    :var handle: открытый файл с данными.
+    """
+
+    def __init__(self, path: str, fields: list[str] | None = None):
+        super().__init__(path, fields)
+        self.handle = None
+
+    def create(self) -> None:
+        """
+        Создает csv-файл с заголовком;
+
+        :return: None.
+        """
+
+        with open(self.path, 'w', newline='', encoding='utf-8') as file:
+            writer = csv.writer(file, delimiter=',')
+            writer.writerow(self.fields)
+
+    def open(self) -> None:
+        """
+        Открывает csv-файл для дозаписи;
+
+        :return: None.
+        """
+
+        self.handle = open(self.path, 'a',  # noqa: SIM115
+                           newline='',
+                           encoding='utf-8',
+                           buffering=2 ** 20)
+
+    def write(self, records: list[list]) -> int:
+        """
+        Записывает данные в csv-файл;
+
+        :param records: записываемые данные;
+        :return: размер файла.
+        """
+
+        writer = csv.writer(self.handle, delimiter=',')
+        writer.writerows(records)
+
+        return self.handle.tell()
+
+    def sync(self) -> int:
+        """
+        Сбрасывает буфер файла на диск;
+
+        :return: размер файла.
+        """
+
+        self.handle.flush()
+        os.fsync(self.handle.fileno())
+
+        return self.handle.tell()
+
+    def offset(self) -> int:
+        """
+        Возвращает размер файла, сброшенного на диск;
+
+        :return: размер файла.
+        """
+
+        return self.handle.tell() if self.handle else self.size()
+
+    def close(self) -> None:
+        """
+        Закрывает csv-файл;
+
+        :return: None.
+        """
+
+        if self.handle is not None:
+            self.handle.close()
+            self.handle = None
+
+    def merge(self, paths: list[str]) -> None:
+        """
+        Объединяет csv-файлы в один, сохраняя заголовок только первого;
+
+        :param paths: пути к объединяемым csv-файлам по порядку;
+        :return: None.
+        """
+
+        self.create()
+
+        with open(self.path, 'ab') as target:
+            for path in paths:
+                with open(path, 'rb') as source:
+                    source.readline()
+                    shutil.copyfileobj(source, target, 2 ** 20)
+
+    def truncate(self, offset: int) -> int:
+        """
+        Обрезает файл до размера из контрольной точки, отбрасывая в том числе
+        частично записанную строку;
+
+        :param offset: размер файла из контрольной точки;
+        :return: количество записей, сохраненных после контрольной точки.
+        """
+
+        os.truncate(self.path, offset)
+
+        return 0
+
+    def count(self) -> int:
+        """
+        Подсчитывает количество строк в файле (без заголовка);
+
+        :return: количество записей.
+        """
+
+        with open(self.path, newline='', encoding='utf-8') as file:
+            rows = csv.reader(file, delimiter=',')
+            return sum(1 for _ in rows) - 1
+
+    def size(self) -> int:
+        """
+        Вычисляет размер файла;
+
+        :return: размер файла.
+        """
+
+        return os.path.getsize(self.path)
@@ -0,0 +1,346 @@
+import asyncio
+import datetime
+import math
+import os
+import random
+
+from aiohttp import web
+
+
+PLATFORMS = ['PS2', 'DS', 'PS4', 'X360', 'Wii', 'NS', 'PC', 'PS3', 'GBA',
+             'XOne', 'PSP', '3DS', 'PS', 'GC', 'XB', 'PS5', 'XS', 'WiiU']
+
+HEADER = ('<tr><th>Pos</th><th></th><th>Game</th><th>Console</th>'
+          '<th>Publisher</th><th>Developer</th><th>VGChartz Score</th>'
+          '<th>Critic Score</th><th>User Score</th><th>Total Shipped</th>'
+          '<th>Total Sales</th><th>NA Sales</th><th>PAL Sales</th>'
+          '<th>Japan Sales</th><th>Other Sales</th><th>Release Date</th>'
+          '<th>Last Update</th></tr>')
+
+GENRES = ['Action', 'Sports', 'Shooter', 'Role-Playing', 'Platform',
+          'Racing', 'Misc', 'Fighting', 'Simulation', 'Puzzle', 'Strategy',
+          'Adventure']
+
+
+def document(catalogue: int, rows: list[str]) -> str:
+    """
+    Формирует страницу games.php из строк таблицы. Страница содержит
+    фильтр каталога по игровым платформам (console);
+
+    :param catalogue: количество записей в каталоге;
+    :param rows: строки таблицы;
+    :return: текст страницы.
+    """
+
+    options = ''.join(f'<option value="{platform}">{platform}</option>'
+                      for platform in PLATFORMS)
+
+    return (
+        '<html><body><div id="mainContainerSub">'
+        '<form><select name="console"><option value="">All</option>'
+        f'{options}</select></form>'
+        '<div id="generalBody"><table>'
+        '<tr><td><table><tr>'
+        f'<th>Results ({catalogue:,})</th>'
+        '</tr></table></td></tr>'
+        f'{HEADER}{"".join(rows)}'
+        '</table></div></div></body></html>'
+    )
+
+
+class StandServer(object):
+    """
+    Локальный сервер, имитирующий страницы games.php и страницы видеоигр
+    сайта VGChartz. Страницы каталога имеют ту же структуру
+    (mainContainerSub, generalBody), что и страницы сайта, и формируются
+    из синтетического каталога или выдаются из каталога сохраненных
+    страниц. Позволяет измерять производительность сбора данных
+    без обращения к сайту;
+
+    :var catalogue: количество записей в каталоге;
+    :var latency: распределение задержки ответа и его параметры;
+    :var errors: доли ответов с кодами статусов ошибок;
+    :var recorded: каталог с сохраненными страницами;
+    :var random: генератор случайных чисел;
+    :var step: множитель перестановки записей при упорядочивании по дате
+        последнего обновления;
+    :var inverse: множитель обратной перестановки;
+    :var statuses: количество ответов с каждым кодом статуса.
+    """
+
+    def __init__(self,
+                 catalogue: int,
+                 latency: tuple,
+                 errors: dict,
+                 recorded: str | None = None,
+                 seed: int = 0):
+        self.catalogue: int = catalogue
+        self.latency: tuple = tuple(latency)
+        self.errors: dict = {int(code): rate for code, rate in errors.items()}
+        self.recorded: str | None = recorded
+        self.random: random.Random = random.Random(seed)
+        self.step: int = next(step
+                              for step in range(7919, 7919 + catalogue + 2)
+                              if math.gcd(step, max(catalogue, 1)) == 1)
+        self.inverse: int = pow(self.step, -1, max(catalogue, 1))
+        self.statuses: dict = {}
+
+    def delay(self) -> float:
+        """
+        Вычисляет задержку ответа в соответствии с распределением;
+
+        :return: задержка (сек.).
+        """
+
+        distribution, *params = self.latency
+
+        if distribution == 'uniform':
+            return self.random.uniform(*params)
+        if distribution == 'lognormal':
+            return self.random.lognormvariate(*params)
+        if distribution == 'exponential':
+            return self.random.expovariate(1 / params[0])
+
+        return params[0] if params else 0
+
+    def error(self) -> int | None:
+        """
+        Выбирает код статуса ошибки в соответствии с долями ответов
+        с ошибками;
+
+        :return: код статуса ошибки или None, если ответ успешный.
+        """
+
+        value = self.random.random()
+
+        for code, rate in self.errors.items():
+            if value < rate:
+                return code
+            value -= rate
+
+        return None
+
+    def row(self, position: int, index: int) -> str:
+        """
+        Формирует строку таблицы для записи каталога. Значения зависят
+        только от номера записи;
+
+        :param position: позиция записи на странице;
+        :param index: номер записи в каталоге (по убыванию продаж);
+        :return: строка таблицы.
+        """
+
+        total = 80 / (1 + index / 25)
+        shipped = f'{total * 1.1:.2f}m' if index % 3 == 0 else 'N/A'
+        america = f'{total * 0.45:.2f}m' if index % 5 else 'N/A'
+        europe = f'{total * 0.35:.2f}m' if index % 7 else 'N/A'
+        japan = f'{total * 0.12:.2f}m' if index % 2 else 'N/A'
+        other = f'{total * 0.08:.2f}m'
+        critic = f'{(index * 37 % 90 + 10) / 10:.1f}' if index % 4 else 'N/A'
+        user = f'{(index * 53 % 90 + 10) / 10:.1f}' if index % 6 else 'N/A'
+        vgc = f'{(index * 11 % 90 + 10) / 10:.1f}' if index % 9 == 0 else 'N/A'
+
+        release = datetime.date(1985, 1, 1)
+        release += datetime.timedelta(days=index * 7919 % 14000)
+        release = self.date(release) if index % 50 else 'N/A'
+
+        update = datetime.date(2024, 1, 1)
+        update -= datetime.timedelta(days=self.rank(index) // 5)
+
+        return (
+            f'<tr><td>{position}</td>'
+            f'<td><img src="/games/boxart/{index}.jpg"></td>'
+            f'<td><a href="https://www.vgchartz.com/game/{index}/'
+            f'game-{index}/">  Game {index + 1} </a></td>'
+            f'<td><img alt="{PLATFORMS[index % len(PLATFORMS)]}"></td>'
+            f'<td> Publisher {index % 97} </td>'
+            f'<td>Developer {index % 389}</td>'
+            f'<td>{vgc}</td><td>{critic}</td><td>{user}</td>'
+            f'<td>{shipped}</td><td>{total:.2f}m</td>'
+            f'<td>{america}</td><td>{europe}</td>'
+            f'<td>{japan}</td><td>{other}</td>'
+            f'<td>{release}</td><td>{self.date(update)}</td></tr>'
+        )
+
+    @staticmethod
+    def date(value: datetime.date) -> str:
+        """
+        Преобразует дату в формат сайта, например, "18th Nov 11";
+
+        :param value: дата;
+        :return: дата в формате сайта.
+        """
+
+        suffix = ('th' if 10 <= value.day % 100 <= 20
+                  else {1: 'st', 2: 'nd', 3: 'rd'}.get(value.day % 10, 'th'))
+
+        return f'{value.day}{suffix} {value.strftime("%b %y")}'
+
+    def rank(self, index: int) -> int:
+        """
+        Вычисляет позицию записи при упорядочивании по дате последнего
+        обновления;
+
+        :param index: номер записи в каталоге;
+        :return: позиция записи.
+        """
+
+        return index * self.inverse % self.catalogue
+
+    def page(self,
+             page: int,
+             results: int,
+             order: str,
+             console: str = '') -> str:
+        """
+        Формирует страницу каталога. Если задана игровая платформа,
+        каталог содержит только записи этой платформы;
+
+        :param page: номер страницы;
+        :param results: количество записей на странице;
+        :param order: порядок записей (Sales, LastUpdate);
+        :param console: игровая платформа;
+        :return: текст страницы.
+        """
+
+        partition = console in PLATFORMS
+        indices = range(self.catalogue)
+
+        if partition:
+            indices = range(PLATFORMS.index(console), self.catalogue,
+                            len(PLATFORMS))
+
+            if order == 'LastUpdate':
+                indices = sorted(indices, key=self.rank)
+
+        first = (page - 1) * results
+        last = min(page * results, len(indices))
+
+        rows = []
+        for position in range(first, last):
+            index = (position * self.step % self.catalogue
+                     if order == 'LastUpdate' and not partition
+                     else indices[position])
+            rows.append(self.row(position + 1, index))
+
+        return document(len(indices), rows)
+
+    async def games(self, request: web.Request) -> web.Response:
+        """
+        Обрабатывает запрос страницы каталога;
+
+        :param request: запрос;
+        :return: ответ.
+        """
+
+        await asyncio.sleep(self.delay())
+
+        if (code := self.error()) is not None:
+            self.statuses[code] = self.statuses.get(code, 0) + 1
+            headers = {'Retry-After': '1'} if code == 429 else None
+            return web.Response(status=code, headers=headers)
+
+        page = int(request.query.get('page', 1))
+        results = int(request.query.get('results', 50))
+        order = request.query.get('order', 'Sales')
+        console = request.query.get('console', '')
+
+        path = os.path.join(self.recorded or '', f'{page}.html')
+
+        if self.recorded and os.path.exists(path):
+            with open(path, encoding='utf-8') as file:
+                text = file.read()
+        else:
+            text = self.page(page, results, order, console)
+
+        self.statuses[200] = self.statuses.get(200, 0) + 1
+
+        response = web.Response(text=text, content_type='text/html')
+        response.enable_compression()
+
+        return response
+
+    async def game(self, request: web.Request) -> web.Response:
+        """
+        Обрабатывает запрос страницы видеоигры: блок gameGenInfoBox
+        с заголовками атрибутов, за которыми следуют их значения;
+
+        :param request: запрос;
+        :return: ответ.
+        """
+
+        await asyncio.sleep(self.delay())
+
+        if (code := self.error()) is not None:
+            self.statuses[code] = self.statuses.get(code, 0) + 1
+            headers = {'Retry-After': '1'} if code == 429 else None
+            return web.Response(status=code, headers=headers)
+
+        index = int(request.match_info['index'])
+
+        if not 0 <= index < self.catalogue:
+            self.statuses[404] = self.statuses.get(404, 0) + 1
+            return web.Response(status=404)
+
+        text = (
+            '<html><body><div id="gameGenInfoBox">'
+            f'<h2>Publisher</h2><p>Publisher {index % 97}</p>'
+            f'<h2>Genre</h2><p>{GENRES[index % len(GENRES)]}</p>'
+            '</div></body></html>'
+        )
+
+        self.statuses[200] = self.statuses.get(200, 0) + 1
+
+        return web.Response(text=text, content_type='text/html')
+
+    async def root(self, request: web.Request) -> web.Response:
+        """
+        Обрабатывает запрос проверки соединения;
+
+        :param request: запрос;
+        :return: ответ.
+        """
+
+        return web.Response(text='VGChartz')
+
+    async def stats(self, request: web.Request) -> web.Response:
+        """
+        Выдает количество ответов с каждым кодом статуса;
+
+        :param request: запрос;
+        :return: ответ.
+        """
+
+        return web.json_response({str(code): count
+                                  for code, count in self.statuses.items()})
+
+    def application(self) -> web.Application:
+        """
+        Создает web-приложение сервера;
+
+        :return: web-приложение.
+        """
+
+        application = web.Application()
+        application.router.add_get('/', self.root)
+        application.router.add_get('/games/games.php', self.games)
+        application.router.add_get(r'/game/{index:\d+}/{slug}/', self.game)
+        application.router.add_get('/stats', self.stats)
+
+        return application
+
+
+def serve(host: str, port: int, **settings) -> None:
+    """
+    Запускает сервер. Выполняется в отдельном процессе, чтобы сервер
+    не разделял процессорное время с измеряемым сбором данных;
+
+    :param host: адрес сервера;
+    :param port: порт сервера;
+    :param settings: параметры сервера;
+    :return: None.
+    """
+
+    server = StandServer(**settings)
+
+    web.run_app(server.application(), host=host, port=port, print=None)
@@ -1,16 +1,32 @@
+import argparse
 import asyncio
+import datetime
+import json
 import os
+import signal
+import sys
+import time
 
+import aiohttp
+
+from config.parser.parser import DAEMON
+from config.parser.parser import EXIT_CODES
 from config.parser.parser import SETTINGS
 from config.paths import CHECKPOINT_PATH
 from config.paths import FILE_RAW_PATH
+from config.paths import RUN_PATH
 from parser.parser import Parser
 from utils.explorer import explorer
 
 
-async def main():
+# Параметры, которые может содержать файл конфигурации: параметры
+# по умолчанию, имя файла с данными, контрольная точка, шард и раздел.
+KEYS = {*SETTINGS, 'file', 'checkpoint', 'shard', 'console'}
+
+
+async def interactive():
     """
-        Тока входа сбора данных;
+        Тока входа сбора данных в интерактивном режиме;
 
         :return: None.
         """
@@ -20,7 +36,7 @@ async def main():
     os.system('cls')
     print('Соединение с сервером...', end=' ', flush=True)
 
-    if code := await parser.connect() == 200:
+    if (code := await parser.connect()) == 200:
         print('Ок.', flush=True)
 
         if names := explorer(CHECKPOINT_PATH, '*.json'):
@@ -30,7 +46,8 @@ async def main():
                 await parser.load(checkpoint)
             else:
                 print(flush=True)
-                names = explorer(FILE_RAW_PATH, '*.csv')
+                names = explorer(FILE_RAW_PATH,
+                                 ('*.csv', '*.parquet', '*.sqlite'))
                 print('Список файлов:', names, sep='\n', flush=True)
                 data = input('Укажите имя файла: ')
 
@@ -41,7 +58,7 @@ async def main():
                 await parser.setting(**settings)
         else:
             print(flush=True)
-            names = explorer(FILE_RAW_PATH, '*.csv')
+            names = explorer(FILE_RAW_PATH, ('*.csv', '*.parquet', '*.sqlite'))
             print('Список файлов:', names, sep='\n', flush=True)
             data = input('Укажите имя файла: ')
 
@@ -62,5 +79,220 @@ async def main():
 
     await parser.disconnect()
 
+
+def configure(parser: argparse.ArgumentParser,
+              args: argparse.Namespace) -> dict:
+    """
+    Формирует параметры сбора данных: параметры по умолчанию (SETTINGS),
+    дополненные параметрами из файла конфигурации в формате json
+    и параметрами командной строки. Неизвестные параметры файла
+    конфигурации, отсутствие имени файла с данными и режим службы
+    без инкрементального сбора данных (каждый цикл перезаписывал бы файл
+    с данными) завершают программу с кодом EXIT_CODES['usage'];
+
+    :param parser: разборщик параметров командной строки;
+    :param args: параметры командной строки;
+    :return: параметры сбора данных.
+    """
+
+    settings = {}
+    settings |= SETTINGS
+
+    if args.config:
+        try:
+            with open(args.config, encoding='utf-8') as file:
+                config = json.loads(file.read())
+        except (OSError, ValueError) as error:
+            parser.error(f'не удалось прочитать файл конфигурации: {error}')
+
+        if not isinstance(config, dict):
+            parser.error('файл конфигурации должен содержать объект json')
+
+        if unknown := sorted(set(config) - KEYS):
+            parser.error('неизвестные параметры файла конфигурации: '
+                         + ', '.join(unknown))
+
+        settings |= config
+
+    if args.file:
+        settings |= {'file': args.file}
+    if args.crawl:
+        settings |= {'crawl': args.crawl}
+    if args.headless:
+        settings |= {'headless': True}
+
+    if 'file' not in settings:
+        parser.error('не указано имя файла с данными (--file)')
+
+    if args.daemon and settings['crawl'] != 'incremental':
+        parser.error('режим службы (--daemon) требует инкрементального '
+                     'сбора данных (--crawl incremental)')
+
+    settings.setdefault('checkpoint', settings['file'].split('.')[0] + '.json')
+
+    return settings
+
+
+def report(settings: dict, summary: dict) -> None:
+    """
+    Дописывает итоги цикла сбора данных в файл в формате JSON Lines
+    в каталоге итогов, имя которого совпадает с именем контрольной точки;
+
+    :param settings: параметры сбора данных;
+    :param summary: итоги цикла сбора данных;
+    :return: None.
+    """
+
+    name = settings['checkpoint'].rsplit('.', 1)[0] + '.jsonl'
+
+    with open(fr'{RUN_PATH}\{name}', 'a', encoding='utf-8') as file:
+        file.write(json.dumps(summary, ensure_ascii=False) + '\n')
+
+
+async def cycle(parser: Parser, settings: dict, number: int) -> int:
+    """
+    Выполняет цикл сбора данных: продолжает сбор данных с контрольной
+    точки, если она сохранена, иначе начинает его заново с частотой
+    запросов, достигнутой предыдущим циклом. Записывает итоги цикла.
+    Если цикл прерван (Ctrl+C, SIGTERM), сохраняет контрольную точку
+    завершенных страниц;
+
+    :param parser: программа сбора данных с открытой сессией;
+    :param settings: параметры сбора данных;
+    :param number: номер цикла;
+    :return: код завершения цикла.
+    """
+
+    start = datetime.datetime.now()
+    checkpoint = settings['checkpoint']
+
+    if os.path.exists(fr'{CHECKPOINT_PATH}\{checkpoint}'):
+        await parser.load(checkpoint)
+    else:
+        rate = parser.network.delay.rate if number > 1 else None
+        await parser.setting(**settings, rate=rate)
+
+    try:
+        await parser.scrape()
+    except asyncio.CancelledError:
+        if not parser.stopped:
+            await parser.save()
+        raise
+
+    summary = await parser.summary()
+    code = EXIT_CODES['partial'] if summary['dead'] else EXIT_CODES['success']
+
+    report(settings, {'cycle': number,
+                      'start': start.isoformat(timespec='seconds'),
+                      'code': code} | summary)
+
+    print(f'Цикл {number}: {summary["records"]} записей, '
+          f'страниц: {summary["pages"][0]} из {summary["pages"][1]}, '
+          f'недоставлено: {summary["dead"]}, '
+          f'отсутствует: {summary["absent"]}.', flush=True)
+
+    return code
+
+
+async def unattended(settings: dict,
+                     daemon: bool,
+                     interval: float,
+                     cycles: int) -> int:
+    """
+    Выполняет сбор данных без участия пользователя: один цикл или,
+    в режиме службы, циклы по расписанию - каждые interval секунд
+    от начала предыдущего цикла. Сессия, частота запросов и контрольная
+    точка сохраняются между циклами. Сигнал SIGTERM прерывает сбор данных
+    так же, как Ctrl+C: контрольная точка завершенных страниц сохраняется
+    перед закрытием сессии;
+
+    :param settings: параметры сбора данных;
+    :param daemon: флаг режима службы;
+    :param interval: задержка между началом последовательных циклов (сек.);
+    :param cycles: количество циклов в режиме службы (0 - без ограничения);
+    :return: код завершения последнего цикла.
+    """
+
+    loop = asyncio.get_running_loop()
+
+    try:
+        loop.add_signal_handler(signal.SIGTERM,
+                                asyncio.current_task().cancel)
+    except NotImplementedError:
+        pass
+
+    parser = Parser()
+
+    try:
+        try:
+            code = await parser.connect()
+        except (aiohttp.ClientError, OSError):
+            code = None
+
+        if code != 200:
+            print(f'Нет соединения с сервером (код {code}).', flush=True)
+            return EXIT_CODES['connection']
+
+        number = 0
+
+        while True:
+            number, start = number + 1, time.monotonic()
+            code = await cycle(parser, settings, number)
+
+            if not daemon or number == cycles:
+                return code
+
+            await asyncio.sleep(max(interval - (time.monotonic() - start), 0))
+    except asyncio.CancelledError:
+        return EXIT_CODES['interrupted']
+    finally:
+        await parser.disconnect()
+
+
+def main() -> None:
+    """
+    Точка входа сбора данных. Без параметров сбор данных выполняется
+    в интерактивном режиме, с именем файла с данными или файлом
+    конфигурации - без участия пользователя (например, из cron), а в режиме
+    службы (--daemon) данные обновляются по расписанию. Код завершения
+    соответствует EXIT_CODES;
+
+    :return: None.
+    """
+
+    parser = argparse.ArgumentParser(description='Сбор данных')
+    parser.add_argument('--file',
+                        help='имя файла с данными (csv, parquet, sqlite)')
+    parser.add_argument('--config',
+                        help='файл конфигурации с параметрами сбора данных '
+                             '(json)')
+    parser.add_argument('--crawl', choices=['full', 'incremental'],
+                        help='режим сбора данных')
+    parser.add_argument('--headless', action='store_true',
+                        help='не отображать текущее состояние')
+    parser.add_argument('--daemon', action='store_true',
+                        help='обновлять данные по расписанию')
+    parser.add_argument('--interval', type=float,
+                        default=DAEMON['interval'],
+                        help='задержка между началом циклов (сек.)')
+    parser.add_argument('--cycles', type=int, default=DAEMON['cycles'],
+                        help='количество циклов (0 - без ограничения)')
+    args = parser.parse_args()
+
+    if not (args.file or args.config):
+        asyncio.run(interactive())
+        return
+
+    settings = configure(parser, args)
+
+    try:
+        code = asyncio.run(unattended(settings, args.daemon,
+                                      args.interval, args.cycles))
+    except KeyboardInterrupt:
+        code = EXIT_CODES['interrupted']
+
+    sys.exit(code)
+
+
 if __name__ == '__main__':
-    asyncio.run(main())
+    main()
@@ -0,0 +1,227 @@
+import argparse
+import asyncio
+import os
+
+from config.parser.parser import PARTITIONING
+from config.parser.parser import SETTINGS
+from config.paths import CHECKPOINT_PATH
+from parser.managers.archive import ArchiveManager
+from parser.managers.file import FileManager
+from parser.managers.network.delay import DelayManager
+from parser.managers.partition import PartitionManager
+from parser.parser import Parser
+
+
+async def platforms(delay: DelayManager) -> list[str] | None:
+    """
+    Получает игровые платформы, по которым фильтруется каталог;
+
+    :param delay: общий менеджер задержки;
+    :return: значения фильтра игровых платформ или None, если соединение
+        с сервером не установлено.
+    """
+
+    parser = Parser(delay)
+
+    print('Соединение с сервером...', end=' ', flush=True)
+
+    try:
+        if (code := await parser.connect()) != 200:
+            print(f'Неудача (код {code}).', flush=True)
+            return None
+
+        print('Ок.', flush=True)
+
+        parser.network.setting(
+            rates=SETTINGS['rates'],
+            factor=SETTINGS['factor'],
+            threshold=SETTINGS['threshold'],
+            burst=SETTINGS['burst'],
+            cache=SETTINGS['cache'],
+            ttl=SETTINGS['ttl']
+        )
+        parser.parsing.setting(
+            backend=SETTINGS['backend'],
+            pool=SETTINGS['pool'],
+            results=SETTINGS['results']
+        )
+        parser.retry.setting(
+            attempts=SETTINGS['attempts'],
+            backoff=SETTINGS['backoff'],
+            ceiling=SETTINGS['ceiling']
+        )
+
+        return await parser.platforms()
+    finally:
+        await parser.disconnect()
+
+
+async def partition(partitions: PartitionManager,
+                    platform: str,
+                    crawl: str,
+                    delay: DelayManager,
+                    semaphore: asyncio.Semaphore) -> None:
+    """
+    Собирает данные раздела каталога в отдельный файл. Раздел имеет
+    собственное количество страниц и контрольную точку: сбор данных
+    прерванного раздела продолжается с нее. Одновременно собирается
+    ограниченное количество разделов, запросы всех разделов разделяют
+    общую частоту запросов;
+
+    :param partitions: менеджер разделов;
+    :param platform: игровая платформа;
+    :param crawl: режим сбора данных (full, incremental);
+    :param delay: общий менеджер задержки;
+    :param semaphore: ограничение количества одновременно собираемых
+        разделов;
+    :return: None.
+    """
+
+    async with semaphore:
+        checkpoint = partitions.checkpoint(platform)
+
+        parser = Parser(delay)
+
+        try:
+            if (code := await parser.connect()) != 200:
+                print(f'{platform}: неудача (код {code}).', flush=True)
+                return
+
+            if os.path.exists(fr'{CHECKPOINT_PATH}\{checkpoint}'):
+                await parser.load(checkpoint)
+            else:
+                settings = {}
+                settings |= SETTINGS
+                settings |= {'file': partitions.name(platform)}
+                settings |= {'checkpoint': checkpoint}
+                settings |= {'mode': 'w', 'crawl': crawl, 'probe': False}
+                settings |= {'headless': True, 'console': platform}
+                settings |= {'metrics': SETTINGS['metrics'] | {'port': None}}
+                await parser.setting(**settings)
+
+            await parser.scrape()
+
+            print(f'{platform}: {parser.file.records} записей, '
+                  f'страниц: {parser.progress.finished[1]}, '
+                  f'недоставлено: {len(parser.retry.dead)}.', flush=True)
+        finally:
+            await parser.disconnect()
+
+
+async def scrape(partitions: PartitionManager,
+                 selected: list[str] | None,
+                 active: bool,
+                 crawl: str,
+                 concurrency: int) -> None:
+    """
+    Собирает данные разделов каталога одновременно. Общий менеджер
+    задержки настраивается один раз: разделы, в том числе возобновляемые
+    с контрольной точки, не сбрасывают частоту запросов, сниженную
+    другими разделами;
+
+    :param partitions: менеджер разделов;
+    :param selected: игровые платформы, None - все платформы из фильтра
+        каталога;
+    :param active: флаг пропуска платформ, новые данные о которых
+        не появляются;
+    :param crawl: режим сбора данных (full, incremental);
+    :param concurrency: количество одновременно собираемых разделов;
+    :return: None.
+    """
+
+    delay = DelayManager()
+    delay.setting(
+        rates=SETTINGS['rates'],
+        factor=SETTINGS['factor'],
+        threshold=SETTINGS['threshold'],
+        burst=SETTINGS['burst']
+    )
+
+    if selected is None and (selected := await platforms(delay)) is None:
+        return
+
+    selected = partitions.select(selected, active)
+
+    print(f'Разделов: {len(selected)}.', flush=True)
+
+    semaphore = asyncio.Semaphore(concurrency)
+
+    await asyncio.gather(*[
+        partition(partitions, platform, crawl, delay, semaphore)
+        for platform in selected
+    ])
+
+
+def merge(partitions: PartitionManager, force: bool) -> None:
+    """
+    Объединяет файлы с данными и архивы страниц разделов в итоговый файл
+    с данными и его архив страниц. Файлы с данными и архивы разделов
+    сохраняются для следующих обновлений. Пока не завершены все разделы,
+    объединение выполняется только принудительно;
+
+    :param partitions: менеджер разделов;
+    :param force: флаг объединения незавершенных разделов;
+    :return: None.
+    """
+
+    if (checkpoints := partitions.unfinished()) and not force:
+        print('Незавершенные разделы:', *checkpoints, sep='\n', flush=True)
+        return
+
+    segments = partitions.segments()
+
+    file = FileManager()
+    file.setting(partitions.file, 'w', None)
+    file.merge(segments)
+
+    ArchiveManager().merge(partitions.file, segments)
+
+    print(f'Файл {file.file}: {file.records} записей.', flush=True)
+
+
+def main() -> None:
+    """
+    Точка входа сбора данных по разделам каталога. Каждая игровая
+    платформа (фильтр console) собирается как независимый раздел
+    в отдельный файл, поэтому сдвиг записей между страницами во время
+    сбора данных ограничен разделом, а разделы платформ, новые данные
+    о которых не появляются, можно не обновлять. Файлы разделов затем
+    объединяются в итоговый файл;
+
+    :return: None.
+    """
+
+    parser = argparse.ArgumentParser(
+        description='Сбор данных по игровым платформам'
+    )
+    parser.add_argument('mode', choices=['scrape', 'merge'],
+                        help='режим работы')
+    parser.add_argument('file',
+                        help='имя итогового файла с данными (csv, parquet)')
+    parser.add_argument('--platforms', nargs='+',
+                        help='игровые платформы (по умолчанию - все)')
+    parser.add_argument('--active', action='store_true',
+                        help='пропустить платформы, новые данные о которых '
+                             'не появляются')
+    parser.add_argument('--crawl', choices=['full', 'incremental'],
+                        default=SETTINGS['crawl'],
+                        help='режим сбора данных')
+    parser.add_argument('--concurrency', type=int,
+                        default=PARTITIONING['concurrency'],
+                        help='количество одновременно собираемых разделов')
+    parser.add_argument('--force', action='store_true',
+                        help='объединить незавершенные разделы')
+    args = parser.parse_args()
+
+    partitions = PartitionManager()
+    partitions.setting(args.file, PARTITIONING['retired'])
+
+    if args.mode == 'scrape':
+        asyncio.run(scrape(partitions, args.platforms, args.active,
+                           args.crawl, args.concurrency))
+    else:
+        merge(partitions, args.force)
+
+
+if __name__ == '__main__':
+    main()
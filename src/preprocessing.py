@@ -15,13 +15,17 @@ def main():
     :return: None.
     """
 
-    names = explorer(FILE_RAW_PATH, '*.csv')
+    names = explorer(FILE_RAW_PATH, ('*.csv', '*.parquet'))
     os.system('cls')
     print('Список необработанных файлов:', names, sep='\n', flush=True)
 
     if name := input('Выберите файл: '):
-        name = name.split('.')[0]
-        data = pd.read_csv(f'{FILE_RAW_PATH}/{name}.csv')
+        name, extension = name.split('.')[0], name.split('.')[-1]
+
+        if extension == 'parquet':
+            data = pd.read_parquet(f'{FILE_RAW_PATH}/{name}.parquet')
+        else:
+            data = pd.read_csv(f'{FILE_RAW_PATH}/{name}.csv')
 
         # Подготовка к предварительно обработке данных.
         data = prepare(data)
@@ -0,0 +1,110 @@
+import argparse
+import functools
+import os
+import time
+
+from concurrent.futures import ProcessPoolExecutor
+
+from config.parser.managers.archive import REPARSE_CHUNK
+from config.parser.managers.file import RECORD_KEY
+from config.parser.parser import SETTINGS
+from parser.managers.archive import ArchiveManager
+from parser.managers.file import FileManager
+from parser.managers.parsing import ParsingManager
+from parser.managers.parsing import unpack
+
+
+def reparse(file: str,
+            output: str,
+            backend: str,
+            processes: int) -> None:
+    """
+    Восстанавливает файл с данными из архива страниц: сжатые страницы
+    распаковываются и парсятся в пуле процессов-обработчиков, а видеоигры
+    записываются в порядке первого появления в архиве. Видеоигра,
+    встречающаяся в архиве несколько раз (повторно полученные страницы,
+    инкрементальный сбор данных), определяется полями RECORD_KEY
+    и принимает значения из последней полученной страницы;
+
+    :param file: имя файла с данными, архив страниц которого парсится;
+    :param output: имя восстанавливаемого файла с данными (csv, parquet,
+        sqlite);
+    :param backend: название движка парсинга;
+    :param processes: количество процессов-обработчиков;
+    :return: None.
+    """
+
+    archive = ArchiveManager()
+
+    if not os.path.exists(archive.path(file)):
+        print(f'Архив страниц файла {file} не найден.', flush=True)
+        return
+
+    parsing = ParsingManager()
+    parsing.setting(backend, False, SETTINGS['results'])
+
+    start = time.perf_counter()
+    pages, games = 0, {}
+
+    with ProcessPoolExecutor(max_workers=processes) as executor:
+        for rows, success, failed in executor.map(
+                functools.partial(unpack, engine=backend),
+                (body for _, _, body in archive.read(file)),
+                chunksize=REPARSE_CHUNK
+        ):
+            parsing.merge(success, failed)
+            pages += 1
+
+            for game in rows:
+                if game:
+                    games[tuple(getattr(game, field)
+                                for field in RECORD_KEY)] = game
+
+    manager = FileManager()
+    manager.setting(output, 'w', None)
+    manager.rebuild(list(games.values()))
+    manager.sink.close()
+
+    errors = {field: count for field, count in parsing.failed.items()
+              if count}
+
+    print(f'Файл {output}: {manager.records} записей, страниц: {pages}, '
+          f'время: {time.perf_counter() - start:.1f} сек.', flush=True)
+
+    if errors:
+        print('Неуспешно спарсенные значения:', errors, flush=True)
+
+
+def main() -> None:
+    """
+    Точка входа повторного парсинга архива страниц. Страницы каталога,
+    сохраненные при сборе данных, парсятся заново на всех ядрах процессора
+    без запросов к серверу, поэтому новое поле или исправление парсинга
+    применяется к уже собранным данным за минуты, а не повторным сбором
+    данных;
+
+    :return: None.
+    """
+
+    parser = argparse.ArgumentParser(
+        description='Повторный парсинг архива страниц'
+    )
+    parser.add_argument('file',
+                        help='имя файла с данными, архив страниц которого '
+                             'парсится (csv, parquet, sqlite)')
+    parser.add_argument('--output',
+                        help='имя восстанавливаемого файла с данными '
+                             '(по умолчанию - тот же файл)')
+    parser.add_argument('--backend', choices=['bs4', 'lxml'],
+                        default=SETTINGS['backend'],
+                        help='движок парсинга')
+    parser.add_argument('--processes', type=int, default=os.cpu_count(),
+                        help='количество процессов-обработчиков')
+    args = parser.parse_args()
+
+    reparse(args.file, args.output or args.file, args.backend,
+            args.processes)
+
+
+if __name__ == '__main__':
+    main()
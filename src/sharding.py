@@ -0,0 +1,207 @@
+import argparse
+import asyncio
+import os
+
+from config.parser.parser import SETTINGS
+from config.parser.parser import SHARDING
+from config.paths import CHECKPOINT_PATH
+from config.paths import FILE_RAW_PATH
+from parser.managers.archive import ArchiveManager
+from parser.managers.file import FileManager
+from parser.managers.shard import ShardManager
+from parser.managers.watermark import WatermarkManager
+from parser.parser import Parser
+
+
+async def coordinator(shards: ShardManager, size: int) -> None:
+    """
+    Получает номер последней страницы и формирует очередь шардов;
+
+    :param shards: менеджер шардов;
+    :param size: количество страниц в шарде;
+    :return: None.
+    """
+
+    parser = Parser()
+
+    print('Соединение с сервером...', end=' ', flush=True)
+
+    if (code := await parser.connect()) == 200:
+        print('Ок.', flush=True)
+
+        parser.network.setting(
+            rates=SETTINGS['rates'],
+            factor=SETTINGS['factor'],
+            threshold=SETTINGS['threshold'],
+            burst=SETTINGS['burst'],
+            cache=SETTINGS['cache'],
+            ttl=SETTINGS['ttl']
+        )
+        parser.parsing.setting(
+            backend=SETTINGS['backend'],
+            pool=SETTINGS['pool'],
+            results=SETTINGS['results']
+        )
+
+        last = await parser.page()
+        count = shards.create(last, size)
+
+        print(f'Страниц: {last}, шардов в очереди: {count}.', flush=True)
+    else:
+        print(f'Неудача (код {code}).', flush=True)
+
+    await parser.disconnect()
+
+
+async def worker(shards: ShardManager) -> None:
+    """
+    Арендует шарды и собирает их данные, пока в очереди не останется
+    незавершенных шардов. Сбор данных шарда, начатый другим сборщиком,
+    продолжается с его контрольной точки. Шард, страницы которого
+    не удалось получить, не завершается: он откладывается вместе
+    с контрольной точкой и снова выдается по истечении аренды;
+
+    :param shards: менеджер шардов;
+    :return: None.
+    """
+
+    while (shard := shards.claim()) is not None:
+        number, first, last = shard
+        checkpoint = shards.checkpoint(number)
+
+        parser = Parser()
+
+        try:
+            if (code := await parser.connect()) != 200:
+                print(f'Неудача (код {code}).', flush=True)
+                break
+
+            if os.path.exists(fr'{CHECKPOINT_PATH}\{checkpoint}'):
+                await parser.load(checkpoint)
+            else:
+                settings = {}
+                settings |= SETTINGS
+                settings |= {'file': shards.name(number)}
+                settings |= {'checkpoint': checkpoint}
+                settings |= {'mode': 'w', 'crawl': 'full', 'probe': False}
+                settings |= {'shard': [first, last]}
+                await parser.setting(**settings)
+
+            scrape = asyncio.create_task(parser.scrape())
+            keep = asyncio.create_task(shards.keep())
+
+            await asyncio.wait([scrape, keep],
+                               return_when=asyncio.FIRST_COMPLETED)
+
+            if scrape.done():
+                keep.cancel()
+                scrape.result()
+
+                if parser.retry.dead:
+                    print(f'Шард {number}: недоставлено страниц: '
+                          f'{len(parser.retry.dead)}, шард отложен.',
+                          flush=True)
+                    shards.defer()
+                else:
+                    shards.complete(parser.watermark.latest,
+                                    parser.watermark.seen)
+            else:
+                scrape.cancel()
+                await asyncio.gather(scrape, return_exceptions=True)
+        finally:
+            shards.release()
+            await parser.disconnect()
+
+
+def merge(shards: ShardManager, force: bool) -> None:
+    """
+    Объединяет файлы с данными и архивы страниц завершенных шардов
+    в итоговый файл с данными и его архив страниц и сохраняет отметку
+    обновления для инкрементального сбора данных. Шарды, страницы
+    которых не удалось получить, остаются незавершенными вместе
+    с контрольной точкой: пока они не собраны повторно, объединение
+    выполняется только принудительно, без файлов с данными шардов,
+    сбор которых не начинался;
+
+    :param shards: менеджер шардов;
+    :param force: флаг объединения незавершенных шардов;
+    :return: None.
+    """
+
+    if not shards.shards():
+        print('Очередь шардов пуста.', flush=True)
+        return
+
+    status = shards.status()
+
+    if (status['active'] or status['waiting']) and not force:
+        print(f'Не все шарды завершены: {status}.', flush=True)
+
+        checkpoints = [shards.checkpoint(shard)
+                       for shard in shards.shards()
+                       if os.path.exists(
+                           fr'{CHECKPOINT_PATH}\{shards.checkpoint(shard)}'
+                       )]
+
+        if checkpoints:
+            print('Контрольные точки незавершенных шардов:',
+                  *checkpoints, sep='\n', flush=True)
+        return
+
+    segments = [shards.name(shard) for shard in shards.shards()
+                if os.path.exists(fr'{FILE_RAW_PATH}\{shards.name(shard)}')]
+
+    file = FileManager()
+    file.setting(shards.file, 'w', None)
+    file.merge(segments)
+
+    ArchiveManager().merge(shards.file, segments)
+
+    watermark = WatermarkManager()
+    watermark.setting('full', None, shards.latest(), seen=shards.keys())
+    watermark.save(shards.file)
+
+    shards.delete()
+
+    print(f'Файл {file.file}: {file.records} записей.', flush=True)
+
+
+def main() -> None:
+    """
+    Точка входа распределенного сбора данных. Координатор разбивает
+    страницы на шарды, сборщики (несколько процессов, в том числе
+    на разных компьютерах с общим каталогом данных) собирают данные шардов
+    в отдельные файлы, которые затем объединяются в итоговый файл;
+
+    :return: None.
+    """
+
+    parser = argparse.ArgumentParser(description='Распределенный сбор данных')
+    parser.add_argument('mode', choices=['coordinator', 'worker', 'merge'],
+                        help='режим работы')
+    parser.add_argument('file',
+                        help='имя итогового файла с данными (csv, parquet)')
+    parser.add_argument('--size', type=int, default=SHARDING['size'],
+                        help='количество страниц в шарде')
+    parser.add_argument('--lease', type=int, default=SHARDING['lease'],
+                        help='время аренды шарда (сек.)')
+    parser.add_argument('--force', action='store_true',
+                        help='объединить незавершенные шарды')
+    args = parser.parse_args()
+
+    shards = ShardManager()
+    shards.setting(args.file, args.lease)
+
+    try:
+        if args.mode == 'coordinator':
+            asyncio.run(coordinator(shards, args.size))
+        elif args.mode == 'worker':
+            asyncio.run(worker(shards))
+        else:
+            merge(shards, args.force)
+    finally:
+        shards.close()
+
+
+if __name__ == '__main__':
+    main()
@@ -1 +1,2 @@
+from .preprocessing.dates import dates
 from .preprocessing.preparation import prepare
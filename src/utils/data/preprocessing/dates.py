@@ -0,0 +1,61 @@
+import re
+
+import numpy as np
+import pandas as pd
+
+from parser.converters import DATE
+from parser.converters import MONTHS
+from parser.converters import PIVOT
+
+
+def normalize(values: pd.Series) -> pd.Series:
+    """
+    Нормализует даты векторными операциями. Даты вида "18th Nov 11"
+    преобразуются в формат "2011-11-18" так же, как при сборе данных.
+    Даты в формате "YYYY-MM-DD", отнесенные ранее к XX веку, хотя
+    двузначный год не превышает PIVOT (анонсированные игры), переносятся
+    в XXI век. Некорректные значения заменяются на NaN;
+
+    :param values: даты;
+    :return: нормализованные даты.
+    """
+
+    text = values.astype(str).str.strip()
+
+    raw = text.str.extract(f'^{DATE.pattern}$', flags=re.IGNORECASE)
+    iso = text.str.extract(r'^(\d{4})-(\d{2})-(\d{2})$')
+
+    short = pd.to_numeric(raw[2], errors='coerce')
+    full = pd.to_numeric(iso[0], errors='coerce')
+    full = full.mask((full // 100 == 19) & (full % 100 <= PIVOT), full + 100)
+
+    year = (short + 1900).mask(short <= PIVOT, short + 2000).fillna(full)
+    month = (raw[1].str.lower().map(MONTHS).astype('float')
+             .fillna(pd.to_numeric(iso[1], errors='coerce')))
+    day = (pd.to_numeric(raw[0], errors='coerce')
+           .fillna(pd.to_numeric(iso[2], errors='coerce')))
+
+    result = pd.to_datetime(
+        pd.DataFrame({'year': year, 'month': month, 'day': day}),
+        errors='coerce'
+    )
+
+    return result.dt.strftime('%Y-%m-%d').astype(object).where(
+        result.notna()
+    )
+
+
+def dates(values: pd.Series) -> pd.Series:
+    """
+    Нормализует даты в существующих файлах с данными. Различных дат
+    в каталоге немного, поэтому нормализуются только уникальные значения,
+    которые затем сопоставляются исходным;
+
+    :param values: даты;
+    :return: нормализованные даты.
+    """
+
+    codes, uniques = pd.factorize(values)
+    normalized = np.append(normalize(pd.Series(uniques)).to_numpy(), np.nan)
+
+    return pd.Series(normalized[codes], index=values.index, name=values.name)
@@ -1,6 +1,8 @@
 import numpy as np
 import pandas as pd
 
+from utils.data.preprocessing.dates import dates
+
 
 def prepare(data) -> pd.DataFrame:
     """
@@ -12,6 +14,9 @@ def prepare(data) -> pd.DataFrame:
 
     data = data.copy()
 
+    # Нормализация дат выхода (в том числе в файлах, собранных ранее).
+    data['date'] = dates(data['date'])
+
     # Удаление явных дубликатов.
     data = data.drop_duplicates()
 
@@ -1,13 +1,15 @@
 import pathlib
 
 
-def explorer(path: str, ext: str = '', exclude: tuple = ()) -> str:
+def explorer(path: str,
+             ext: str | tuple = '',
+             exclude: tuple = ()) -> str:
     """
     Формирует и нумерует список директорий и файлов по указанному пути
     в указанном формате;
 
     :param path: путь к файлам или папкам;
-    :param ext: формат файлов;
+    :param ext: формат файлов (один или несколько);
     :param exclude: исключения;
     :return: список директорий и файлов в указанном формате.
     """
@@ -17,7 +19,12 @@ def explorer(path: str, ext: str = '', exclude: tuple = ()) -> str:
     elements = []
 
     if ext:
-        for i, element in enumerate(directory.glob(ext), start=1):
+        patterns = (ext, ) if isinstance(ext, str) else ext
+        files = [element
+                 for pattern in patterns
+                 for element in directory.glob(pattern)]
+
+        for i, element in enumerate(files, start=1):
             if element.is_file() and element.name not in exclude:
                 elements += [f'{i}. {element.name}.']
     else:
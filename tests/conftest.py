@@ -0,0 +1,61 @@
+import pytest
+
+from parser.game import Game
+from parser.managers import archive
+from parser.managers import detail
+from parser.managers import file
+from parser.managers import shard
+from parser.managers import watermark
+from parser.managers.network import cache
+
+
+# Модули, каталоги данных которых (*_PATH) перенаправляются
+# во временный каталог.
+MODULES = (archive, cache, detail, file, shard, watermark)
+
+
+@pytest.fixture
+def data(tmp_path, monkeypatch):
+    """
+    Перенаправляет каталоги данных менеджеров во временный каталог, чтобы
+    тесты не затрагивали каталог data проекта;
+
+    :param tmp_path: временный каталог теста;
+    :param monkeypatch: фикстура подмены атрибутов;
+    :return: каталог данных.
+    """
+
+    directory = tmp_path / 'data'
+    directory.mkdir()
+
+    for module in MODULES:
+        for name in vars(module).copy():
+            if name.endswith('_PATH'):
+                monkeypatch.setattr(module, name, str(directory))
+
+    return directory
+
+
+@pytest.fixture
+def game():
+    """
+    Возвращает функцию, формирующую видеоигру с заполненными полями всех
+    типов: номер видеоигры, дата последнего обновления данных и значения
+    остальных полей;
+
+    :return: функция, формирующая видеоигру.
+    """
+
+    def make(index: int, update: str | None = '2024-01-01', **fields):
+        return Game(**{'name': f'Game {index}',
+                       'date': '2020-01-01',
+                       'platform': 'PS4',
+                       'publisher': f'Publisher {index % 3}',
+                       'developer': f'Developer {index % 5}',
+                       'total': float(index),
+                       'critic': 7.5,
+                       'update': update,
+                       'url': f'https://www.vgchartz.com/game/{index}/game/'}
+                    | fields)
+
+    return make
@@ -0,0 +1,138 @@
+import os
+import zlib
+
+import pytest
+
+from parser.managers.archive import ArchiveManager
+
+
+@pytest.fixture
+def archive(data):
+    """
+    Формирует менеджер архива страниц; архив закрывается после теста;
+
+    :param data: каталог данных;
+    :return: менеджер архива страниц.
+    """
+
+    manager = ArchiveManager()
+
+    yield manager
+
+    manager.close()
+
+
+def pages(manager: ArchiveManager, file: str = 'games.csv') -> list:
+    """
+    Читает номера и тела страниц архива;
+
+    :param manager: менеджер архива страниц;
+    :param file: имя файла с данными;
+    :return: номера и тела страниц по порядку.
+    """
+
+    return [(page, zlib.decompress(body).decode('utf-8'))
+            for page, _, body in manager.read(file)]
+
+
+def test_round_trip(archive):
+    """Записанные страницы читаются по порядку."""
+
+    archive.setting('games.csv', 'w', enabled=True, level=6)
+    archive.write(1, 'first')
+    archive.write(2, 'второй')
+    archive.close()
+
+    assert pages(archive) == [(1, 'first'), (2, 'второй')]
+
+
+def test_disabled_archive_is_not_written(archive):
+    """Если архив не ведется, страницы не сохраняются."""
+
+    archive.setting('games.csv', 'w', enabled=False, level=6)
+    archive.write(1, 'first')
+
+    assert not os.path.exists(archive.path('games.csv'))
+    assert archive.json()['archive']['offset'] is None
+
+
+def test_torn_frame_is_dropped(archive):
+    """Частично записанная последняя запись отбрасывается при дозаписи."""
+
+    archive.setting('games.csv', 'w', enabled=True, level=6)
+    archive.write(1, 'first')
+    archive.close()
+
+    with open(archive.path('games.csv'), 'ab') as file:
+        file.write(b'\x02\x00\x00')
+
+    archive.setting('games.csv', 'a', enabled=True, level=6)
+    archive.write(2, 'second')
+    archive.close()
+
+    assert pages(archive) == [(1, 'first'), (2, 'second')]
+
+
+def test_repair_to_checkpoint(archive):
+    """Записи после позиции контрольной точки отбрасываются."""
+
+    archive.setting('games.csv', 'w', enabled=True, level=6)
+    archive.write(1, 'first')
+    archive.flush()
+    offset = archive.json()['archive']['offset']
+    archive.write(2, 'lost')
+    archive.close()
+
+    archive.setting('games.csv', 'a', enabled=True, level=6, offset=offset)
+    archive.write(2, 'second')
+    archive.close()
+
+    assert pages(archive) == [(1, 'first'), (2, 'second')]
+
+
+def test_merge_skips_torn_frames(archive):
+    """Архивы объединяются по порядку без частично записанных записей."""
+
+    for file, text in [('a.csv', 'a'), ('b.csv', 'b')]:
+        archive.setting(file, 'w', enabled=True, level=6)
+        archive.write(1, text)
+        archive.close()
+
+    with open(archive.path('a.csv'), 'ab') as file:
+        file.write(b'\x01')
+
+    archive.merge('games.csv', ['a.csv', 'missing.csv', 'b.csv'])
+
+    assert pages(archive) == [(1, 'a'), (1, 'b')]
+
+
+def test_body_by_digest(archive):
+    """Тело страницы выдается по хешу, в том числе из архива,
+    открытого для дозаписи."""
+
+    digest = ArchiveManager.digest(b'first')
+
+    archive.setting('games.csv', 'w', enabled=True, level=6)
+    archive.write(1, 'first')
+
+    assert archive.body(digest) == 'first'
+    assert archive.body('0' * 40) is None
+
+    archive.close()
+    archive.setting('games.csv', 'a', enabled=True, level=6)
+
+    assert archive.index is None
+    assert archive.body(digest) == 'first'
+
+
+def test_recreated_archive_forgets_bodies(archive):
+    """После создания архива заново прежние тела не выдаются."""
+
+    digest = ArchiveManager.digest(b'first')
+
+    archive.setting('games.csv', 'w', enabled=True, level=6)
+    archive.write(1, 'first')
+    archive.close()
+    archive.setting('games.csv', 'w', enabled=True, level=6)
+
+    assert archive.body(digest) is None
@@ -0,0 +1,140 @@
+import asyncio
+import sqlite3
+import time
+
+import pytest
+
+from parser.managers.archive import ArchiveManager
+from parser.managers.network import cache
+from parser.managers.network.cache import CacheManager
+
+
+@pytest.fixture
+def responses(data):
+    """
+    Возвращает функцию, открывающую кэш ответов. Кэш закрывается после
+    теста;
+
+    :param data: каталог данных;
+    :return: функция, открывающая кэш ответов: время, в течение которого
+        ответ выдается без запроса.
+    """
+
+    managers = []
+
+    def open_cache(ttl: int = 0) -> CacheManager:
+        manager = CacheManager()
+        manager.setting(True, ttl)
+        manager.executor.submit(lambda: None).result()
+        managers.append(manager)
+        return manager
+
+    yield open_cache
+
+    for manager in managers:
+        manager.close()
+
+
+def keys(manager: CacheManager) -> list[str]:
+    """
+    Возвращает ключи сохраненных ответов;
+
+    :param manager: менеджер кэша;
+    :return: ключи ответов по порядку.
+    """
+
+    rows = manager.connection.execute('SELECT key FROM responses')
+
+    return sorted(key for key, in rows)
+
+
+def test_response_round_trip(responses):
+    """Ответ с заголовками условного запроса сохраняется и выдается."""
+
+    manager = responses()
+
+    async def exchange():
+        await manager.put('key', 'text', '"etag"', None)
+        return await manager.get('key')
+
+    entry = asyncio.run(exchange())
+
+    assert entry['text'] == 'text'
+    assert CacheManager.headers(entry) == {'If-None-Match': '"etag"'}
+
+
+def test_unvalidated_response_is_not_saved(responses):
+    """Ответ без ETag и Last-Modified при ttl = 0 не сохраняется."""
+
+    manager = responses()
+
+    asyncio.run(manager.put('key', 'text', None, None))
+
+    assert keys(manager) == []
+
+
+def test_archived_body_is_not_duplicated(responses):
+    """Для тела, сохраняемого в архив, хранится только хеш, а тело
+    читается из архива."""
+
+    manager = responses()
+    bodies = {ArchiveManager.digest(b'text'): 'text'}
+    manager.source = bodies.get
+
+    async def exchange():
+        await manager.put('key', 'text', '"etag"', None, archived=True)
+        return await manager.get('key')
+
+    entry = asyncio.run(exchange())
+    body, = manager.connection.execute('SELECT body FROM responses').fetchone()
+
+    assert body is None
+    assert entry['text'] == 'text'
+
+    bodies.clear()
+
+    assert asyncio.run(manager.get('key')) is None
+
+
+def test_purge_by_age_and_size(responses, monkeypatch):
+    """При открытии кэша удаляются давние ответы и самые давние ответы
+    сверх размера."""
+
+    monkeypatch.setitem(cache.CACHE, 'age', 3600)
+    monkeypatch.setitem(cache.CACHE, 'size', 2500)
+
+    manager = responses()
+    now = time.time()
+
+    with manager.connection:
+        manager.connection.executemany(
+            'INSERT INTO responses (key, body, time) VALUES (?, ?, ?)',
+            [('old', b'x', now - 7200),
+             ('a', b'x' * 1000, now - 3),
+             ('b', b'x' * 1000, now - 2),
+             ('c', b'x' * 1000, now - 1),
+             ('hashed', None, now - 0.5)]
+        )
+
+    manager.close()
+
+    assert keys(responses()) == ['b', 'c', 'hashed']
+
+
+def test_old_database_gains_hash_column(data, responses):
+    """База данных кэша без столбца хеша дополняется им."""
+
+    path = fr'{cache.CACHE_PATH}\responses.sqlite'
+    connection = sqlite3.connect(path)
+    connection.execute('CREATE TABLE responses (key TEXT PRIMARY KEY, '
+                       'body BLOB, etag TEXT, modified TEXT, time REAL)')
+    connection.close()
+
+    manager = responses()
+    asyncio.run(manager.put('key', 'text', '"etag"', None, archived=True))
+
+    digest, = manager.connection.execute(
+        'SELECT hash FROM responses'
+    ).fetchone()
+
+    assert digest == ArchiveManager.digest(b'text')
@@ -0,0 +1,148 @@
+import asyncio
+import email.utils
+import math
+import time
+
+import pytest
+
+from parser.managers.network import delay
+from parser.managers.network.delay import DelayManager
+
+
+def manager(rates=(1, 10), factor=2, threshold=9, burst=2, rate=None):
+    """
+    Формирует настроенный менеджер задержки;
+
+    :param rates: минимальная и максимальная частота запросов;
+    :param factor: масштаб задержки;
+    :param threshold: порог смены типа задержки;
+    :param burst: максимальное количество запросов без задержки;
+    :param rate: сохраненная частота запросов;
+    :return: менеджер задержки.
+    """
+
+    delays = DelayManager()
+    delays.setting(rates, factor, threshold, burst, rate)
+
+    return delays
+
+
+def test_rate_starts_at_maximum():
+    """Сбор данных начинается с максимальной или сохраненной частоты."""
+
+    assert manager().rate == 10
+    assert manager(rate=4).rate == 4
+    assert math.isinf(manager(rates=(1, None)).rate)
+
+
+def test_throttling_decreases_rate_multiplicatively():
+    """Коды 429 и 5xx уменьшают частоту в factor раз, но не ниже
+    минимальной."""
+
+    delays = manager()
+
+    asyncio.run(delays.code(429))
+    assert delays.rate == 5
+
+    asyncio.run(delays.code(503))
+    asyncio.run(delays.code(503))
+    asyncio.run(delays.code(503))
+    assert delays.rate == 1
+
+
+def test_success_increases_rate_additively():
+    """Успешные запросы увеличивают частоту на (max - min) / threshold,
+    но не выше максимальной."""
+
+    delays = manager(rate=1)
+
+    asyncio.run(delays.code(200))
+    assert delays.rate == 2
+
+    for _ in range(20):
+        asyncio.run(delays.code(304))
+    assert delays.rate == 10
+
+
+def test_other_codes_keep_rate():
+    """Коды, не связанные с нагрузкой, не меняют частоту."""
+
+    delays = manager(rate=4)
+    asyncio.run(delays.code(404))
+
+    assert delays.rate == 4
+
+
+def test_refill_is_bounded_by_burst(monkeypatch):
+    """Запросы пополняются пропорционально времени, но не больше burst."""
+
+    now = [100.0]
+    monkeypatch.setattr(delay.time, 'monotonic', lambda: now[0])
+
+    delays = manager(rates=(1, 4), burst=3)
+
+    delays.refill()
+    assert delays.tokens == 3
+
+    delays.tokens = 0
+    now[0] += 0.5
+    delays.refill()
+    assert delays.tokens == 2
+
+    now[0] += 10
+    delays.refill()
+    assert delays.tokens == 3
+
+
+def test_delay_spends_tokens():
+    """Запросы в пределах burst отправляются без задержки."""
+
+    async def spend():
+        delays = manager(rates=(1, 1), burst=2)
+        await delays.delay()
+        await delays.delay()
+        return delays.tokens
+
+    assert asyncio.run(spend()) == pytest.approx(0, abs=0.01)
+
+
+@pytest.mark.parametrize('value, seconds', [
+    ('120', 120),
+    (None, None),
+    ('', None),
+    ('soon', None),
+])
+def test_retry_after_seconds(value, seconds):
+    """Заголовок Retry-After в секундах или некорректный."""
+
+    assert DelayManager.retry(value) == seconds
+
+
+def test_retry_after_date():
+    """Заголовок Retry-After в виде даты преобразуется в секунды."""
+
+    value = email.utils.formatdate(time.time() + 60, usegmt=True)
+
+    assert DelayManager.retry(value) == pytest.approx(60, abs=2)
+
+
+def test_retry_after_postpones_requests():
+    """Код 429 с Retry-After откладывает запросы и обнуляет запас."""
+
+    delays = manager()
+    delays.tokens = 2
+
+    asyncio.run(delays.code(429, '30'))
+
+    assert delays.until - time.monotonic() == pytest.approx(30, abs=1)
+    assert delays.tokens == 0
+
+
+def test_json_round_trip():
+    """Параметры менеджера восстанавливаются из контрольной точки."""
+
+    delays = manager(rate=3)
+    restored = DelayManager()
+    restored.setting(**delays.json())
+
+    assert restored.json() == delays.json()
@@ -0,0 +1,85 @@
+import asyncio
+
+import pytest
+
+from config.parser.managers.file import FIELD_NAMES
+from parser.managers.detail import DetailManager
+
+
+@pytest.fixture
+def detail(data):
+    """
+    Формирует менеджер страниц видеоигр с открытой базой данных; база
+    данных закрывается после теста;
+
+    :param data: каталог данных;
+    :return: менеджер страниц видеоигр.
+    """
+
+    manager = DetailManager()
+    manager.open()
+
+    yield manager
+
+    manager.close()
+
+
+def test_select_returns_new_paths(detail):
+    """Страница отбирается только при первой встрече."""
+
+    urls = ['https://www.vgchartz.com/game/1/a/', None,
+            'https://example.com/game/1/a/', 'https://x/game/2/b/']
+
+    assert detail.select(urls) == ['/game/1/a/', '/game/2/b/']
+    assert detail.select(urls) == []
+    assert detail.pending() == ['/game/1/a/', '/game/2/b/']
+
+
+def test_permanent_codes_are_terminal(detail):
+    """Полученные и отсутствующие страницы завершены, а недоставленные
+    запрашиваются снова."""
+
+    detail.select(['/game/1/', '/game/2/', '/game/3/'])
+
+    async def fetch():
+        await detail.save('/game/1/', 200, {'genre': 'Action'})
+        await detail.save('/game/2/', 404)
+        await detail.save('/game/3/', 503)
+
+    asyncio.run(fetch())
+
+    assert detail.pending() == ['/game/3/']
+    assert detail.attributes() == {'/game/1/': {'genre': 'Action'}}
+
+
+def test_feed_queues_backlog(detail):
+    """Страницы, не полученные при предыдущих запусках, поступают
+    в очередь."""
+
+    detail.select(['/game/1/', '/game/2/'])
+
+    async def feed():
+        detail.setting(enabled=True, workers=1, queue=10, rates=(1, None),
+                       factor=2, threshold=10)
+        await detail.feed()
+        return sorted([detail.queue.get_nowait() for _ in range(2)])
+
+    assert asyncio.run(feed()) == ['/game/1/', '/game/2/']
+
+
+def test_join_appends_attributes():
+    """Записи дополняются атрибутами по пути адреса страницы."""
+
+    url = FIELD_NAMES.index('url')
+    records = [('a', 'https://www.vgchartz.com/game/1/'),
+               ('b', 'https://www.vgchartz.com/game/2/'),
+               ('c', None)]
+
+    joined = DetailManager.join(records,
+                                {'/game/1/': {'genre': 'Action'}},
+                                url=1)
+
+    assert url == len(FIELD_NAMES) - 1
+    assert joined == [('a', 'https://www.vgchartz.com/game/1/', 'Action'),
+                      ('b', 'https://www.vgchartz.com/game/2/', None),
+                      ('c', None, None)]
@@ -0,0 +1,133 @@
+import asyncio
+import csv
+
+import pytest
+
+from parser.managers.file import FileManager
+
+
+@pytest.fixture
+def file(data):
+    """
+    Формирует файловый менеджер с новым csv-файлом;
+
+    :param data: каталог данных;
+    :return: файловый менеджер.
+    """
+
+    manager = FileManager()
+    manager.setting('games.csv', 'w', 'games.json')
+
+    return manager
+
+
+def rows(manager: FileManager) -> list[list[str]]:
+    """
+    Читает строки файла с данными без заголовка;
+
+    :param manager: файловый менеджер;
+    :return: строки файла с данными.
+    """
+
+    with open(manager.sink.path, newline='', encoding='utf-8') as handle:
+        return [*csv.reader(handle)][1:]
+
+
+def test_checkpoint_covers_preceding_records(file, game):
+    """Контрольная точка записывается после данных, переданных до нее,
+    и не учитывает данные, переданные после нее."""
+
+    synced = []
+
+    async def scrape():
+        await file.write([game(1), game(2)])
+        file.save({'pages': [[1, 1]]}, lambda: synced.append(True))
+        await file.write([game(3)])
+        await file.flush()
+        await file.close()
+
+    asyncio.run(scrape())
+
+    checkpoint = FileManager.load('games.json')
+
+    assert synced == [True]
+    assert checkpoint['pages'] == [[1, 1]]
+    assert checkpoint['records'] == 2
+    assert len(rows(file)) == 3
+
+
+def test_checkpoint_is_a_snapshot(file, game):
+    """Изменения состояния после save не попадают в контрольную точку."""
+
+    async def scrape():
+        state = {'pages': [[1, 1]]}
+        await file.write([game(1)])
+        file.save(state)
+        state['pages'].append([3, 3])
+        await file.flush()
+        await file.close()
+
+    asyncio.run(scrape())
+
+    assert FileManager.load('games.json')['pages'] == [[1, 1]]
+
+
+def test_resume_truncates_to_checkpoint(file, game):
+    """При возобновлении данные после контрольной точки отбрасываются."""
+
+    async def scrape():
+        await file.write([game(1), game(2)])
+        file.save({})
+        await file.flush()
+        await file.write([game(3)])
+        await file.flush()
+        await file.close()
+
+    asyncio.run(scrape())
+
+    checkpoint = FileManager.load('games.json')
+
+    resumed = FileManager()
+    resumed.setting('games.csv', 'a', 'games.json',
+                    offset=checkpoint['offset'],
+                    records=checkpoint['records'])
+
+    assert resumed.records == 2
+    assert [row[0] for row in rows(resumed)] == ['Game 1', 'Game 2']
+
+
+def test_save_without_writer_is_immediate(file):
+    """Без потока записи контрольная точка записывается сразу, а удаление
+    отсутствующей контрольной точки не является ошибкой."""
+
+    file.save({'pages': []})
+
+    assert FileManager.load('games.json')['records'] == 0
+
+    file.delete()
+    file.delete()
+
+    with pytest.raises(FileNotFoundError):
+        FileManager.load('games.json')
+
+
+def test_export_joins_details(data, game):
+    """Выгрузка дополняет записи атрибутами видеоигр по путям страниц."""
+
+    store = FileManager()
+    store.setting('games.sqlite', 'w', None)
+    store.rebuild([game(1), game(2)])
+
+    details = {'/game/1/game/': {'genre': 'Action'}}
+    exported = store.export('games.csv', details)
+    store.sink.close()
+
+    target = FileManager()
+    target.setting('games.csv', 'a', None)
+
+    with open(target.sink.path, newline='', encoding='utf-8') as handle:
+        header, *records = csv.reader(handle)
+
+    assert exported == 2
+    assert header[-1] == 'genre'
+    assert [record[-1] for record in records] == ['Action', '']
@@ -0,0 +1,68 @@
+import asyncio
+
+from parser.managers.progress import Journal
+from parser.managers.progress import ProgressManager
+
+
+def test_journal_merges_adjacent_pages():
+    """Соседние страницы объединяются в отрезки в любом порядке."""
+
+    journal = Journal()
+
+    for page in [5, 1, 3, 2, 7, 6]:
+        journal.add(page)
+
+    assert journal.json() == [[1, 3], [5, 7]]
+
+    journal.add(4)
+    journal.add(4)
+
+    assert journal.json() == [[1, 7]]
+
+
+def test_journal_membership_and_count():
+    """Журнал определяет завершенные страницы и считает их в диапазоне."""
+
+    journal = Journal([[2, 4], [8, 9]])
+
+    assert 3 in journal
+    assert 5 not in journal
+    assert 1 not in journal
+    assert journal.count(1, 10) == 5
+    assert journal.count(4, 8) == 2
+    assert journal.missing(1, 10) == [1, 5, 6, 7, 10]
+
+
+def test_progress_resumes_from_journal():
+    """Незавершенными остаются только страницы вне журнала."""
+
+    progress = ProgressManager()
+    progress.setting([1, 6], pages=[[1, 2], [5, 5]])
+
+    assert progress.missing() == [3, 4, 6]
+    assert progress.finished == [3, 6]
+
+    asyncio.run(progress.next([3, 4]))
+
+    assert progress.missing() == [6]
+    assert progress.json() == {'pages': [[1, 5]]}
+
+
+def test_limit_shrinks_last_page():
+    """Досрочное прекращение уменьшает номер последней страницы."""
+
+    progress = ProgressManager()
+    progress.setting([1, 10], pages=[[1, 2]])
+    progress.limit(4)
+
+    assert progress.missing() == [3, 4]
+    assert progress.finished == [2, 4]
+
+
+def test_shard_progress_is_saved():
+    """Отрезок страниц шарда сохраняется в контрольной точке."""
+
+    progress = ProgressManager()
+    progress.setting([101, 200], pages=[[101, 150]], shard=True)
+
+    assert progress.json() == {'pages': [[101, 150]], 'shard': [101, 200]}
@@ -0,0 +1,86 @@
+import json
+import random
+
+import pytest
+
+from parser.managers.retry import RetryManager
+
+
+@pytest.fixture
+def retry():
+    """
+    Формирует настроенный менеджер повторных запросов;
+
+    :return: менеджер повторных запросов.
+    """
+
+    manager = RetryManager()
+    manager.setting(attempts=3, backoff=1, ceiling=5)
+
+    return manager
+
+
+def test_transient_codes_are_retried(retry):
+    """Коды 429, 5xx и ошибки соединения повторяются до исчерпания
+    попыток."""
+
+    for code in (0, 429, 503):
+        assert retry.retry(code, 1)
+        assert retry.retry(code, 2)
+        assert not retry.retry(code, 3)
+
+
+def test_permanent_codes_are_not_retried(retry):
+    """Отсутствующая страница не запрашивается повторно."""
+
+    assert not retry.retry(404, 1)
+    assert not retry.retry(410, 1)
+
+
+def test_delay_is_bounded(retry):
+    """Задержка не превышает backoff * 2 ^ (attempt - 1) и ceiling."""
+
+    random.seed(0)
+
+    for attempt, bound in [(1, 1), (2, 2), (3, 4), (4, 5), (10, 5)]:
+        delays = [retry.delay(attempt) for _ in range(200)]
+
+        assert all(0 <= value <= bound for value in delays)
+        assert max(delays) > bound / 2
+
+
+def test_bury_separates_dead_and_absent(retry):
+    """Недоставленные и отсутствующие страницы учитываются отдельно."""
+
+    retry.bury(3, 503)
+    retry.bury(4, 404)
+    retry.bury(5, 0)
+
+    assert retry.dead == {3: 503, 5: 0}
+    assert retry.absent == {4: 404}
+
+
+def test_revive_removes_page(retry):
+    """Полученная страница удаляется из обоих списков."""
+
+    retry.bury(3, 503)
+    retry.bury(4, 410)
+    retry.revive(3)
+    retry.revive(4)
+
+    assert retry.dead == {}
+    assert retry.absent == {}
+
+
+def test_pages_survive_checkpoint(retry):
+    """Номера страниц восстанавливаются из json как целые числа."""
+
+    retry.bury(7, 503)
+    retry.bury(8, 404)
+
+    settings = json.loads(json.dumps(retry.json()))
+    restored = RetryManager()
+    restored.setting(**settings)
+
+    assert restored.dead == {7: 503}
+    assert restored.absent == {8: 404}
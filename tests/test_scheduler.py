@@ -0,0 +1,111 @@
+import asyncio
+
+from parser.managers.scheduler import SchedulerManager
+
+
+def scheduler(pages: list[int],
+              workers: int = 3,
+              window: int | None = None) -> SchedulerManager:
+    """
+    Формирует менеджер планирования с очередью страниц;
+
+    :param pages: номера страниц;
+    :param workers: количество одновременно обрабатываемых страниц;
+    :param window: начальный размер окна;
+    :return: менеджер планирования.
+    """
+
+    manager = SchedulerManager()
+    manager.setting(workers)
+    manager.fill(pages, window)
+
+    return manager
+
+
+def test_take_returns_pages_in_order():
+    """Страницы выдаются по порядку, после очереди - None."""
+
+    async def take():
+        manager = scheduler([1, 2, 3])
+        pages = []
+
+        while (page := await manager.take()) is not None:
+            pages.append(page)
+            manager.done()
+
+        return pages
+
+    assert asyncio.run(take()) == [1, 2, 3]
+
+
+def test_size_is_bounded_by_queue():
+    """Обработчиков не больше, чем страниц, но не меньше одного."""
+
+    assert scheduler([1, 2], workers=5).size() == 2
+    assert scheduler(list(range(10)), workers=5).size() == 5
+    assert scheduler([], workers=5).size() == 1
+
+
+def test_stop_drops_following_pages():
+    """После досрочного прекращения следующие страницы не выдаются
+    и не записываются."""
+
+    async def stop():
+        manager = scheduler(list(range(1, 11)))
+        first, second = await manager.take(), await manager.take()
+
+        manager.stop(first)
+
+        return second, await manager.take(), manager
+
+    second, page, manager = asyncio.run(stop())
+
+    assert page is None
+    assert manager.accept(1)
+    assert not manager.accept(second)
+
+
+def test_window_grows_after_fresh_pages():
+    """Окно начинается с одной страницы и растет после свежих страниц."""
+
+    async def grow():
+        manager = scheduler(list(range(1, 11)), workers=3, window=1)
+
+        first = await manager.take()
+        blocked = asyncio.create_task(manager.take())
+        await asyncio.sleep(0)
+        waiting = not blocked.done()
+
+        manager.done(grow=True)
+
+        second = await blocked
+        third = await asyncio.wait_for(manager.take(), 1)
+
+        return waiting, [first, second, third], manager.permits
+
+    waiting, pages, permits = asyncio.run(grow())
+
+    assert waiting
+    assert pages == [1, 2, 3]
+    assert permits == 2
+
+
+def test_window_is_capped_by_workers():
+    """Окно не превышает количество одновременно обрабатываемых страниц."""
+
+    async def grow():
+        manager = scheduler(list(range(1, 11)), workers=2, window=1)
+
+        for _ in range(5):
+            await manager.take()
+            manager.done(grow=True)
+
+        return manager.permits
+
+    assert asyncio.run(grow()) == 2
+
+
+def test_window_defaults_to_workers():
+    """Без начального размера окно сразу равно workers."""
+
+    assert scheduler([1, 2, 3], workers=4).permits == 4
@@ -0,0 +1,117 @@
+import pytest
+
+from parser.managers.shard import ShardManager
+
+
+@pytest.fixture
+def shards(data):
+    """
+    Возвращает функцию, открывающую очередь шардов от имени сборщика.
+    Открытые очереди закрываются после теста;
+
+    :param data: каталог данных;
+    :return: функция, открывающая очередь шардов: идентификатор сборщика
+        и время аренды.
+    """
+
+    managers = []
+
+    def open_queue(owner: str, lease: int = 60) -> ShardManager:
+        manager = ShardManager()
+        manager.owner = owner
+        manager.setting('games.csv', lease)
+        managers.append(manager)
+        return manager
+
+    yield open_queue
+
+    for manager in managers:
+        manager.close()
+
+
+def test_create_splits_pages(shards):
+    """Страницы разбиваются на шарды, очередь создается один раз."""
+
+    queue = shards('a')
+
+    assert queue.create(250, 100) == 3
+    assert queue.create(500, 100) == 3
+    assert queue.claim() == [1, 1, 100]
+    assert queue.claim() == [2, 101, 200]
+    assert queue.claim() == [3, 201, 250]
+    assert queue.claim() is None
+
+
+def test_shard_is_leased_to_one_owner(shards):
+    """Арендованный шард не выдается другому сборщику."""
+
+    first, second = shards('a'), shards('b')
+    first.create(200, 100)
+
+    assert first.claim()[0] == 1
+    assert second.claim()[0] == 2
+    assert first.status() == {'done': 0, 'active': 2, 'waiting': 0}
+
+
+def test_expired_lease_is_reclaimed(shards):
+    """Шард с истекшей арендой выдается другому сборщику, а прежний
+    сборщик теряет аренду."""
+
+    first, second = shards('a', lease=-1), shards('b')
+    first.create(100, 100)
+
+    assert first.claim()[0] == 1
+    assert second.claim()[0] == 1
+    assert not first.renew()
+    assert second.renew()
+
+
+def test_defer_keeps_shard_unfinished(shards):
+    """Отложенный шард остается незавершенным и арендованным."""
+
+    first, second = shards('a'), shards('b')
+    first.create(100, 100)
+    first.claim()
+    first.defer()
+
+    assert first.shard is None
+    assert second.claim() is None
+    assert first.status() == {'done': 0, 'active': 1, 'waiting': 0}
+
+
+def test_release_returns_shard(shards):
+    """Возвращенный шард сразу выдается другому сборщику."""
+
+    first, second = shards('a'), shards('b')
+    first.create(100, 100)
+    first.claim()
+    first.release()
+
+    assert second.claim()[0] == 1
+
+
+def test_complete_records_boundary(shards):
+    """Отметка объединенного файла - последняя дата обновления шардов
+    и ключи данных, обновленных в этот день."""
+
+    queue = shards('a')
+    queue.create(300, 100)
+
+    for latest, keys in [('2024-01-02', {'a'}),
+                         ('2024-01-03', {'b'}),
+                         ('2024-01-03', {'c'})]:
+        queue.claim()
+        queue.complete(latest, keys)
+
+    assert queue.latest() == '2024-01-03'
+    assert queue.keys() == {'b', 'c'}
+    assert queue.status() == {'done': 3, 'active': 0, 'waiting': 0}
+
+
+def test_names(shards):
+    """Имена файлов шарда формируются по номеру шарда."""
+
+    queue = shards('a')
+
+    assert queue.name(7) == r'shards\games.00007.csv'
+    assert queue.checkpoint(7) == 'games.00007.json'
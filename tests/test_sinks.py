@@ -0,0 +1,133 @@
+import pyarrow.parquet as pq
+import pytest
+
+from config.parser.managers.file import FIELD_NAMES
+from parser.sinks.columnar import ParquetSink
+from parser.sinks.database import SqliteSink
+from parser.sinks.sink import Sink
+from parser.sinks.text import CsvSink
+
+
+@pytest.fixture(params=[CsvSink, ParquetSink, SqliteSink])
+def sink(request, tmp_path):
+    """
+    Формирует пустое хранилище каждого формата; хранилище закрывается
+    после теста;
+
+    :param request: параметр фикстуры (класс хранилища);
+    :param tmp_path: временный каталог теста;
+    :return: хранилище.
+    """
+
+    extension = {CsvSink: 'csv', ParquetSink: 'parquet', SqliteSink: 'sqlite'}
+    store = request.param(str(tmp_path / f'games.{extension[request.param]}'))
+    store.create()
+    store.open()
+
+    yield store
+
+    store.close()
+
+
+def test_round_trip(sink, game):
+    """Записанные данные сохраняются и подсчитываются."""
+
+    sink.write([game(index) for index in range(3)])
+    sink.sync()
+    sink.write([game(index) for index in range(3, 5)])
+    sink.sync()
+    sink.close()
+    sink.compact()
+
+    assert sink.count() == 5
+    assert sink.size() > 0
+
+
+def test_truncate_to_checkpoint(sink, game):
+    """После контрольной точки данные отбрасываются (csv, parquet)
+    или учитываются (sqlite)."""
+
+    sink.write([game(index) for index in range(3)])
+    sink.sync()
+    offset = sink.offset()
+    sink.write([game(index) for index in range(3, 5)])
+    sink.sync()
+    sink.close()
+
+    after = sink.truncate(offset)
+    sink.compact()
+
+    if isinstance(sink, SqliteSink):
+        assert (sink.count(), after) == (5, 2)
+    else:
+        assert (sink.count(), after) == (3, 0)
+
+
+def test_csv_merge_keeps_one_header(tmp_path, game):
+    """При объединении csv-файлов заголовок сохраняется один раз."""
+
+    paths = []
+
+    for number in range(2):
+        part = CsvSink(str(tmp_path / f'part{number}.csv'))
+        part.create()
+        part.open()
+        part.write([game(number)])
+        part.close()
+        paths.append(part.path)
+
+    merged = CsvSink(str(tmp_path / 'games.csv'))
+    merged.merge(paths)
+
+    assert merged.count() == 2
+
+
+def test_sqlite_updates_known_games(tmp_path, game):
+    """Повторно собранная видеоигра обновляет запись, а не дублирует ее."""
+
+    store = SqliteSink(str(tmp_path / 'games.sqlite'))
+    store.create()
+
+    store.write([game(1), game(2)])
+    assert store.added([]) == 2
+
+    store.write([game(1, total=99.0), game(3)])
+    assert store.added([]) == 1
+
+    records = [record for batch in store.read() for record in batch]
+    store.close()
+
+    assert len(records) == 3
+    assert records[0][FIELD_NAMES.index('total')] == 99.0
+
+
+def test_extra_fields(tmp_path, game):
+    """Хранилища выгрузки принимают дополнительные поля."""
+
+    fields = [*FIELD_NAMES, 'genre']
+
+    text = CsvSink(str(tmp_path / 'games.csv'), fields)
+    text.create()
+
+    columnar = ParquetSink(str(tmp_path / 'games.parquet'), fields)
+    columnar.create()
+    columnar.open()
+    columnar.write([(*game(1), 'Action')])
+    columnar.sync()
+    columnar.compact()
+
+    with open(text.path, encoding='utf-8') as file:
+        assert file.readline().strip().split(',') == fields
+
+    table = pq.read_table(columnar.path)
+    assert table.column('genre').to_pylist() == ['Action']
+
+
+def test_sink_requires_all_methods(tmp_path):
+    """Хранилище без обязательных методов не создается."""
+
+    class Incomplete(Sink):
+        """Хранилище без методов."""
+
+    with pytest.raises(TypeError):
+        Incomplete(str(tmp_path / 'games.txt'))
@@ -0,0 +1,127 @@
+from parser.managers.watermark import WatermarkManager
+
+
+def incremental(watermark: str | None = '2024-01-02',
+                keys: list[str] | None = None) -> WatermarkManager:
+    """
+    Формирует менеджер отметки в режиме инкрементального сбора данных;
+
+    :param watermark: отметка предыдущего запуска;
+    :param keys: ключи данных, обновленных в день отметки;
+    :return: менеджер отметки.
+    """
+
+    manager = WatermarkManager()
+    manager.setting('incremental', watermark, keys=keys)
+
+    return manager
+
+
+def test_full_crawl_selects_everything(game):
+    """В режиме полного сбора данных отбираются все видеоигры."""
+
+    manager = WatermarkManager()
+    manager.setting('full', '2024-01-02')
+
+    games = [game(1, '2024-01-01'), game(2, None)]
+
+    assert manager.select(games) == (games, False)
+
+
+def test_boundary_rows_are_deduplicated(game):
+    """В день отметки отбираются только видеоигры, которые предыдущий
+    запуск не собирал."""
+
+    known, new = game(1, '2024-01-02'), game(2, '2024-01-02')
+    manager = incremental(keys=[WatermarkManager.key(known)])
+
+    newer, older = game(3, '2024-01-03'), game(4, '2024-01-01')
+    selected, stale = manager.select([newer, known, new, older])
+
+    assert selected == [newer, new]
+    assert stale
+
+
+def test_unknown_update_is_fresh(game):
+    """Видеоигра без даты обновления считается обновленной."""
+
+    manager = incremental()
+
+    assert manager.fresh(game(1, None))
+
+
+def test_key_falls_back_to_name_and_platform(game):
+    """Без адреса страницы ключом являются название и платформа."""
+
+    assert WatermarkManager.key(game(1, url=None)) == 'Game 1|PS4'
+
+
+def test_select_tracks_latest_date_keys(game):
+    """Ключи собираются только для последней даты обновления."""
+
+    manager = incremental(watermark=None)
+
+    manager.select([game(1, '2024-01-01'), game(2, '2024-01-01')])
+    assert manager.latest == '2024-01-01'
+    assert len(manager.seen) == 2
+
+    manager.select([game(3, '2024-01-05'), game(4, '2024-01-03')])
+    assert manager.latest == '2024-01-05'
+    assert manager.seen == {WatermarkManager.key(game(3))}
+
+
+def test_boundary_keeps_or_advances_watermark(game):
+    """Отметка не отступает назад, а ключи дня отметки объединяются."""
+
+    manager = incremental(keys=['a'])
+    assert manager.boundary() == ('2024-01-02', {'a'})
+
+    manager.setting('incremental', '2024-01-02', '2024-01-01', ['a'], ['b'])
+    assert manager.boundary() == ('2024-01-02', {'a'})
+
+    manager.setting('incremental', '2024-01-02', '2024-01-02', ['a'], ['b'])
+    assert manager.boundary() == ('2024-01-02', {'a', 'b'})
+
+    manager.setting('incremental', '2024-01-02', '2024-01-03', ['a'], ['c'])
+    assert manager.boundary() == ('2024-01-03', {'c'})
+
+
+def test_second_cycle_appends_nothing(data, game):
+    """Повторный цикл по неизменному каталогу не дописывает данные."""
+
+    page = [game(1, '2024-01-02'), game(2, '2024-01-02'), game(3)]
+
+    first = incremental(**WatermarkManager().load('games.csv'))
+    selected, _ = first.select(page)
+    first.save('games.csv')
+
+    second = incremental(**first.load('games.csv'))
+    repeated, stale = second.select(page)
+
+    assert selected == page
+    assert repeated == []
+    assert stale
+
+
+def test_missing_watermark_loads_as_none(data):
+    """Без сохраненной отметки сбор данных полный."""
+
+    loaded = WatermarkManager().load('games.csv')
+    manager = incremental(**loaded)
+
+    assert loaded == {'watermark': None, 'keys': None}
+    assert not manager.incremental()
+
+
+def test_checkpoint_round_trip():
+    """Ключи восстанавливаются из контрольной точки."""
+
+    manager = incremental(keys=['b', 'a'])
+    manager.seen = {'c'}
+
+    settings = manager.json()
+    restored = WatermarkManager()
+    restored.setting(**settings)
+
+    assert settings['keys'] == ['a', 'b']
+    assert restored.json() == settings